@@ -0,0 +1 @@
+"""Offline benchmarks of the Pollens integration."""
@@ -0,0 +1,491 @@
+"""Run the offline benchmarks of the Pollens integration.
+
+    python -m benchmarks.run [--counties N] [--latency S] [--failure-rate R]
+                             [--rate R] [--burst N] [--concurrency N]
+                             [--replay FILE] [--speed X]
+                             [--payloads DIR] [--output FILE]
+
+Every request goes to a local stand-in of pollens.fr (see server.py). The
+results are written as JSON, to compare them between releases.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import replace
+from datetime import timedelta
+import json
+import logging
+from pathlib import Path
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from homeassistant.config_entries import ConfigEntries, ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.entity import DATA_ENTITY_SOURCE
+from homeassistant.helpers.entity_platform import EntityPlatform
+
+from custom_components.pollens import PollensUpdateCoordinator, pollensasync, sensor
+from custom_components.pollens.const import (
+    CONF_COUNTRYCODE,
+    CONF_LITERAL,
+    CONF_POLLENSLIST,
+    CONF_VERSION,
+    COORDINATOR,
+    DOMAIN,
+    KEY_TO_ATTR,
+    MAX_CONCURRENT_REQUESTS,
+)
+from custom_components.pollens.pollensasync import (
+    HttpProvider,
+    PollensClient,
+    PollensProvider,
+    PollensSnapshot,
+    RateLimiter,
+    parse_bulletin,
+)
+from custom_components.pollens.providers import ReplayProvider
+
+from .server import StandInServer, load_payloads
+
+pollensasync_json_loads = pollensasync.json_loads
+
+MANIFEST = Path(__file__).parents[1] / "custom_components/pollens/manifest.json"
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class LoopLagMonitor:
+    """Measure how long the event loop is blocked.
+
+    A task sleeps for ``interval`` in a loop; any extra delay before it wakes
+    up is time during which the loop could not run it.
+    """
+
+    def __init__(self, interval: float = 0.001) -> None:
+        self._interval = interval
+        self._task: asyncio.Task | None = None
+        self._start = 0.0
+        self.max_lag = 0.0
+        self.total_lag = 0.0
+
+    def _record(self) -> None:
+        lag = max(asyncio.get_running_loop().time() - self._start - self._interval, 0)
+        self.max_lag = max(self.max_lag, lag)
+        self.total_lag += lag
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            self._start = loop.time()
+            await asyncio.sleep(self._interval)
+            self._record()
+
+    def __enter__(self) -> LoopLagMonitor:
+        self._start = asyncio.get_running_loop().time()
+        self._task = asyncio.ensure_future(self._run())
+        return self
+
+    def __exit__(self, *args) -> None:
+        # The measured code may end in the iteration which blocked the loop,
+        # before the sleep in progress wakes up
+        self._record()
+        self._task.cancel()
+
+    def report(self) -> dict[str, float]:
+        return {
+            "loop_max_lag_ms": round(self.max_lag * 1000, 3),
+            "loop_total_lag_ms": round(self.total_lag * 1000, 3),
+        }
+
+
+@asynccontextmanager
+async def stand_in(args: argparse.Namespace):
+    """Start the stand-in server and point the client at it."""
+    payloads = load_payloads(args.payloads, seed=args.seed)
+    counties = list(payloads)[: args.counties]
+    server = StandInServer(
+        {county: payloads[county] for county in counties},
+        latency=args.latency,
+        failure_rate=args.failure_rate,
+        seed=args.seed,
+    )
+    base_url = pollensasync.BASE_URL
+    pollensasync.BASE_URL = await server.start()
+    try:
+        yield server, counties, payloads
+    finally:
+        pollensasync.BASE_URL = base_url
+        await server.stop()
+
+
+async def bench_client(
+    provider: PollensProvider, counties: list[str], limiter: RateLimiter
+) -> dict[str, float]:
+    """Fetch every county twice with PollensClient: cold, then revalidated (304)."""
+    client = PollensClient(freshness=0, limiter=limiter, provider=provider)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    async def _get(county: str):
+        async with semaphore:
+            return await client.Get(county)
+
+    results = {}
+    for run in ("cold", "revalidated"):
+        with LoopLagMonitor() as monitor:
+            start = time.perf_counter()
+            snapshots = await asyncio.gather(*(_get(county) for county in counties))
+            elapsed = time.perf_counter() - start
+        results[run] = {
+            "seconds": round(elapsed, 4),
+            "counties_per_second": round(len(counties) / elapsed, 1),
+            "failed": sum(snapshot is None for snapshot in snapshots),
+            **monitor.report(),
+        }
+    results["counters"] = dict(client.counters)
+    results["rate_limiter"] = dict(limiter.stats)
+    results["connection_pool"] = client.pool_stats()
+    return results
+
+
+def bench_snapshot_memory(payloads: dict[str, dict], counties: list[str]) -> dict:
+    """Measure the memory kept by the snapshots of the counties."""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    snapshots = [PollensSnapshot.from_json(c, payloads[c]) for c in counties]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del snapshots
+    return {"snapshot_bytes_per_county": round(size / len(counties))}
+
+
+def _parse_all(bodies: list[tuple[str, bytes]]) -> None:
+    for county, body in bodies:
+        parse_bulletin(county, body)
+
+
+async def bench_parse(payloads: dict[str, dict], counties: list[str]) -> dict:
+    """Loop time spent parsing the payloads of many counties received together.
+
+    The payloads of every county are repeated 20 times, like the refresh of
+    a large batch, and parsed on the loop or in an executor (one job per
+    payload); "large" pads one payload per county to PARSE_EXECUTOR_MIN_BYTES.
+    """
+    loop = asyncio.get_running_loop()
+    results = {"decoder": pollensasync.json_loads.__module__}
+
+    async def _inline(county: str, body: bytes):
+        return parse_bulletin(county, body)
+
+    async def _executor(county: str, body: bytes):
+        return await loop.run_in_executor(None, parse_bulletin, county, body)
+
+    padding = " " * pollensasync.PARSE_EXECUTOR_MIN_BYTES
+    for size, pad, copies in (("typical", "", 20), ("large", padding, 1)):
+        bodies = [
+            (county, (json.dumps(payloads[county]) + pad).encode())
+            for county in counties
+            for _ in range(copies)
+        ]
+        results[size] = {"bodies": len(bodies)}
+        # Parsing alone, without the scheduling of the tasks
+        for decoder in ("json", "decoder"):
+            if decoder == "json":
+                pollensasync.json_loads = json.loads
+            start = time.perf_counter()
+            _parse_all(bodies)
+            elapsed = time.perf_counter() - start
+            pollensasync.json_loads = pollensasync_json_loads
+            results[size][f"{decoder}_microseconds_per_payload"] = round(
+                elapsed / len(bodies) * 1e6, 2
+            )
+        for run, parse in (("inline", _inline), ("executor", _executor)):
+            with LoopLagMonitor() as monitor:
+                await asyncio.sleep(0.01)
+                start = time.perf_counter()
+                await asyncio.gather(*(parse(county, body) for county, body in bodies))
+                elapsed = time.perf_counter() - start
+            results[size][run] = {"seconds": round(elapsed, 4), **monitor.report()}
+        for lag in ("max", "total"):
+            results[size][f"executor_{lag}_lag_saved_ms"] = round(
+                results[size]["inline"][f"loop_{lag}_lag_ms"]
+                - results[size]["executor"][f"loop_{lag}_lag_ms"],
+                3,
+            )
+    return results
+
+
+def bench_state_attributes(
+    coordinator: PollensUpdateCoordinator, entities: list
+) -> dict[str, float]:
+    """Cost of the attributes read by the state write of every entity.
+
+    The snapshots are replaced before each round, like by an update: the
+    first read of each entity builds the attributes, the next ones (state
+    writes without a new snapshot) reuse them. The memory is what the first
+    reads of a round keep allocated, per entity.
+    """
+    rounds = 5
+    first = following = 0.0
+    for _ in range(rounds):
+        coordinator.data = {
+            county: replace(snapshot) for county, snapshot in coordinator.data.items()
+        }
+        start = time.perf_counter()
+        for entity in entities:
+            entity.extra_state_attributes  # pylint: disable=pointless-statement
+        first += time.perf_counter() - start
+        start = time.perf_counter()
+        for entity in entities:
+            entity.extra_state_attributes  # pylint: disable=pointless-statement
+        following += time.perf_counter() - start
+
+    coordinator.data = {
+        county: replace(snapshot) for county, snapshot in coordinator.data.items()
+    }
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    kept = [entity.extra_state_attributes for entity in entities]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del kept
+    return {
+        "attributes_first_microseconds_per_entity": round(
+            first / (rounds * len(entities)) * 1e6, 2
+        ),
+        "attributes_next_microseconds_per_entity": round(
+            following / (rounds * len(entities)) * 1e6, 2
+        ),
+        "attributes_bytes_per_entity": round(size / len(entities)),
+    }
+
+
+async def async_create_hass(config_dir: str) -> HomeAssistant:
+    """Create a bare hass instance with the registries used by entities."""
+    hass = HomeAssistant(config_dir)
+    hass.config_entries = ConfigEntries(hass, {})
+    hass.data[DATA_ENTITY_SOURCE] = {}
+    await dr.async_load(hass)
+    await er.async_load(hass)
+    return hass
+
+
+async def _async_setup_entities(
+    hass: HomeAssistant, entries: list[ConfigEntry]
+) -> tuple[list[EntityPlatform], list]:
+    """Run sensor.async_setup_entry and add the entities to a platform."""
+    platforms = []
+    entities = []
+    for entry in entries:
+        entry_entities = []
+        await sensor.async_setup_entry(hass, entry, entry_entities.extend)
+        entity_platform = EntityPlatform(
+            hass=hass,
+            logger=_LOGGER,
+            domain="sensor",
+            platform_name=DOMAIN,
+            platform=None,
+            scan_interval=timedelta(seconds=30),
+            entity_namespace=None,
+        )
+        entity_platform.config_entry = entry
+        await entity_platform.async_add_entities(entry_entities)
+        platforms.append(entity_platform)
+        # Entities disabled by default are not added
+        entities.extend(entity for entity in entry_entities if entity.hass)
+    return platforms, entities
+
+
+async def bench_integration(
+    provider: PollensProvider,
+    counties: list[str],
+    limiter: RateLimiter,
+    results: dict,
+) -> None:
+    """Drive PollensUpdateCoordinator and sensor.async_setup_entry."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = await async_create_hass(config_dir)
+        coordinator = PollensUpdateCoordinator(
+            hass, PollensClient(freshness=0, limiter=limiter, provider=provider)
+        )
+        hass.data[DOMAIN] = {}
+        entries = []
+        for county in counties:
+            entry = ConfigEntry(
+                CONF_VERSION,
+                DOMAIN,
+                f"Pollens {county}",
+                {
+                    CONF_COUNTRYCODE: county,
+                    CONF_LITERAL: True,
+                    CONF_POLLENSLIST: list(KEY_TO_ATTR),
+                },
+                "user",
+            )
+            hass.config_entries._entries[entry.entry_id] = entry  # pylint: disable=protected-access
+            hass.data[DOMAIN][entry.entry_id] = {COORDINATOR: coordinator}
+            coordinator.async_add_county(entry.entry_id, county, 3)
+            entries.append(entry)
+
+        # Setup: first fetch of every county
+        with LoopLagMonitor() as monitor:
+            start = time.perf_counter()
+            setups = await asyncio.gather(
+                *(coordinator.async_ensure_county(c) for c in counties),
+                return_exceptions=True,
+            )
+            elapsed = time.perf_counter() - start
+        # Counties which could not be set up are left out of the next steps
+        entries = [e for e, error in zip(entries, setups) if error is None]
+        results["coordinator_setup"] = {
+            "seconds": round(elapsed, 4),
+            "failed": len(counties) - len(entries),
+            **monitor.report(),
+        }
+
+        # Entities: the first half of the entries is timed, the memory is
+        # measured on the other half (tracemalloc slows everything down)
+        half = max(len(entries) // 2, 1)
+        with LoopLagMonitor() as monitor:
+            start = time.perf_counter()
+            platforms, entities = await _async_setup_entities(hass, entries[:half])
+            elapsed = time.perf_counter() - start
+        results["sensor_setup"] = {
+            "seconds": round(elapsed, 4),
+            "seconds_per_entry": round(elapsed / half, 5),
+            "entities_per_entry": round(len(entities) / half, 1),
+            **monitor.report(),
+        }
+        if entries[half:]:
+            tracemalloc.start()
+            before = tracemalloc.take_snapshot()
+            more_platforms, more_entities = await _async_setup_entities(
+                hass, entries[half:]
+            )
+            after = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+            size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+            results["memory"]["entities_bytes_per_county"] = round(
+                size / len(entries[half:])
+            )
+            platforms += more_platforms
+            entities += more_entities
+
+        # State writes
+        rounds = 5
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for entity in entities:
+                entity.async_write_ha_state()
+        elapsed = time.perf_counter() - start
+        results["state_write"] = {
+            "microseconds_per_entity": round(
+                elapsed / (rounds * len(entities)) * 1e6, 2
+            ),
+            **bench_state_attributes(coordinator, entities),
+        }
+
+        # Refresh of every county
+        counters = dict(coordinator.update_counters)
+        coordinator._next_poll.clear()  # pylint: disable=protected-access
+        with LoopLagMonitor() as monitor:
+            start = time.perf_counter()
+            await coordinator.async_refresh()
+            elapsed = time.perf_counter() - start
+        results["coordinator_refresh"] = {
+            "seconds": round(elapsed, 4),
+            "counties_per_second": round(len(counties) / elapsed, 1),
+            "success": coordinator.last_update_success,
+            "entities_notified": coordinator.update_counters["notified"]
+            - counters["notified"],
+            "entities_skipped": coordinator.update_counters["skipped"]
+            - counters["skipped"],
+            **monitor.report(),
+        }
+
+        for entity_platform in platforms:
+            await entity_platform.async_reset()
+        for entry in entries:
+            await coordinator.async_remove_county(entry.entry_id)
+        await hass.async_stop(force=True)
+
+
+async def async_main(args: argparse.Namespace) -> dict:
+    def limiter() -> RateLimiter:
+        return RateLimiter(args.rate, args.burst, args.concurrency)
+
+    async with stand_in(args) as (server, counties, payloads):
+        async with pollensasync.create_session() as session:
+
+            def provider() -> PollensProvider:
+                # A new replay for each benchmark, from the start of the recording
+                if args.replay:
+                    return ReplayProvider(args.replay, args.speed)
+                return HttpProvider(session)
+
+            if args.replay:
+                counties = provider().counties[: args.counties]
+            results = {
+                "client": await bench_client(provider(), counties, limiter()),
+                "memory": bench_snapshot_memory(payloads, counties),
+                "parse": await bench_parse(payloads, counties),
+            }
+            await bench_integration(provider(), counties, limiter(), results)
+        results["server"] = dict(server.counters)
+    return {
+        "version": json.loads(MANIFEST.read_text())["version"],
+        "python": platform.python_version(),
+        "parameters": {
+            "counties": len(counties),
+            "latency": args.latency,
+            "failure_rate": args.failure_rate,
+            "rate": args.rate,
+            "burst": args.burst,
+            "concurrency": args.concurrency,
+            "payloads": args.payloads,
+            "replay": args.replay,
+            "speed": args.speed,
+        },
+        "results": results,
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--counties", type=int, default=101)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--rate", type=float, help="requests per second, default: no rate limit"
+    )
+    parser.add_argument("--burst", type=int, default=pollensasync.DEFAULT_BURST)
+    parser.add_argument(
+        "--concurrency", type=int, default=pollensasync.DEFAULT_CONCURRENCY
+    )
+    parser.add_argument("--payloads", help="directory of recorded <county>.json")
+    parser.add_argument(
+        "--replay", metavar="FILE", help="recording to serve instead of the stand-in"
+    )
+    parser.add_argument(
+        "--speed", type=float, default=0.0, help="replay speed, 0: no delays"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="JSON file, default: stdout")
+    args = parser.parse_args(argv)
+
+    report = json.dumps(asyncio.run(async_main(args)), indent=2)
+    if args.output:
+        Path(args.output).write_text(report + "\n")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+"""Local stand-in of pollens.fr serving recorded county bulletins."""
+from __future__ import annotations
+
+import asyncio
+from email.utils import formatdate, parsedate_to_datetime
+import hashlib
+import json
+from pathlib import Path
+import random
+
+from aiohttp import web
+
+from custom_components.pollens.const import KEY_TO_ATTR
+from custom_components.pollens.dept import DEPARTMENTS
+
+COUNTY_PATH = "/risks/thea/counties/{county}"
+
+
+def synthetic_payload(county: str, name: str, rng: random.Random) -> dict:
+    """Return a bulletin shaped like a pollens.fr response."""
+    risks = [
+        {"pollenName": pollen.capitalize(), "level": rng.randint(0, 3)}
+        for pollen in KEY_TO_ATTR
+    ]
+    return {
+        "countyNumber": county,
+        "countyName": name,
+        "riskLevel": max(risk["level"] for risk in risks),
+        "risks": risks,
+    }
+
+
+def load_payloads(directory: str | None = None, seed: int = 0) -> dict[str, dict]:
+    """Return the bulletin of every county of dept.DEPARTMENTS.
+
+    Recorded responses are read from <directory>/<county>.json when present,
+    the other counties get a synthetic bulletin.
+    """
+    rng = random.Random(seed)
+    payloads = {}
+    for county, name in DEPARTMENTS.items():
+        recorded = Path(directory, f"{county}.json") if directory else None
+        if recorded is not None and recorded.exists():
+            payloads[county] = json.loads(recorded.read_text(encoding="utf-8"))
+        else:
+            payloads[county] = synthetic_payload(county, name, rng)
+    return payloads
+
+
+class StandInServer:
+    """aiohttp server answering /risks/thea/counties/{n} like pollens.fr.
+
+    latency: seconds added to every response.
+    failure_rate: share of requests answered with a 503.
+    Responses carry an ETag and a Last-Modified date (the start of the
+    server), If-None-Match, or If-Modified-Since without it, is answered
+    with a 304.
+    """
+
+    def __init__(
+        self,
+        payloads: dict[str, dict],
+        latency: float = 0.0,
+        failure_rate: float = 0.0,
+        seed: int = 0,
+    ) -> None:
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.counters = {"requests": 0, "not_modified": 0, "failures": 0}
+        self._rng = random.Random(seed)
+        self.last_modified = formatdate(usegmt=True)
+        self._bodies = {}
+        for county, payload in payloads.items():
+            body = json.dumps(payload).encode()
+            self._bodies[county] = (body, f'"{hashlib.sha1(body).hexdigest()}"')
+        self._runner: web.AppRunner | None = None
+
+    @property
+    def counties(self) -> list[str]:
+        return list(self._bodies)
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start the server, return the URL template of a county."""
+        app = web.Application()
+        app.router.add_get(COUNTY_PATH, self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]  # pylint: disable=protected-access
+        return f"http://{host}:{port}/risks/thea/counties/{{}}"
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        self.counters["requests"] += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self._rng.random() < self.failure_rate:
+            self.counters["failures"] += 1
+            return web.Response(status=503)
+        county = request.match_info["county"]
+        if county not in self._bodies:
+            return web.Response(status=404)
+        body, etag = self._bodies[county]
+        headers = {"ETag": etag, "Last-Modified": self.last_modified}
+        if "If-None-Match" in request.headers:
+            not_modified = request.headers["If-None-Match"] == etag
+        else:
+            not_modified = "If-Modified-Since" in request.headers and parsedate_to_datetime(
+                request.headers["If-Modified-Since"]
+            ) >= parsedate_to_datetime(self.last_modified)
+        if not_modified:
+            self.counters["not_modified"] += 1
+            return web.Response(status=304, headers=headers)
+        return web.Response(body=body, content_type="application/json", headers=headers)
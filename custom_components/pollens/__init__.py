@@ -1,40 +1,104 @@
 """Pollens Allergy component."""
 from __future__ import annotations
-from datetime import timedelta
+import asyncio
+from collections import Counter, deque
+from dataclasses import replace
+from datetime import datetime, timedelta
 import logging
 from os import error
 from re import I
-from typing import Any
+import time
+from typing import TYPE_CHECKING, Any
 
 from aiohttp.client_exceptions import ClientError
+import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_SCAN_INTERVAL, CONF_SENSORS, Platform
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers import aiohttp_client
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    ATTR_LATITUDE,
+    ATTR_LONGITUDE,
+    CONF_SCAN_INTERVAL,
+    CONF_SENSORS,
+    EVENT_HOMEASSISTANT_CLOSE,
+    Platform,
+)
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ConfigEntryNotReady, HomeAssistantError
+from homeassistant.helpers import (
+    aiohttp_client,
+    config_validation as cv,
+    entity_registry as er,
+)
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.device_registry import DeviceEntryType
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.start import async_at_started
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     CoordinatorEntity,
     UpdateFailed,
 )
+from homeassistant.util import dt as dt_util
 
 from .const import (
+    AGGREGATES,
+    ATTR_COUNTY_NAME,
+    ATTR_POLLEN_NAME,
+    ATTR_URL,
     ATTRIBUTION,
     CONF_LITERAL,
     CONF_POLLENSLIST,
     CONF_VERSION,
+    CLIENT,
     DOMAIN,
     COORDINATOR,
     UNDO_LISTENER,
     CONF_COUNTRYCODE,
+    CONF_MAX_AGE,
     CONF_SCAN_INTERVAL,
+    CONF_SELECTED_ONLY,
+    CONF_THRESHOLD,
+    DEFAULT_MAX_AGE,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_THRESHOLD,
+    DIAGNOSTICS,
+    EVENT_THRESHOLD_CROSSED,
+    FETCH_HISTORY_SIZE,
+    HANDOFF,
+    HANDOFF_TTL,
+    HUB,
     KEY_TO_ATTR,
+    MAX_CONCURRENT_REQUESTS,
+    MIN_UPDATE_INTERVAL,
+    OPTIONS,
+    RISK_LEVEL,
+    SERVICE_FIND_DEPARTMENT,
+    SIGNAL_POLLENS_CHANGED,
+    STORAGE_KEY_PUBLICATIONS,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
 )
 
-from .pollensasync import PollensClient
+from .cache import PollensResponseCache
+from .dept import DEPARTMENTS
+from .geo import find_department
+from .history import PollensHistory
+from .pollensasync import PollensClient, PollensSnapshot, trace_config
+from .scheduler import REVALIDATE_INTERVAL, PollingScheduler
+
+if TYPE_CHECKING:
+    from .stats import PollensStatistics
 
 # List of platforms to support. There should be a matching .py file for each,
 # eg <cover.py> and <sensor.py>
@@ -43,8 +107,47 @@ PLATFORMS: list[str] = [Platform.SENSOR]
 _LOGGER = logging.getLogger(__name__)
 
 
+FIND_DEPARTMENT_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTITY_ID): cv.entity_id,
+        vol.Inclusive(ATTR_LATITUDE, "coordinates"): cv.latitude,
+        vol.Inclusive(ATTR_LONGITUDE, "coordinates"): cv.longitude,
+    }
+)
+
+
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up pollens integation"""
+
+    @callback
+    def _async_find_department(call: ServiceCall) -> ServiceResponse:
+        """Return the department of an entity (zone, person, tracker), of
+        coordinates or of the home location."""
+        if entity_id := call.data.get(ATTR_ENTITY_ID):
+            state = hass.states.get(entity_id)
+            if state is None or ATTR_LATITUDE not in state.attributes:
+                raise HomeAssistantError(f"{entity_id} has no location")
+            latitude = state.attributes[ATTR_LATITUDE]
+            longitude = state.attributes[ATTR_LONGITUDE]
+        else:
+            latitude = call.data.get(ATTR_LATITUDE, hass.config.latitude)
+            longitude = call.data.get(ATTR_LONGITUDE, hass.config.longitude)
+        if (found := find_department(latitude, longitude)) is None:
+            return {"county": None}
+        county, distance = found
+        return {
+            "county": county,
+            "county_name": DEPARTMENTS[county],
+            "distance_km": distance,
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_FIND_DEPARTMENT,
+        _async_find_department,
+        schema=FIND_DEPARTMENT_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
     return True
 
 
@@ -53,35 +156,32 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     conf = entry.data
 
-    session = aiohttp_client.async_get_clientsession(hass)
-    api = PollensClient(session)
-
     county = conf[CONF_COUNTRYCODE]
-    scan_interval = entry.options.get(CONF_SCAN_INTERVAL, 3)
-
-    await api.Get(county)
-
-    name = f"Pollens {api.county_name}"
+    scan_interval = entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+    threshold = entry.options.get(CONF_THRESHOLD, DEFAULT_THRESHOLD)
+    max_age = entry.options.get(CONF_MAX_AGE, DEFAULT_MAX_AGE)
 
-    coordinator = PollensUpdateCoordinator(
-        hass=hass,
-        name=name,
-        scan_interval=scan_interval,
-        county=county,
-        api=api,
-    )
+    hass.data.setdefault(DOMAIN, {})
+    coordinator = async_get_coordinator(hass)
+    coordinator.async_add_county(entry.entry_id, county, scan_interval, threshold, max_age)
 
-    await coordinator.async_config_entry_first_refresh()
+    try:
+        await coordinator.async_ensure_county(county)
+    except UpdateFailed as error:
+        await coordinator.async_remove_county(entry.entry_id)
+        if not coordinator.counties:
+            hass.data[DOMAIN].pop(HUB)
+        raise ConfigEntryNotReady(str(error)) from error
 
     # Add and update listener
     undo_listener = entry.add_update_listener(_async_update_listener)
 
     # Setup coordinator
-    hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = {
         COORDINATOR: coordinator,
         UNDO_LISTENER: undo_listener,
-        "pollens_api": api,
+        OPTIONS: dict(entry.options),
+        "pollens_api": coordinator.api,
     }
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     _LOGGER.debug("Setup of %s successful", entry.title)
@@ -89,6 +189,69 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+@callback
+def async_get_coordinator(hass: HomeAssistant) -> PollensUpdateCoordinator:
+    """Return the hub coordinator shared by all config entries, create it if needed."""
+    if HUB not in hass.data[DOMAIN]:
+        hass.data[DOMAIN][HUB] = PollensUpdateCoordinator(
+            hass=hass,
+            api=async_get_client(hass),
+        )
+    return hass.data[DOMAIN][HUB]
+
+
+@callback
+def async_get_client(hass: HomeAssistant) -> PollensClient:
+    """Return the pollens client shared by the config flow and all entries.
+
+    It lives as long as hass, so reloads can reuse its last results.
+    """
+    hass.data.setdefault(DOMAIN, {})
+    if CLIENT not in hass.data[DOMAIN]:
+        # Own session (on the shared connector) to measure connection times,
+        # not cleaned up with the entry creating it: the client outlives it
+        session = aiohttp_client.async_create_clientsession(
+            hass, auto_cleanup=False, trace_configs=[trace_config()]
+        )
+        hass.data[DOMAIN][CLIENT] = PollensClient(
+            session, cache=PollensResponseCache(hass)
+        )
+
+        @callback
+        def _async_detach_session(_: Event) -> None:
+            # Required without auto cleanup, the shared connector is closed by hass
+            session.detach()
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_detach_session)
+    return hass.data[DOMAIN][CLIENT]
+
+
+@callback
+def async_handoff_snapshot(hass: HomeAssistant, snapshot: PollensSnapshot) -> None:
+    """Keep the snapshot fetched by the config flow for the setup of its entry."""
+    handoff = hass.data.setdefault(DOMAIN, {}).setdefault(HANDOFF, {})
+    now = time.monotonic()
+    for county in [c for c, (t, _) in handoff.items() if now - t > HANDOFF_TTL]:
+        del handoff[county]
+    handoff[snapshot.county] = (now, snapshot)
+
+
+@callback
+def async_pop_handoff(hass: HomeAssistant, county: str) -> PollensSnapshot | None:
+    """Return the snapshot handed off by the config flow, if still fresh."""
+    fetched, snapshot = hass.data.get(DOMAIN, {}).get(HANDOFF, {}).pop(county, (0, None))
+    if time.monotonic() - fetched > HANDOFF_TTL:
+        return None
+    return snapshot
+
+
+def selected_pollens(entry: ConfigEntry) -> list[str]:
+    """Return the selected pollens of an entry (options first, then setup)."""
+    if CONF_POLLENSLIST in entry.options:
+        return entry.options[CONF_POLLENSLIST]
+    return entry.data.get(CONF_POLLENSLIST, list(KEY_TO_ATTR))
+
+
 async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Migrate the config entry upon new versions."""
     version = entry.version
@@ -112,51 +275,602 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id)
+        entry_data[UNDO_LISTENER]()
+        coordinator = entry_data[COORDINATOR]
+        await coordinator.async_remove_county(entry.entry_id)
+        if not coordinator.counties:
+            hass.data[DOMAIN].pop(HUB)
     return unload_ok
 
 
 async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry):
-    """Update when config_entry options update"""
+    """Update when config_entry options update
+
+    In selected only mode, a change of the selected pollens alone adds and
+    removes their sensors without reloading the entry. Otherwise the sensors
+    of the pollens selected / deselected are enabled / disabled.
+    """
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    previous, entry_data[OPTIONS] = entry_data[OPTIONS], dict(entry.options)
+    if not entry.options.get(CONF_SELECTED_ONLY):
+        _async_update_pollens_disabled(
+            hass,
+            entry,
+            previous.get(CONF_POLLENSLIST, entry.data.get(CONF_POLLENSLIST, list(KEY_TO_ATTR))),
+            selected_pollens(entry),
+        )
+    if entry.options.get(CONF_SELECTED_ONLY) and {
+        **previous,
+        CONF_POLLENSLIST: None,
+    } == {**entry.options, CONF_POLLENSLIST: None}:
+        async_dispatcher_send(
+            hass,
+            SIGNAL_POLLENS_CHANGED.format(entry.entry_id),
+            entry.options[CONF_POLLENSLIST],
+        )
+        return
     await hass.config_entries.async_reload(entry.entry_id)
 
 
+@callback
+def _async_update_pollens_disabled(
+    hass: HomeAssistant, entry: ConfigEntry, previous: list[str], selected: list[str]
+) -> None:
+    """Enable the sensors of the newly selected pollens, disable the deselected ones.
+
+    entity_registry_enabled_default only applies to new registry entries.
+    A sensor disabled by the user stays disabled.
+    """
+    county = entry.data[CONF_COUNTRYCODE]
+    # unique id of the sensor of a pollen (see PollenSensor) -> its key
+    pollens = {
+        f"{entry.entry_id}_pollens_{county}_{attr}": key
+        for key, (attr, _) in KEY_TO_ATTR.items()
+    }
+    registry = er.async_get(hass)
+    for registry_entry in er.async_entries_for_config_entry(registry, entry.entry_id):
+        if (key := pollens.get(registry_entry.unique_id)) is None:
+            continue
+        if key in selected and key not in previous:
+            if registry_entry.disabled_by is er.RegistryEntryDisabler.INTEGRATION:
+                registry.async_update_entity(registry_entry.entity_id, disabled_by=None)
+        elif key in previous and key not in selected:
+            if registry_entry.disabled_by is None:
+                registry.async_update_entity(
+                    registry_entry.entity_id,
+                    disabled_by=er.RegistryEntryDisabler.INTEGRATION,
+                )
+
+
 class PollensUpdateCoordinator(DataUpdateCoordinator):
-    """Class to manage fetching Pollens data API"""
+    """Class to manage fetching Pollens data API for every configured county
+
+    A single coordinator is shared by all config entries (see
+    async_get_coordinator). Each county has its own next poll time, given by
+    the PollingScheduler; every update fetches together the counties which
+    are due and the next update is planned for the closest one. ``data``
+    maps each county code to its PollensSnapshot, replaced as a whole
+    on each refresh. Entities subscribe with their county and pollen as
+    listener context, so they are only notified when their value changed.
+    """
 
     def __init__(
         self,
         hass: HomeAssistant,
-        name: str,
-        scan_interval: int,
-        api: str,
-        county: str,
-        # level_filter: int,
+        api: PollensClient,
+        max_concurrent: int = MAX_CONCURRENT_REQUESTS,
     ) -> None:
 
         super().__init__(
             hass=hass,
             logger=_LOGGER,
-            name=name,
-            update_interval=timedelta(hours=scan_interval),
+            name=DOMAIN,
+            update_interval=timedelta(hours=DEFAULT_SCAN_INTERVAL),
         )
 
         self.api = api
-        self.name = name
-        self.county = county
+        self.data = {}
+        # entry_id -> (county, scan interval in hours)
+        self._entries: dict[str, tuple[str, int]] = {}
+        # entry_id -> threshold of its threshold crossing events
+        self._thresholds: dict[str, int] = {}
+        # entry_id -> hours during which the last snapshot of its county is served
+        self._max_ages: dict[str, int] = {}
+        # entry_id -> DeviceInfo shared by the entities of the entry
+        self._device_infos: dict[str, DeviceInfo] = {}
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        # Listener contexts whose data changed during the last update
+        self._changed_contexts: set[tuple[str, int | str]] | None = None
+        # Number of entities notified / skipped by change detection
+        self.update_counters = {"notified": 0, "skipped": 0}
+        # Counties restored from the persisted snapshot, not refreshed yet
+        self._stale_counties: set[str] = set()
+        self._unsub_started: CALLBACK_TYPE | None = None
+        self._stale_refresh_task: asyncio.Task | None = None
+        self.scheduler = PollingScheduler(timedelta(hours=DEFAULT_SCAN_INTERVAL))
+        # Publications learned by the scheduler, kept across restarts
+        self._publications_store: Store[list[str]] = Store(
+            hass, STORAGE_VERSION, STORAGE_KEY_PUBLICATIONS
+        )
+        self._publications_lock = asyncio.Lock()
+        self._publications_loaded = False
+        # county -> local time of its next poll
+        self._next_poll: dict[str, datetime] = {}
+        # county -> ring buffer of its last fetches (see _async_fetch_county)
+        self.fetch_history: dict[str, deque[dict[str, Any]]] = {}
+        self.last_success: dict[str, datetime] = {}
+        self.last_failure: dict[str, datetime] = {}
+        # Counties fetched by the last update, to record their state writes
+        self._fetched_counties: list[str] = []
+        # Daily levels of the last days, for the trend attributes
+        self.history = PollensHistory(hass)
+        # Hourly levels imported as long-term statistics, when the recorder runs
+        self.statistics: PollensStatistics | None = None
+        if "recorder" in hass.config.components:
+            # pylint: disable-next=import-outside-toplevel
+            from .stats import PollensStatistics
+
+            self.statistics = PollensStatistics(hass)
+
+    @property
+    def counties(self) -> list[str]:
+        """Return the configured counties (without duplicates)."""
+        return list(dict.fromkeys(county for county, _ in self._entries.values()))
+
+    @callback
+    def async_add_county(
+        self,
+        entry_id: str,
+        county: str,
+        scan_interval: int,
+        threshold: int = DEFAULT_THRESHOLD,
+        max_age: int = DEFAULT_MAX_AGE,
+    ) -> None:
+        """Register the county of a config entry."""
+        self._entries[entry_id] = (county, scan_interval)
+        self._thresholds[entry_id] = threshold
+        self._max_ages[entry_id] = max_age
+        self._async_update_interval()
+
+    @callback
+    def async_device_info(self, entry: ConfigEntry) -> DeviceInfo:
+        """Return the DeviceInfo of an entry, built once for all its entities."""
+        if (device_info := self._device_infos.get(entry.entry_id)) is None:
+            county = entry.data[CONF_COUNTRYCODE]
+            device_info = self._device_infos[entry.entry_id] = DeviceInfo(
+                entry_type=DeviceEntryType.SERVICE,
+                identifiers={(DOMAIN, f"{entry.unique_id}{county}")},
+                manufacturer="RNSA",
+                model="Pollens sensor",
+                name=f"Pollens {self.data[county].county_name}",
+            )
+        return device_info
+
+    async def async_remove_county(self, entry_id: str) -> None:
+        """Unregister the county of a config entry."""
+        county, _ = self._entries.pop(entry_id, (None, None))
+        self._thresholds.pop(entry_id, None)
+        self._max_ages.pop(entry_id, None)
+        self._device_infos.pop(entry_id, None)
+        if county is not None and county not in self.counties:
+            self.data.pop(county, None)
+            self._stale_counties.discard(county)
+            self._next_poll.pop(county, None)
+            self.scheduler.forget(county)
+            self.fetch_history.pop(county, None)
+            self.last_success.pop(county, None)
+            self.last_failure.pop(county, None)
+            if self.statistics is not None:
+                self.statistics.forget(county)
+            self.api.Cancel(county)
+        if self._entries:
+            self._async_update_interval()
+        else:
+            await self.async_shutdown()
+
+    async def async_ensure_county(self, county: str) -> None:
+        """Add a county which is not part of the shared snapshot yet.
+
+        The snapshot validated by the config flow is used first (handoff).
+        Otherwise the last snapshot persisted for the county is used when
+        there is one, so entities can be created without waiting for
+        pollens.fr; it is then refreshed in the background once Home
+        Assistant has started. Otherwise the county is fetched.
+        """
+        if county in self.data:
+            return
+        await self.history.async_load()
+        await self._async_load_publications()
+        snapshot = async_pop_handoff(self.hass, county)
+        if snapshot is None and (snapshot := await self.api.GetCached(county)):
+            self._stale_counties.add(county)
+            self._async_schedule_stale_refresh()
+        elif snapshot is None:
+            snapshot = await self._async_fetch_county(
+                county, max_age=self.scheduler.interval.total_seconds()
+            )
+        if snapshot is None:
+            raise UpdateFailed(f"Error updating from RSSA for county {county}")
+        # Entities of this county do not exist yet, no listener to notify
+        self.data = {**self.data, county: snapshot}
+        self.history.record(snapshot, dt_util.now().date())
+        self._async_import_statistics([(snapshot, None)])
+        self._async_plan(county, None, snapshot)
+        self._async_update_interval()
+
+    async def async_shutdown(self) -> None:
+        """Shut down only once the last county has been removed.
+
+        The coordinator is attached to the entry which created it, but it is
+        shared by every entry and must survive the unload of that one.
+        """
+        if self._entries:
+            return
+        if self._unsub_started is not None:
+            self._unsub_started()
+            self._unsub_started = None
+        if self._stale_refresh_task is not None:
+            self._stale_refresh_task.cancel()
+        await super().async_shutdown()
+
+    @callback
+    def _async_schedule_stale_refresh(self) -> None:
+        """Refresh the restored counties in the background after startup."""
+        if self._unsub_started is not None or self._stale_refresh_task is not None:
+            return
+
+        @callback
+        def _async_started(_: HomeAssistant) -> None:
+            self._unsub_started = None
+            self._stale_refresh_task = self.hass.async_create_background_task(
+                self._async_refresh_stale(), f"{DOMAIN} refresh restored counties"
+            )
+
+        self._unsub_started = async_at_started(self.hass, _async_started)
+
+    async def _async_refresh_stale(self) -> None:
+        """Fetch the restored counties and notify their entities."""
+        try:
+            counties = [c for c in self.counties if c in self._stale_counties]
+            max_age = self.scheduler.interval.total_seconds()
+            results = await asyncio.gather(
+                *(self._async_fetch_county(c, max_age=max_age) for c in counties)
+            )
+        finally:
+            self._stale_refresh_task = None
+        data = dict(self.data)
+        updated = set()
+        changed = set()
+        imported = []
+        for county, snapshot in zip(counties, results):
+            changed.add((county, DIAGNOSTICS))
+            if snapshot is None:
+                # Still stale, revalidated by the scheduled updates
+                self._async_plan(county, data.get(county), None)
+                changed |= _serve_stale(data, county)
+                continue
+            changed |= _diff_county(county, data.get(county), snapshot)
+            changed |= self._async_record_history(snapshot)
+            self._async_fire_crossings(data.get(county), snapshot)
+            self._async_plan(county, data.get(county), snapshot)
+            imported.append((snapshot, data.get(county)))
+            data[county] = snapshot
+            updated.add(county)
+        self._async_import_statistics(imported)
+        self._stale_counties -= updated
+        self._async_update_interval()
+        _LOGGER.debug("Restored counties refreshed: %s", sorted(updated))
+        self.data = data
+        self._changed_contexts = changed
+        self._fetched_counties = counties
+        self.async_update_listeners()
+
+    @callback
+    def _async_fire_crossings(
+        self, previous: PollensSnapshot | None, current: PollensSnapshot
+    ) -> None:
+        """Fire an event for each level crossing a threshold of the county entries.
+
+        A level crosses a threshold upwards when it goes from below to at or
+        above it, downwards the other way. Nothing is fired for the first
+        snapshot of a county.
+        """
+        if previous is None:
+            return
+        thresholds = sorted(
+            {
+                self._thresholds[entry_id]
+                for entry_id, (county, _) in self._entries.items()
+                if county == current.county
+            }
+        )
+        levels = [
+            (RISK_LEVEL, previous.risk_level, current.risk_level),
+            *(
+                (pollen, previous.level_of(pollen), current.level_of(pollen))
+                for pollen in current.pollens
+            ),
+        ]
+        for pollen, old_level, new_level in levels:
+            if old_level is None or old_level == new_level:
+                continue
+            for threshold in thresholds:
+                if (old_level < threshold) == (new_level < threshold):
+                    continue
+                self.hass.bus.async_fire(
+                    EVENT_THRESHOLD_CROSSED,
+                    {
+                        "county": current.county,
+                        "county_name": current.county_name,
+                        "pollen": pollen,
+                        "old_level": old_level,
+                        "new_level": new_level,
+                        "threshold": threshold,
+                        "direction": "up" if new_level > old_level else "down",
+                    },
+                )
+
+    @callback
+    def _async_record_history(
+        self, snapshot: PollensSnapshot
+    ) -> set[tuple[str, int | str]]:
+        """Record a snapshot in the history, return the contexts whose summary changed."""
+        return {
+            (snapshot.county, key)
+            for key in self.history.record(snapshot, dt_util.now().date())
+        }
+
+    @callback
+    def _async_import_statistics(
+        self, snapshots: list[tuple[PollensSnapshot, PollensSnapshot | None]]
+    ) -> None:
+        """Import the levels of the fetched counties in the background.
+
+        snapshots: (new snapshot, snapshot it replaces) of each county.
+        """
+        if self.statistics is None or not snapshots:
+            return
+
+        async def _async_import() -> None:
+            for snapshot, previous in snapshots:
+                await self.statistics.async_import(snapshot, previous)
+
+        self.hass.async_create_background_task(
+            _async_import(), f"{DOMAIN} import statistics"
+        )
+
+    def max_age(self, county: str) -> int:
+        """Return the seconds during which the last snapshot of a county is served.
+
+        The longest max age of the entries of the county.
+        """
+        return 3600 * max(
+            self._max_ages[entry_id]
+            for entry_id, (entry_county, _) in self._entries.items()
+            if entry_county == county
+        )
+
+    def _servable(self, data: dict[str, PollensSnapshot], county: str) -> bool:
+        """Return True when the snapshot of a county is not older than its max age."""
+        snapshot = data.get(county)
+        return snapshot is not None and snapshot.age() <= self.max_age(county)
+
+    @callback
+    def _async_update_interval(self) -> None:
+        """Plan the next update for the first county due.
+
+        The shortest scan interval of all entries is the base interval of the
+        scheduler.
+        """
+        scan_interval = min(interval for _, interval in self._entries.values())
+        self.scheduler.interval = timedelta(hours=scan_interval)
+        next_polls = [self._next_poll[c] for c in self.counties if c in self._next_poll]
+        if not next_polls:
+            self.update_interval = self.scheduler.interval
+            return
+        self.update_interval = max(
+            min(next_polls) - dt_util.now(), MIN_UPDATE_INTERVAL
+        )
+
+    @callback
+    def _async_plan(
+        self,
+        county: str,
+        previous: PollensSnapshot | None,
+        snapshot: PollensSnapshot | None,
+    ) -> None:
+        """Plan the next poll of a county after it has been fetched."""
+        now = dt_util.now()
+        if snapshot is None:
+            # Failed, the client already retried: revalidate sooner than usual
+            self._next_poll[county] = now + REVALIDATE_INTERVAL
+            return
+        changed = previous is not None and (
+            previous.levels != snapshot.levels
+            or previous.risk_level != snapshot.risk_level
+        )
+        # A stale snapshot may be older than the last publication
+        learn = previous is not None and not previous.stale
+        if self.scheduler.record(county, now, changed, learn):
+            self._publications_store.async_delay_save(
+                lambda: [p.isoformat() for p in self.scheduler.publications],
+                STORAGE_SAVE_DELAY,
+            )
+        quiet = snapshot.risk_level == 0 and not any(
+            snapshot.level(index) for index in range(len(snapshot.levels))
+        )
+        self._next_poll[county] = self.scheduler.next_poll(county, now, quiet)
+
+    async def _async_load_publications(self) -> None:
+        """Restore the publications learned by the scheduler, once."""
+        async with self._publications_lock:
+            if self._publications_loaded:
+                return
+            if stored := await self._publications_store.async_load():
+                self.scheduler.load_publications(
+                    [datetime.fromisoformat(p) for p in stored]
+                )
+            self._publications_loaded = True
+
+    async def _async_fetch_county(
+        self, county: str, max_age: float | None = None
+    ) -> PollensSnapshot | None:
+        """Fetch one county, the number of parallel requests is bounded.
+
+        The fetch is recorded in the fetch_history of the county, with the
+        metrics measured by the client.
+        """
+        async with self._semaphore:
+            start = time.perf_counter()
+            snapshot = await self.api.Get(county, max_age=max_age)
+            duration = round((time.perf_counter() - start) * 1000, 3)
+        now = dt_util.utcnow()
+        if snapshot is None:
+            self.last_failure[county] = now
+        else:
+            self.last_success[county] = now
+        history = self.fetch_history.setdefault(county, deque(maxlen=FETCH_HISTORY_SIZE))
+        history.append(
+            {
+                "time": now.isoformat(),
+                "success": snapshot is not None,
+                "duration_ms": duration,
+                **self.api.metrics.get(county, {}),
+            }
+        )
+        return snapshot
+
+    async def async_request_refresh(self) -> None:
+        """Request a refresh of every county, due or not (update_entity)."""
+        self._next_poll.clear()
+        await super().async_request_refresh()
 
     async def _async_update_data(self):
-        _LOGGER.info("Update data from web site for %s", self.name)
+        due = dt_util.now() + MIN_UPDATE_INTERVAL
+        counties = [c for c in self.counties if self._next_poll.get(c, due) <= due]
+        _LOGGER.info("Update data from web site for %s counties", len(counties))
         try:
-            return await self.api.Get(self.county)
+            results = await asyncio.gather(
+                *(self._async_fetch_county(county) for county in counties)
+            )
         except ClientError as error:
             raise UpdateFailed(f"Error updating from RSSA : {error}") from error
 
+        data = dict(self.data or {})
+        updated = set()
+        changed = set()
+        imported = []
+        for county, snapshot in zip(counties, results):
+            self._async_plan(county, data.get(county), snapshot)
+            changed.add((county, DIAGNOSTICS))
+            if snapshot is None:
+                _LOGGER.debug("No data received for county %s", county)
+                changed |= _serve_stale(data, county)
+                continue
+            changed |= _diff_county(county, data.get(county), snapshot)
+            changed |= self._async_record_history(snapshot)
+            self._async_fire_crossings(data.get(county), snapshot)
+            imported.append((snapshot, data.get(county)))
+            data[county] = snapshot
+            updated.add(county)
+        self._async_import_statistics(imported)
+        self._async_update_interval()
+        if counties and not updated:
+            # Entities past the max age of their county are unavailable by
+            # themselves, failing the update would take down every county
+            if not any(self._servable(data, county) for county in self.counties):
+                raise UpdateFailed("Error updating from RSSA : no county could be fetched")
+            _LOGGER.warning("No county could be fetched, serving the last data")
+        self._stale_counties -= updated
+        # Entities must all be notified when recovering from a failed update
+        self._changed_contexts = changed if self.last_update_success else None
+        self._fetched_counties = counties
+        return data
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Only notify the entities whose data changed during the last update."""
+        changed, self._changed_contexts = self._changed_contexts, None
+        fetched, self._fetched_counties = self._fetched_counties, []
+        notify_all = changed is None or not self.last_update_success
+        notified = 0
+        writes: Counter[str] = Counter()
+        diagnostics = []
+        for update_callback, context in list(self._listeners.values()):
+            if not (notify_all or context in changed):
+                continue
+            if context[1] == DIAGNOSTICS:
+                # Written last, with the state writes of their county
+                diagnostics.append(update_callback)
+                continue
+            update_callback()
+            notified += 1
+            if isinstance(getattr(update_callback, "__self__", None), CoordinatorEntity):
+                # The other listeners (new pollens of the sensor platform) write no state
+                writes[context[0]] += 1
+        for county in fetched:
+            if history := self.fetch_history.get(county):
+                history[-1]["state_writes"] = writes[county]
+        for update_callback in diagnostics:
+            update_callback()
+        notified += len(diagnostics)
+        skipped = len(self._listeners) - notified
+        self.update_counters["notified"] += notified
+        self.update_counters["skipped"] += skipped
+        _LOGGER.debug("%s entities notified, %s unchanged", notified, skipped)
+
+
+def _serve_stale(
+    data: dict[str, PollensSnapshot], county: str
+) -> set[tuple[str, int | str]]:
+    """Keep serving the last snapshot of a county which could not be fetched.
+
+    It is flagged stale and replaced after each failed fetch, so its
+    entities are written again with their data age, and become
+    unavailable past their max age. Return the contexts to notify.
+    """
+    if (previous := data.get(county)) is None:
+        return set()
+    data[county] = replace(previous, stale=True)
+    return _diff_county(county, None, data[county])
+
+
+def _diff_county(
+    county: str, previous: PollensSnapshot | None, current: PollensSnapshot
+) -> set[tuple[str, int | str]]:
+    """Return the listener contexts of a county whose value or attributes changed.
+
+    Pollen sensors listen to (county, pollen index), risk sensors to
+    (county, RISK_LEVEL) and aggregate sensors to (county, AGGREGATES).
+    """
+    if (
+        previous is None
+        or previous.stale != current.stale
+        or previous.county_name != current.county_name
+    ):
+        # Attributes shared by every entity of the county
+        return {(county, RISK_LEVEL), (county, AGGREGATES)} | {
+            (county, index) for index in range(len(current.levels))
+        }
+    changed = {
+        (county, index)
+        for index, level in enumerate(current.levels)
+        if previous.level(index) != current.level(index)
+    }
+    if changed:
+        changed.add((county, AGGREGATES))
+    if previous.risk_level != current.risk_level:
+        changed.add((county, RISK_LEVEL))
+    return changed
+
 
 class PollensEntity(CoordinatorEntity):
     """Implementation of the base pollens Entity"""
 
     _attr_extra_state_attributes = {"attribution": ATTRIBUTION}
+    # Static attributes, not written to the recorder with every state
+    _unrecorded_attributes = frozenset({ATTR_COUNTY_NAME, ATTR_POLLEN_NAME, ATTR_URL})
 
     def __init__(
         self,
@@ -164,28 +878,33 @@ class PollensEntity(CoordinatorEntity):
         name: str,
         icon: str,
         entry: ConfigEntry,
+        key: int | str = RISK_LEVEL,
     ) -> None:
-        """Initialize"""
+        """Initialize
+
+        key: pollen index or RISK_LEVEL, the entity is only updated when it changes.
+        """
 
-        super().__init__(coordinator=coordinator)
+        self.county = entry.data[CONF_COUNTRYCODE]
+        super().__init__(coordinator=coordinator, context=(self.county, key))
+        self._attr_device_info = coordinator.async_device_info(entry)
+        # Seconds during which the last snapshot is served when pollens.fr fails
+        self._max_age = 3600 * entry.options.get(CONF_MAX_AGE, DEFAULT_MAX_AGE)
 
         # self._attr_unique_id = f"{entry.entry_id}_{KEY_TO_ATTR[name.lower()][0]}"
         # self._attr_icon = icon
         # self._unique_id = f"pollens_{entry.entry_id}"
 
     @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(
-            entry_type=DeviceEntryType.SERVICE,
-            identifiers={
-                (
-                    DOMAIN,
-                    str(
-                        f"{self.platform.config_entry.unique_id}{self.platform.config_entry.data['county']}"
-                    ),
-                )
-            },
-            manufacturer="RNSA",
-            model="Pollens sensor",
-            name=self.coordinator.name,
+    def snapshot(self) -> PollensSnapshot:
+        """Return the snapshot of this entity county."""
+        return self.coordinator.data[self.county]
+
+    @property
+    def available(self) -> bool:
+        """Return False without a snapshot, or when it is older than the max age."""
+        return (
+            super().available
+            and self.county in self.coordinator.data
+            and self.snapshot.age() <= self._max_age
         )
@@ -0,0 +1,247 @@
+"""Bulletins of every department, without Home Assistant.
+
+    python bulk.py [--format ndjson|csv] [--output FILE] [--workers N]
+                   [--rate R] [--resume FILE] [--changed-since FILE]
+                   [--record FILE] [COUNTY ...]
+
+Each bulletin is written as soon as it arrives (one JSON object per line,
+or one CSV row per pollen), nothing is buffered for the whole country.
+
+--resume FILE lists the counties already written: an interrupted run
+started again with the same file appends the missing counties only, the
+file is removed once every county is written.
+--changed-since FILE keeps the last responses (with their HTTP validators,
+so unchanged bulletins are answered with a 304): only the counties whose
+bulletin changed since the previous run are written. It is updated at the
+end of a complete run.
+--record FILE appends the raw responses and their latency to FILE, to be
+replayed with providers.ReplayProvider.
+
+fetch_all is the library entry point.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import csv
+import json
+import logging
+import os
+from pathlib import Path
+import sys
+
+try:
+    from .dept import DEPARTMENTS
+    from .pollensasync import (
+        DEFAULT_BURST,
+        DEFAULT_CONCURRENCY,
+        DEFAULT_RATE,
+        HttpProvider,
+        PollensClient,
+        PollensSnapshot,
+        RateLimiter,
+        ResponseCache,
+    )
+    from .providers import RecordingProvider
+except ImportError:  # used as a standalone module
+    from dept import DEPARTMENTS
+    from pollensasync import (
+        DEFAULT_BURST,
+        DEFAULT_CONCURRENCY,
+        DEFAULT_RATE,
+        HttpProvider,
+        PollensClient,
+        PollensSnapshot,
+        RateLimiter,
+        ResponseCache,
+    )
+    from providers import RecordingProvider
+
+CSV_FIELDS = ("county", "county_name", "updated", "risk_level", "pollen", "level")
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class FileResponseCache(ResponseCache):
+    """ResponseCache kept in a JSON file between runs."""
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = Path(path)
+        if self.path.exists():
+            self._entries.update(json.loads(self.path.read_text()))
+        # county -> entry of the previous run, compared with the new bulletins
+        self.previous = dict(self._entries)
+
+    def changed(self, snapshot):
+        """Return True when the bulletin differs from the previous run."""
+        entry = self.previous.get(snapshot.county)
+        if entry is None:
+            return True
+        before = PollensSnapshot.from_json(snapshot.county, entry["data"])
+        return (before.county_name, before.risk_level, before.levels) != (
+            snapshot.county_name,
+            snapshot.risk_level,
+            snapshot.levels,
+        )
+
+    def save(self):
+        """Write the entries, atomically."""
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps(self._entries))
+        os.replace(tmp, self.path)
+
+
+async def fetch_all(client, counties=None, workers=DEFAULT_CONCURRENCY):
+    """Yield (county, PollensSnapshot or None on error) in order of arrival.
+
+    counties: county numbers, all of DEPARTMENTS by default.
+    workers: number of counties fetched at the same time. A worker waits
+    while the previous results are not consumed, the caller sets the pace.
+    """
+    counties = list(DEPARTMENTS if counties is None else counties)
+    pending = asyncio.Queue()
+    for county in counties:
+        pending.put_nowait(county)
+    results = asyncio.Queue(maxsize=workers)
+
+    async def _worker():
+        while not pending.empty():
+            county = pending.get_nowait()
+            try:
+                snapshot = await client.Get(county)
+            except Exception:  # pylint: disable=broad-except
+                # Do not leave the consumer waiting for this county
+                _LOGGER.exception("County %s: unexpected error", county)
+                snapshot = None
+            await results.put((county, snapshot))
+
+    tasks = [asyncio.create_task(_worker()) for _ in range(min(workers, len(counties)))]
+    try:
+        for _ in counties:
+            yield await results.get()
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def snapshot_record(snapshot):
+    """Return the JSON-serializable record of a snapshot."""
+    return {
+        "county": snapshot.county,
+        "county_name": snapshot.county_name,
+        "updated": snapshot.updated.isoformat(),
+        "risk_level": snapshot.risk_level,
+        "levels": {pollen: snapshot.level_of(pollen) for pollen in snapshot.pollens},
+    }
+
+
+class NdjsonWriter:
+    """Write one JSON object per county and line."""
+
+    def __init__(self, out):
+        self._out = out
+
+    def write(self, snapshot):
+        self._out.write(json.dumps(snapshot_record(snapshot), ensure_ascii=False) + "\n")
+        self._out.flush()
+
+
+class CsvWriter:
+    """Write one CSV row per pollen of each county (header on a new file)."""
+
+    def __init__(self, out):
+        self._out = out
+        self._writer = csv.writer(out)
+        if not out.seekable() or out.tell() == 0:
+            self._writer.writerow(CSV_FIELDS)
+
+    def write(self, snapshot):
+        record = snapshot_record(snapshot)
+        self._writer.writerows(
+            (
+                record["county"],
+                record["county_name"],
+                record["updated"],
+                record["risk_level"],
+                pollen,
+                level,
+            )
+            for pollen, level in record["levels"].items()
+        )
+        self._out.flush()
+
+
+WRITERS = {"ndjson": NdjsonWriter, "csv": CsvWriter}
+
+
+async def async_main(args):
+    """Write the bulletins of the counties, return the number of failures."""
+    counties = args.counties or list(DEPARTMENTS)
+    done = set()
+    if args.resume and os.path.exists(args.resume):
+        done = set(Path(args.resume).read_text().split())
+    cache = FileResponseCache(args.changed_since) if args.changed_since else None
+    limiter = RateLimiter(args.rate, DEFAULT_BURST, args.workers)
+    provider = HttpProvider()
+    if args.record:
+        provider = RecordingProvider(provider, args.record)
+    failures = 0
+    out = sys.stdout
+    if args.output:
+        # A resumed run appends to the output of the interrupted one
+        out = open(args.output, "a" if done else "w", newline="", encoding="utf-8")
+    checkpoint = open(args.resume, "a", encoding="utf-8") if args.resume else None
+    try:
+        writer = WRITERS[args.format](out)
+        async with PollensClient(
+            freshness=0, cache=cache, limiter=limiter, provider=provider
+        ) as client:
+            todo = [county for county in counties if county not in done]
+            async for county, snapshot in fetch_all(client, todo, args.workers):
+                if snapshot is None:
+                    failures += 1
+                    _LOGGER.error(
+                        "County %s: no bulletin (%s)", county, client.metrics.get(county)
+                    )
+                    continue
+                if cache is None or cache.changed(snapshot):
+                    writer.write(snapshot)
+                if checkpoint is not None:
+                    checkpoint.write(county + "\n")
+                    checkpoint.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+        if checkpoint is not None:
+            checkpoint.close()
+    # Only a complete run moves the reference of --changed-since forward
+    if cache is not None:
+        cache.save()
+    if args.resume and not failures:
+        os.remove(args.resume)
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("counties", nargs="*", metavar="COUNTY", help="default: all")
+    parser.add_argument("--format", choices=sorted(WRITERS), default="ndjson")
+    parser.add_argument("--output", help="file, default: stdout")
+    parser.add_argument("--workers", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument(
+        "--rate", type=float, default=DEFAULT_RATE, help="requests per second"
+    )
+    parser.add_argument("--resume", metavar="FILE", help="counties already written")
+    parser.add_argument(
+        "--changed-since", metavar="FILE", help="responses of the previous run"
+    )
+    parser.add_argument("--record", metavar="FILE", help="raw responses, appended")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+    return 1 if asyncio.run(async_main(args)) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
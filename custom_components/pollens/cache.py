@@ -0,0 +1,43 @@
+"""Response cache of the Pollens integration, persisted with HA storage."""
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import STORAGE_KEY_RESPONSES, STORAGE_SAVE_DELAY, STORAGE_VERSION
+from .pollensasync import ResponseCache
+
+
+class PollensResponseCache(ResponseCache):
+    """Response cache stored in .storage, loaded on first use."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize"""
+        super().__init__()
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, STORAGE_KEY_RESPONSES
+        )
+        self._load_lock = asyncio.Lock()
+        self._loaded = False
+
+    async def _async_load(self) -> None:
+        async with self._load_lock:
+            if self._loaded:
+                return
+            if (stored := await self._store.async_load()) is not None:
+                self._entries.update(stored)
+            self._loaded = True
+
+    async def async_get(self, number: str) -> dict[str, Any] | None:
+        """Return the cached entry of a county or None."""
+        await self._async_load()
+        return await super().async_get(number)
+
+    async def async_set(self, number: str, entry: dict[str, Any]) -> None:
+        """Store the entry of a county and schedule the write to disk."""
+        await self._async_load()
+        await super().async_set(number, entry)
+        self._store.async_delay_save(lambda: self._entries, STORAGE_SAVE_DELAY)
@@ -1,6 +1,7 @@
 """Config flow for Pollens integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
@@ -11,7 +12,6 @@ from homeassistant import config_entries, exceptions
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
-from homeassistant.helpers import aiohttp_client
 from homeassistant.helpers import selector
 
 from .const import (
@@ -22,36 +22,58 @@ from .const import (
     CONF_SCAN_INTERVAL,
     CONF_POLLENSLIST,
     CONF_LITERAL,
+    CONF_MAX_AGE,
+    CONF_SELECTED_ONLY,
+    CONF_THRESHOLD,
+    DEFAULT_MAX_AGE,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_THRESHOLD,
+    LIST_RISK,
+    MIN_SCAN_INTERVAL,
 )
 from .dept import DEPARTMENTS
+from .geo import find_department
 
-from .pollensasync import PollensClient
+from . import async_get_client, async_handoff_snapshot, selected_pollens
 
 _LOGGER = logging.getLogger(__name__)
 
 
+# Options of the county selector, built once: DEPARTMENTS is never modified
+COUNTY_OPTIONS = tuple(
+    selector.SelectOptionDict(value=code, label=f"{name} ({code})")
+    for code, name in DEPARTMENTS.items()
+)
+
+
 async def validate_input(hass: HomeAssistant, data: dict) -> dict[str, Any]:
     """Validate the user input allows us to connect.
 
-    Data has the keys from DATA_SCHEMA with values provided by the user.
+    Data has the keys from DATA_SCHEMA with values provided by the user, for
+    a single county. The snapshot fetched is handed off to the setup of the
+    entry, which does not fetch it again.
     """
     # Validate the data can be used to set up a connection.
-    if len(data[CONF_COUNTRYCODE]) != 2:
+    if data[CONF_COUNTRYCODE] not in DEPARTMENTS:
         raise InvalidCounty
 
-    session = aiohttp_client.async_get_clientsession(hass)
-    client = PollensClient(session)
+    client = async_get_client(hass)
     result = await client.Get(data[CONF_COUNTRYCODE])
     if not result:
         # If there is an error, raise an exception to notify HA that there was a
         # problem. The UI will also show there was a problem
         raise CannotConnect
-    title = f"Pollens {client.county_name}"
+    async_handoff_snapshot(hass, result)
+    title = f"Pollens {result.county_name}"
     return {"title": title}
 
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
-    """Handle a config flow for Pollens."""
+    """Handle a config flow for Pollens.
+
+    Several counties can be selected: they are validated concurrently, the
+    flow creates the entry of the first one and imports the others.
+    """
 
     VERSION = CONF_VERSION
     # Pick one of the available connection classes in homeassistant/config_entries.py
@@ -69,31 +91,51 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Handle the initial step."""
         errors = {}
         if user_input is not None:
-            try:
-                self._init_info["data"] = user_input
-                self._init_info["info"] = await validate_input(self.hass, user_input)
-                return await self.async_step_select_pollens()
-            except CannotConnect:
-                errors["base"] = "cannot_connect"
-            except InvalidCounty:
+            counties = user_input[CONF_COUNTRYCODE]
+            results = await asyncio.gather(
+                *(
+                    validate_input(self.hass, {**user_input, CONF_COUNTRYCODE: county})
+                    for county in counties
+                ),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, CannotConnect):
+                    errors["base"] = "cannot_connect"
+                elif isinstance(result, InvalidCounty):
+                    errors["base"] = "invalid_county"
+                    _LOGGER.error("Invalid county selected")
+                elif isinstance(result, Exception):
+                    _LOGGER.error("Unexpected exception", exc_info=result)
+                    errors["base"] = "unknown"
+            if not counties:
                 errors["base"] = "invalid_county"
-                _LOGGER.exception("Invalid county selected")
-            except Exception:  # pylint: disable=broad-except
-                _LOGGER.exception("Unexpected exception")
-                errors["base"] = "unknown"
+            if not errors:
+                self._init_info["data"] = {CONF_LITERAL: user_input[CONF_LITERAL]}
+                # county -> validation info
+                self._init_info["counties"] = dict(zip(counties, results))
+                return await self.async_step_select_pollens()
+
+        # Counties already configured are not proposed
+        configured = {entry.data[CONF_COUNTRYCODE] for entry in self._async_current_entries()}
+        options = [option for option in COUNTY_OPTIONS if option["value"] not in configured]
 
-        entries = self._async_current_entries()
-        # Remove county from the list (already configured)
-        for entry in entries:
-            if entry.data[CONF_COUNTRYCODE] in DEPARTMENTS:
-                DEPARTMENTS.pop(entry.data[CONF_COUNTRYCODE])
+        # Default county: the one of the home location, when not configured yet
+        found = find_department(self.hass.config.latitude, self.hass.config.longitude)
+        default = [found[0]] if found and found[0] not in configured else []
 
         # If there is no user input or there were errors, show the form again, including any errors that were found with the input.
         return self.async_show_form(
             step_id="user",
             data_schema=vol.Schema(
                 {
-                    vol.Required(CONF_COUNTRYCODE, default=["60"]): vol.In(DEPARTMENTS),
+                    vol.Required(CONF_COUNTRYCODE, default=default): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=options,
+                            multiple=True,
+                            mode=selector.SelectSelectorMode.DROPDOWN,
+                        )
+                    ),
                     vol.Required(CONF_LITERAL, default=True): cv.boolean,
                 }
             ),
@@ -105,9 +147,21 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Select pollens step 2"""
         if user_input is not None:
             _LOGGER.info("Select pollens step")
-            self._init_info["data"][CONF_POLLENSLIST] = user_input[CONF_POLLENSLIST]
+            data = {
+                **self._init_info["data"],
+                CONF_POLLENSLIST: user_input.get(CONF_POLLENSLIST, []),
+            }
+            (county, info), *others = self._init_info["counties"].items()
+            for other, _ in others:
+                self.hass.async_create_task(
+                    self.hass.config_entries.flow.async_init(
+                        DOMAIN,
+                        context={"source": config_entries.SOURCE_IMPORT},
+                        data={**data, CONF_COUNTRYCODE: other},
+                    )
+                )
             return self.async_create_entry(
-                title=self._init_info["info"]["title"], data=self._init_info["data"]
+                title=info["title"], data={**data, CONF_COUNTRYCODE: county}
             )
         pollens = [pollen for pollen in KEY_TO_ATTR]
         return self.async_show_form(
@@ -117,6 +171,20 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             ),
         )
 
+    async def async_step_import(self, import_data: dict[str, Any]) -> FlowResult:
+        """Create the entry of another county selected in the user step."""
+        if any(
+            entry.data[CONF_COUNTRYCODE] == import_data[CONF_COUNTRYCODE]
+            for entry in self._async_current_entries()
+        ):
+            return self.async_abort(reason="already_configured")
+        try:
+            # Validated by the user step a moment ago, the client reuses its result
+            info = await validate_input(self.hass, import_data)
+        except (CannotConnect, InvalidCounty):
+            return self.async_abort(reason="cannot_connect")
+        return self.async_create_entry(title=info["title"], data=import_data)
+
     @staticmethod
     @callback
     def async_get_options_flow(
@@ -164,11 +232,37 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             step_id="init",
             data_schema=vol.Schema(
                 {
-                    # Configuration of scan interval mini 3 h max 24h              
+                    # Configuration of scan interval mini 1 h max 24h, unchanged
+                    # bulletins are answered with 304 by conditional requests
                     vol.Optional(
                         CONF_SCAN_INTERVAL,
-                        default=self.config_entry.options.get(CONF_SCAN_INTERVAL, 1),
-                    ): selector.NumberSelector(selector.NumberSelectorConfig(min=3, max=24, mode=selector.NumberSelectorMode.BOX)),
+                        default=self.config_entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+                    ): selector.NumberSelector(selector.NumberSelectorConfig(min=MIN_SCAN_INTERVAL, max=24, mode=selector.NumberSelectorMode.BOX)),
+                    # Level from which a pollen is counted as above threshold
+                    vol.Optional(
+                        CONF_THRESHOLD,
+                        default=self.config_entry.options.get(CONF_THRESHOLD, DEFAULT_THRESHOLD),
+                    ): vol.All(
+                        selector.NumberSelector(selector.NumberSelectorConfig(min=1, max=len(LIST_RISK) - 1, mode=selector.NumberSelectorMode.BOX)),
+                        vol.Coerce(int),
+                    ),
+                    # Hours during which the last bulletin is served when pollens.fr fails
+                    vol.Optional(
+                        CONF_MAX_AGE,
+                        default=self.config_entry.options.get(CONF_MAX_AGE, DEFAULT_MAX_AGE),
+                    ): vol.All(
+                        selector.NumberSelector(selector.NumberSelectorConfig(min=1, max=168, mode=selector.NumberSelectorMode.BOX)),
+                        vol.Coerce(int),
+                    ),
+                    vol.Optional(
+                        CONF_POLLENSLIST,
+                        default=selected_pollens(self.config_entry),
+                    ): cv.multi_select(list(KEY_TO_ATTR)),
+                    # Only create the sensors of the selected pollens
+                    vol.Optional(
+                        CONF_SELECTED_ONLY,
+                        default=self.config_entry.options.get(CONF_SELECTED_ONLY, False),
+                    ): cv.boolean,
                 }
             ),
             errors=errors,
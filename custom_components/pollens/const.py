@@ -1,16 +1,49 @@
 """Constants for the Pollens integration."""
+from datetime import timedelta
 
 DOMAIN = "pollens"
 ATTRIBUTION = "Data from Reseau National de Surveillance Aerobiologique "
 CONF_VERSION = 2
 COORDINATOR = "coordinator"
 UNDO_LISTENER = "undo_listener"
+OPTIONS = "options"
+HUB = "hub"
+CLIENT = "client"
+# Snapshots validated by the config flow, for the setup of their entry
+HANDOFF = "handoff"
+# Seconds during which a handed off snapshot is used
+HANDOFF_TTL = 300
+
+STORAGE_VERSION = 1
+STORAGE_KEY_RESPONSES = f"{DOMAIN}.responses"
+STORAGE_KEY_HISTORY = f"{DOMAIN}.history"
+STORAGE_KEY_PUBLICATIONS = f"{DOMAIN}.publications"
+# Delay (in seconds) used to group the writes of the response cache and history
+STORAGE_SAVE_DELAY = 30
+# Number of days kept in the history of each county
+HISTORY_DAYS = 7
 
 CONF_COUNTRYCODE = "county"
 CONF_SCAN_INTERVAL = "scan_interval"
 CONF_SCANINTERVAL = "scaninterval"
 CONF_POLLENSLIST = "pollens_list"
 CONF_LITERAL = "literal_states"
+CONF_THRESHOLD = "threshold"
+CONF_SELECTED_ONLY = "selected_only"
+CONF_MAX_AGE = "max_age"
+
+DEFAULT_SCAN_INTERVAL = 3
+# Level from which a pollen is counted by the above threshold sensor, and
+# crossed by the threshold events (moyen)
+DEFAULT_THRESHOLD = 2
+MIN_SCAN_INTERVAL = 1
+# Hours during which the last bulletin of a county is served when pollens.fr
+# fails, its entities are unavailable past that age
+DEFAULT_MAX_AGE = 24
+# Maximum number of counties fetched at the same time by the hub coordinator
+MAX_CONCURRENT_REQUESTS = 4
+# Shortest delay between two updates of the hub coordinator
+MIN_UPDATE_INTERVAL = timedelta(minutes=1)
 
 ATTR_TILLEUL = "tilleul"
 ATTR_AMBROISIES = "ambroisies"
@@ -61,7 +94,33 @@ KEY_TO_ATTR = {
     "cupressacées": [ATTR_CUPRESSASEES, ICON_GRASS],
 }
 
+# Aggregate sensor of each pollen category (icon of KEY_TO_ATTR)
+CATEGORIES = {ICON_TREE: "trees", ICON_GRASS: "grasses"}
+
+# Fixed position of each pollen in the levels of a PollensSnapshot
+POLLEN_INDEX = {pollen: index for index, pollen in enumerate(KEY_TO_ATTR)}
+
 ATTR_COUNTY_NAME = "departement"
 ATTR_URL = "url"
+ATTR_STALE = "stale"
+ATTR_DATA_AGE = "data_age"
+ATTR_TREND = "trend"
+ATTR_MAX_7_DAYS = "max_7_days"
+ATTR_DAYS_AT_LEVEL = "days_at_level"
+
+# Key of the global risk level of a county (as named by pollens.fr)
+RISK_LEVEL = "riskLevel"
+# Dispatched with the new selected pollens of an entry (selected only mode)
+SIGNAL_POLLENS_CHANGED = f"{DOMAIN}_pollens_changed_{{}}"
+# Service returning the department of a location
+SERVICE_FIND_DEPARTMENT = "find_department"
+# Fired when a level crosses the threshold of an entry (up or down)
+EVENT_THRESHOLD_CROSSED = f"{DOMAIN}_threshold_crossed"
+# Listener context key of the aggregate sensors, notified when a pollen changed
+AGGREGATES = "aggregates"
+# Listener context key of the diagnostic sensors, notified on every fetch
+DIAGNOSTICS = "diagnostics"
+# Number of fetches kept per county for diagnostics
+FETCH_HISTORY_SIZE = 50
 
 LIST_RISK = ["nul", "faible", "moyen", "élevé"]
@@ -0,0 +1,41 @@
+"""Diagnostics support for Pollens."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_COUNTRYCODE, COORDINATOR, DOMAIN
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
+    county = entry.data[CONF_COUNTRYCODE]
+    snapshot = coordinator.data.get(county)
+    return {
+        "entry": {"data": dict(entry.data), "options": dict(entry.options)},
+        "snapshot": None
+        if snapshot is None
+        else {
+            "county_name": snapshot.county_name,
+            "risk_level": snapshot.risk_level,
+            "levels": {pollen: snapshot.level_of(pollen) for pollen in snapshot.pollens},
+            "updated": snapshot.updated.isoformat(),
+            "stale": snapshot.stale,
+            "data_age": snapshot.age(),
+        },
+        "last_success": coordinator.last_success.get(county),
+        "last_failure": coordinator.last_failure.get(county),
+        "fetch_history": list(coordinator.fetch_history.get(county, [])),
+        "next_poll": coordinator._next_poll.get(county),  # pylint: disable=protected-access
+        "publication_window": coordinator.scheduler.window,
+        "update_interval": coordinator.update_interval.total_seconds(),
+        "client_counters": dict(coordinator.api.counters),
+        "rate_limiter": dict(coordinator.api.limiter.stats),
+        "connection_pool": coordinator.api.pool_stats(),
+        "update_counters": dict(coordinator.update_counters),
+    }
@@ -0,0 +1,1089 @@
+"""Department of a location, from bundled points of the departments."""
+from __future__ import annotations
+
+from math import cos, radians, sqrt
+
+EARTH_RADIUS_KM = 6371.0
+# Overseas locations farther than this from every point are not in a department
+MAX_DISTANCE_KM = 150.0
+
+# Approximate geographic centre (latitude, longitude) of each department of
+# DEPARTMENTS ("20" is the whole of Corsica)
+DEPARTMENT_CENTERS: dict[str, tuple[float, float]] = {
+    "01": (46.10, 5.35),
+    "02": (49.56, 3.56),
+    "03": (46.39, 3.19),
+    "04": (44.10, 6.24),
+    "05": (44.66, 6.26),
+    "06": (43.94, 7.12),
+    "07": (44.75, 4.42),
+    "08": (49.62, 4.63),
+    "09": (42.92, 1.50),
+    "10": (48.30, 4.16),
+    "11": (43.10, 2.41),
+    "12": (44.28, 2.68),
+    "13": (43.54, 5.09),
+    "14": (49.09, -0.36),
+    "15": (45.05, 2.67),
+    "16": (45.72, 0.20),
+    "17": (45.78, -0.67),
+    "18": (47.06, 2.49),
+    "19": (45.36, 1.88),
+    "20": (42.15, 9.10),
+    "21": (47.42, 4.77),
+    "22": (48.44, -2.86),
+    "23": (46.09, 2.02),
+    "24": (45.10, 0.74),
+    "25": (47.17, 6.36),
+    "26": (44.68, 5.17),
+    "27": (49.11, 1.03),
+    "28": (48.39, 1.37),
+    "29": (48.25, -4.06),
+    "30": (43.99, 4.18),
+    "31": (43.36, 1.17),
+    "32": (43.69, 0.45),
+    "33": (44.82, -0.57),
+    "34": (43.58, 3.37),
+    "35": (48.15, -1.64),
+    "36": (46.78, 1.58),
+    "37": (47.26, 0.69),
+    "38": (45.26, 5.58),
+    "39": (46.73, 5.70),
+    "40": (43.97, -0.78),
+    "41": (47.62, 1.43),
+    "42": (45.73, 4.17),
+    "43": (45.13, 3.81),
+    "44": (47.36, -1.68),
+    "45": (47.91, 2.34),
+    "46": (44.62, 1.61),
+    "47": (44.37, 0.46),
+    "48": (44.52, 3.50),
+    "49": (47.39, -0.56),
+    "50": (49.08, -1.33),
+    "51": (48.95, 4.24),
+    "52": (48.11, 5.23),
+    "53": (48.15, -0.66),
+    "54": (48.79, 6.16),
+    "55": (48.99, 5.38),
+    "56": (47.85, -2.81),
+    "57": (49.04, 6.66),
+    "58": (47.12, 3.50),
+    "59": (50.45, 3.20),
+    "60": (49.41, 2.43),
+    "61": (48.62, 0.13),
+    "62": (50.49, 2.29),
+    "63": (45.73, 3.14),
+    "64": (43.26, -0.76),
+    "65": (43.05, 0.16),
+    "66": (42.60, 2.52),
+    "67": (48.67, 7.55),
+    "68": (47.86, 7.27),
+    "69": (45.87, 4.64),
+    "70": (47.64, 6.09),
+    "71": (46.64, 4.54),
+    "72": (48.00, 0.22),
+    "73": (45.48, 6.44),
+    "74": (46.03, 6.43),
+    "75": (48.86, 2.34),
+    "76": (49.66, 1.03),
+    "77": (48.63, 2.93),
+    "78": (48.81, 1.86),
+    "79": (46.55, -0.32),
+    "80": (49.96, 2.28),
+    "81": (43.79, 2.17),
+    "82": (44.08, 1.28),
+    "83": (43.46, 6.22),
+    "84": (44.01, 5.18),
+    "85": (46.67, -1.30),
+    "86": (46.56, 0.46),
+    "87": (45.89, 1.24),
+    "88": (48.20, 6.38),
+    "89": (47.84, 3.56),
+    "90": (47.63, 6.93),
+    "91": (48.52, 2.24),
+    "92": (48.84, 2.25),
+    "93": (48.92, 2.48),
+    "94": (48.78, 2.47),
+    "95": (49.08, 2.13),
+    "971": (16.19, -61.55),
+    "972": (14.65, -61.02),
+    "973": (3.93, -53.13),
+    "974": (-21.13, 55.53),
+    "976": (-12.82, 45.15),
+}
+
+# Prefecture (latitude, longitude) of each department, its largest towns
+# are often far from its centre ("20": Ajaccio, Bastia is in EXTRA_POINTS)
+PREFECTURES: dict[str, tuple[float, float]] = {
+    "01": (46.205, 5.225),
+    "02": (49.564, 3.620),
+    "03": (46.566, 3.333),
+    "04": (44.092, 6.236),
+    "05": (44.559, 6.079),
+    "06": (43.703, 7.266),
+    "07": (44.735, 4.599),
+    "08": (49.773, 4.720),
+    "09": (42.965, 1.607),
+    "10": (48.297, 4.074),
+    "11": (43.213, 2.349),
+    "12": (44.350, 2.575),
+    "13": (43.296, 5.370),
+    "14": (49.183, -0.371),
+    "15": (44.926, 2.440),
+    "16": (45.649, 0.156),
+    "17": (46.160, -1.151),
+    "18": (47.081, 2.398),
+    "19": (45.267, 1.771),
+    "20": (41.919, 8.738),
+    "21": (47.322, 5.041),
+    "22": (48.514, -2.765),
+    "23": (46.171, 1.871),
+    "24": (45.184, 0.721),
+    "25": (47.238, 6.024),
+    "26": (44.933, 4.892),
+    "27": (49.027, 1.151),
+    "28": (48.446, 1.489),
+    "29": (47.996, -4.102),
+    "30": (43.837, 4.360),
+    "31": (43.605, 1.444),
+    "32": (43.646, 0.586),
+    "33": (44.838, -0.579),
+    "34": (43.611, 3.877),
+    "35": (48.117, -1.678),
+    "36": (46.811, 1.686),
+    "37": (47.394, 0.685),
+    "38": (45.188, 5.724),
+    "39": (46.675, 5.555),
+    "40": (43.890, -0.500),
+    "41": (47.586, 1.336),
+    "42": (45.440, 4.387),
+    "43": (45.043, 3.885),
+    "44": (47.218, -1.554),
+    "45": (47.903, 1.909),
+    "46": (44.448, 1.441),
+    "47": (44.203, 0.616),
+    "48": (44.518, 3.500),
+    "49": (47.478, -0.563),
+    "50": (49.116, -1.091),
+    "51": (48.957, 4.363),
+    "52": (48.111, 5.139),
+    "53": (48.073, -0.770),
+    "54": (48.692, 6.184),
+    "55": (48.773, 5.160),
+    "56": (47.658, -2.760),
+    "57": (49.120, 6.176),
+    "58": (46.990, 3.159),
+    "59": (50.629, 3.057),
+    "60": (49.430, 2.081),
+    "61": (48.432, 0.091),
+    "62": (50.291, 2.777),
+    "63": (45.778, 3.087),
+    "64": (43.295, -0.370),
+    "65": (43.233, 0.078),
+    "66": (42.699, 2.895),
+    "67": (48.573, 7.752),
+    "68": (48.079, 7.358),
+    "69": (45.764, 4.836),
+    "70": (47.622, 6.155),
+    "71": (46.307, 4.828),
+    "72": (48.006, 0.199),
+    "73": (45.564, 5.918),
+    "74": (45.899, 6.129),
+    "75": (48.857, 2.352),
+    "76": (49.443, 1.099),
+    "77": (48.540, 2.660),
+    "78": (48.805, 2.120),
+    "79": (46.323, -0.465),
+    "80": (49.894, 2.296),
+    "81": (43.929, 2.148),
+    "82": (44.018, 1.355),
+    "83": (43.124, 5.928),
+    "84": (43.949, 4.806),
+    "85": (46.670, -1.427),
+    "86": (46.580, 0.340),
+    "87": (45.834, 1.261),
+    "88": (48.172, 6.449),
+    "89": (47.798, 3.567),
+    "90": (47.640, 6.863),
+    "91": (48.629, 2.441),
+    "92": (48.892, 2.207),
+    "93": (48.908, 2.439),
+    "94": (48.790, 2.455),
+    "95": (49.036, 2.076),
+    "971": (15.998, -61.726),
+    "972": (14.616, -61.059),
+    "973": (4.937, -52.326),
+    "974": (-20.882, 55.450),
+    "976": (-12.780, 45.228),
+}
+
+# Sub-prefectures of metropolitan France, and towns closer to a point of
+# another department (the closest point wins): a location a few kilometres
+# from the border of its department may still be given the neighbouring one
+EXTRA_POINTS: list[tuple[str, float, float]] = [
+    ("01", 46.431, 4.936),  # Pont-de-Vaux
+    ("01", 46.333, 6.058),  # Gex
+    ("01", 46.260, 5.660),  # Oyonnax
+    ("01", 46.153, 5.607),  # Nantua
+    ("01", 46.118, 4.957),  # Châtillon-sur-Chalaronne
+    ("01", 46.108, 5.826),  # Valserhône
+    ("01", 45.976, 5.601),  # Hauteville-Lompnes
+    ("01", 45.958, 5.357),  # Ambérieu-en-Bugey
+    ("01", 45.941, 4.773),  # Trévoux
+    ("01", 45.851, 5.057),  # Montluel
+    ("01", 45.830, 4.950),  # Miribel
+    ("01", 45.759, 5.688),  # Belley
+    ("02", 49.922, 4.083),  # Hirson
+    ("02", 49.900, 3.628),  # Guise
+    ("02", 49.848, 3.287),  # Saint-Quentin
+    ("02", 49.835, 3.909),  # Vervins
+    ("02", 49.663, 3.366),  # La Fère
+    ("02", 49.615, 3.219),  # Chauny
+    ("02", 49.381, 3.323),  # Soissons
+    ("02", 49.253, 3.090),  # Villers-Cotterêts
+    ("02", 49.200, 3.517),  # Fère-en-Tardenois
+    ("02", 49.046, 3.403),  # Château-Thierry
+    ("03", 46.618, 2.821),  # Cérilly
+    ("03", 46.565, 3.355),  # Yzeure
+    ("03", 46.516, 3.683),  # Dompierre-sur-Besbre
+    ("03", 46.340, 2.603),  # Montluçon
+    ("03", 46.307, 3.290),  # Saint-Pourçain-sur-Sioule
+    ("03", 46.128, 3.426),  # Vichy
+    ("03", 46.100, 3.198),  # Gannat
+    ("04", 44.387, 6.652),  # Barcelonnette
+    ("04", 44.350, 6.356),  # Seyne
+    ("04", 44.195, 5.944),  # Sisteron
+    ("04", 43.960, 5.780),  # Forcalquier
+    ("04", 43.917, 5.918),  # Oraison
+    ("04", 43.847, 6.513),  # Castellane
+    ("04", 43.830, 5.790),  # Manosque
+    ("04", 43.818, 6.093),  # Riez
+    ("04", 43.786, 5.766),  # Sainte-Tulle
+    ("05", 44.897, 6.636),  # Briançon
+    ("05", 44.660, 6.649),  # Guillestre
+    ("05", 44.564, 6.495),  # Embrun
+    ("05", 44.534, 5.823),  # Veynes
+    ("05", 44.428, 5.717),  # Serres
+    ("05", 44.315, 5.821),  # Laragne
+    ("06", 43.956, 6.894),  # Puget-Théniers
+    ("06", 43.775, 7.497),  # Menton
+    ("06", 43.723, 7.113),  # Vence
+    ("06", 43.664, 7.149),  # Cagnes-sur-Mer
+    ("06", 43.658, 6.924),  # Grasse
+    ("06", 43.580, 7.125),  # Antibes
+    ("06", 43.552, 7.017),  # Cannes
+    ("07", 45.240, 4.670),  # Annonay
+    ("07", 45.067, 4.833),  # Tournon-sur-Rhône
+    ("07", 44.987, 4.580),  # Lamastre
+    ("07", 44.907, 4.424),  # Le Cheylard
+    ("07", 44.620, 4.390),  # Aubenas
+    ("07", 44.545, 4.683),  # Le Teil
+    ("07", 44.543, 4.293),  # Largentière
+    ("07", 44.405, 4.131),  # Les Vans
+    ("07", 44.373, 4.644),  # Bourg-Saint-Andéol
+    ("08", 50.137, 4.825),  # Givet
+    ("08", 49.940, 4.636),  # Revin
+    ("08", 49.814, 4.748),  # Nouzonville
+    ("08", 49.702, 4.940),  # Sedan
+    ("08", 49.633, 5.168),  # Carignan
+    ("08", 49.509, 4.367),  # Rethel
+    ("08", 49.398, 4.700),  # Vouziers
+    ("09", 43.116, 1.611),  # Pamiers
+    ("09", 43.088, 1.874),  # Mirepoix
+    ("09", 42.985, 1.146),  # Saint-Girons
+    ("09", 42.931, 1.848),  # Lavelanet
+    ("09", 42.845, 1.605),  # Tarascon
+    ("09", 42.720, 1.838),  # Ax-les-Thermes
+    ("10", 48.534, 4.141),  # Arcis-sur-Aube
+    ("10", 48.516, 3.727),  # Romilly-sur-Seine
+    ("10", 48.494, 3.502),  # Nogent-sur-Seine
+    ("10", 48.392, 4.528),  # Brienne-le-Château
+    ("10", 48.233, 4.706),  # Bar-sur-Aube
+    ("10", 48.113, 4.375),  # Bar-sur-Seine
+    ("11", 43.318, 1.954),  # Castelnaudary
+    ("11", 43.244, 2.115),  # Bram
+    ("11", 43.200, 2.757),  # Lézignan-Corbières
+    ("11", 43.184, 3.004),  # Narbonne
+    ("11", 43.054, 2.219),  # Limoux
+    ("11", 43.029, 2.976),  # Sigean
+    ("11", 42.876, 2.185),  # Quillan
+    ("12", 44.684, 2.847),  # Laguiole
+    ("12", 44.560, 2.250),  # Decazeville
+    ("12", 44.522, 2.763),  # Espalion
+    ("12", 44.410, 2.291),  # Rignac
+    ("12", 44.352, 2.035),  # Villefranche-de-Rouergue
+    ("12", 44.098, 3.078),  # Millau
+    ("12", 43.957, 2.887),  # Saint-Affrique
+    ("13", 43.882, 4.855),  # Châteaurenard
+    ("13", 43.806, 4.660),  # Tarascon
+    ("13", 43.677, 4.631),  # Arles
+    ("13", 43.640, 5.097),  # Salon-de-Provence
+    ("13", 43.529, 5.447),  # Aix-en-Provence
+    ("13", 43.514, 4.988),  # Istres
+    ("13", 43.455, 5.470),  # Gardanne
+    ("13", 43.405, 5.048),  # Martigues
+    ("13", 43.292, 5.571),  # Aubagne
+    ("13", 43.175, 5.605),  # La Ciotat
+    ("14", 49.420, 0.230),  # Honfleur
+    ("14", 49.366, 0.083),  # Trouville-sur-Mer
+    ("14", 49.357, 0.071),  # Deauville
+    ("14", 49.276, -0.703),  # Bayeux
+    ("14", 49.146, 0.226),  # Lisieux
+    ("14", 49.090, -0.803),  # Caumont
+    ("14", 48.896, -0.192),  # Falaise
+    ("14", 48.853, -0.552),  # Condé-sur-Noireau
+    ("14", 48.838, -0.889),  # Vire
+    ("15", 45.282, 2.659),  # Riom-ès-Montagnes
+    ("15", 45.218, 2.334),  # Mauriac
+    ("15", 45.110, 2.869),  # Murat
+    ("15", 45.034, 3.093),  # Saint-Flour
+    ("15", 44.853, 3.003),  # Chaudes-Aigues
+    ("15", 44.710, 2.198),  # Maurs
+    ("16", 46.028, 0.197),  # Ruffec
+    ("16", 46.014, 0.672),  # Confolens
+    ("16", 45.740, 0.386),  # La Rochefoucauld
+    ("16", 45.696, -0.329),  # Cognac
+    ("16", 45.473, -0.155),  # Barbezieux
+    ("16", 45.274, 0.038),  # Chalais
+    ("17", 46.108, -0.752),  # Surgères
+    ("17", 45.946, -0.521),  # Saint-Jean-d'Angély
+    ("17", 45.942, -0.958),  # Rochefort
+    ("17", 45.822, -1.104),  # Marennes
+    ("17", 45.746, -0.633),  # Saintes
+    ("17", 45.624, -1.029),  # Royan
+    ("17", 45.446, -0.434),  # Jonzac
+    ("17", 45.284, -0.408),  # Montendre
+    ("18", 47.489, 2.438),  # Aubigny-sur-Nère
+    ("18", 47.331, 2.837),  # Sancerre
+    ("18", 47.222, 2.068),  # Vierzon
+    ("18", 46.832, 2.920),  # Sancoins
+    ("18", 46.750, 2.174),  # Lignières
+    ("18", 46.723, 2.505),  # Saint-Amand-Montrond
+    ("19", 45.548, 2.310),  # Ussel
+    ("19", 45.536, 2.146),  # Meymac
+    ("19", 45.406, 2.048),  # Égletons
+    ("19", 45.159, 1.533),  # Brive-la-Gaillarde
+    ("19", 45.094, 1.938),  # Argentat
+    ("19", 44.979, 1.838),  # Beaulieu-sur-Dordogne
+    ("20", 42.697, 9.450),  # Bastia
+    ("20", 42.681, 9.303),  # Saint-Florent
+    ("20", 42.634, 8.938),  # L'Île-Rousse
+    ("20", 42.567, 8.757),  # Calvi
+    ("20", 42.306, 9.149),  # Corte
+    ("20", 42.016, 9.406),  # Ghisonaccia
+    ("20", 41.676, 8.904),  # Propriano
+    ("20", 41.622, 8.975),  # Sartène
+    ("20", 41.591, 9.279),  # Porto-Vecchio
+    ("21", 47.859, 4.574),  # Châtillon-sur-Seine
+    ("21", 47.623, 4.338),  # Montbard
+    ("21", 47.525, 5.107),  # Is-sur-Tille
+    ("21", 47.491, 4.334),  # Semur-en-Auxois
+    ("21", 47.281, 4.229),  # Saulieu
+    ("21", 47.190, 5.390),  # Auxonne
+    ("21", 47.137, 4.950),  # Nuits-Saint-Georges
+    ("21", 47.025, 4.840),  # Beaune
+    ("22", 48.778, -3.049),  # Paimpol
+    ("22", 48.732, -3.456),  # Lannion
+    ("22", 48.563, -3.150),  # Guingamp
+    ("22", 48.469, -2.516),  # Lamballe
+    ("22", 48.455, -2.050),  # Dinan
+    ("22", 48.318, -2.259),  # Broons
+    ("22", 48.235, -3.317),  # Rostrenen
+    ("22", 48.178, -2.754),  # Loudéac
+    ("23", 46.349, 2.218),  # Boussac
+    ("23", 46.237, 1.487),  # La Souterraine
+    ("23", 45.956, 2.168),  # Aubusson
+    ("23", 45.954, 1.756),  # Bourganeuf
+    ("23", 45.883, 2.174),  # Felletin
+    ("23", 45.702, 2.259),  # La Courtine
+    ("24", 45.529, 0.662),  # Nontron
+    ("24", 45.414, 0.919),  # Thiviers
+    ("24", 45.339, 1.048),  # Excideuil
+    ("24", 45.250, 0.339),  # Ribérac
+    ("24", 44.890, 1.216),  # Sarlat-la-Canéda
+    ("24", 44.890, 1.216),  # Sarlat
+    ("24", 44.853, 0.483),  # Bergerac
+    ("24", 44.838, 0.745),  # Lalinde
+    ("25", 47.510, 6.798),  # Montbéliard
+    ("25", 47.481, 6.356),  # Rougemont
+    ("25", 47.352, 6.361),  # Baume-les-Dames
+    ("25", 47.252, 6.803),  # Maîche
+    ("25", 47.106, 6.144),  # Ornans
+    ("25", 47.058, 6.608),  # Morteau
+    ("25", 46.904, 6.355),  # Pontarlier
+    ("25", 46.709, 6.193),  # Mouthe
+    ("26", 45.176, 4.817),  # Saint-Vallier
+    ("26", 45.043, 5.051),  # Romans-sur-Isère
+    ("26", 44.754, 5.370),  # Die
+    ("26", 44.728, 5.022),  # Crest
+    ("26", 44.560, 4.750),  # Montélimar
+    ("26", 44.526, 5.066),  # Dieulefit
+    ("26", 44.378, 4.697),  # Pierrelatte
+    ("26", 44.361, 5.140),  # Nyons
+    ("27", 49.399, 1.477),  # Lyons-la-Forêt
+    ("27", 49.360, 0.520),  # Pont-Audemer
+    ("27", 49.281, 1.777),  # Gisors
+    ("27", 49.246, 1.412),  # Les Andelys
+    ("27", 49.093, 1.485),  # Vernon
+    ("27", 49.089, 0.598),  # Bernay
+    ("27", 48.907, 1.275),  # Saint-André-de-l'Eure
+    ("27", 48.739, 0.927),  # Verneuil-sur-Avre
+    ("28", 48.737, 1.366),  # Dreux
+    ("28", 48.647, 1.529),  # Nogent-le-Roi
+    ("28", 48.462, 1.772),  # Auneau
+    ("28", 48.321, 0.822),  # Nogent-le-Rotrou
+    ("28", 48.212, 1.165),  # Brou
+    ("28", 48.183, 1.386),  # Bonneval
+    ("28", 48.071, 1.338),  # Châteaudun
+    ("29", 48.578, -3.828),  # Morlaix
+    ("29", 48.510, -4.068),  # Landivisiau
+    ("29", 48.451, -4.249),  # Landerneau
+    ("29", 48.390, -4.486),  # Brest
+    ("29", 48.276, -3.573),  # Carhaix
+    ("29", 48.197, -4.090),  # Châteaulin
+    ("29", 48.093, -4.329),  # Douarnenez
+    ("29", 47.875, -3.918),  # Concarneau
+    ("29", 47.873, -3.549),  # Quimperlé
+    ("30", 44.257, 4.648),  # Pont-Saint-Esprit
+    ("30", 44.160, 4.620),  # Bagnols-sur-Cèze
+    ("30", 44.125, 4.081),  # Alès
+    ("30", 44.012, 4.420),  # Uzès
+    ("30", 43.991, 3.606),  # Le Vigan
+    ("30", 43.963, 3.856),  # Saint-Hippolyte-du-Fort
+    ("30", 43.810, 4.640),  # Beaucaire
+    ("30", 43.785, 4.089),  # Sommières
+    ("30", 43.694, 4.276),  # Vauvert
+    ("30", 43.567, 4.192),  # Aigues-Mortes
+    ("31", 43.839, 1.389),  # Fronton
+    ("31", 43.772, 1.294),  # Grenade
+    ("31", 43.461, 1.327),  # Muret
+    ("31", 43.458, 2.004),  # Revel
+    ("31", 43.400, 1.717),  # Villefranche-de-Lauragais
+    ("31", 43.207, 1.085),  # Cazères
+    ("31", 43.108, 0.723),  # Saint-Gaudens
+    ("31", 42.789, 0.593),  # Bagnères-de-Luchon
+    ("32", 43.958, 0.372),  # Condom
+    ("32", 43.934, 0.621),  # Lectoure
+    ("32", 43.861, 0.102),  # Eauze
+    ("32", 43.758, -0.033),  # Nogaro
+    ("32", 43.613, 1.082),  # L'Isle-Jourdain
+    ("32", 43.515, 0.404),  # Mirande
+    ("32", 43.475, 0.912),  # Lombez
+    ("33", 45.307, -0.938),  # Lesparre-Médoc
+    ("33", 45.307, -0.938),  # Lesparre
+    ("33", 45.128, -0.662),  # Blaye
+    ("33", 45.002, -1.083),  # Lacanau
+    ("33", 45.000, -0.446),  # Saint-André-de-Cubzac
+    ("33", 44.915, -0.244),  # Libourne
+    ("33", 44.838, 0.219),  # Sainte-Foy-la-Grande
+    ("33", 44.658, -1.168),  # Arcachon
+    ("33", 44.583, -0.037),  # La Réole
+    ("33", 44.553, -0.249),  # Langon
+    ("33", 44.432, -0.213),  # Bazas
+    ("34", 43.934, 3.708),  # Ganges
+    ("34", 43.731, 3.319),  # Lodève
+    ("34", 43.676, 4.135),  # Lunel
+    ("34", 43.616, 3.157),  # Bédarieux
+    ("34", 43.489, 2.766),  # Saint-Pons-de-Thomières
+    ("34", 43.459, 3.423),  # Pézenas
+    ("34", 43.403, 3.693),  # Sète
+    ("34", 43.344, 3.216),  # Béziers
+    ("35", 48.649, -2.026),  # Saint-Malo
+    ("35", 48.411, -1.751),  # Combourg
+    ("35", 48.352, -1.199),  # Fougères
+    ("35", 48.259, -1.399),  # Saint-Aubin-du-Cormier
+    ("35", 48.137, -1.956),  # Montfort
+    ("35", 48.124, -1.209),  # Vitré
+    ("35", 47.961, -1.498),  # Janzé
+    ("35", 47.843, -1.682),  # Bain-de-Bretagne
+    ("35", 47.652, -2.084),  # Redon
+    ("36", 47.161, 1.564),  # Valençay
+    ("36", 46.948, 1.993),  # Issoudun
+    ("36", 46.888, 1.421),  # Buzançais
+    ("36", 46.634, 1.063),  # Le Blanc
+    ("36", 46.588, 1.520),  # Argenton
+    ("36", 46.582, 1.988),  # La Châtre
+    ("36", 46.440, 1.581),  # Éguzon
+    ("37", 47.603, 0.594),  # Neuvy-le-Roi
+    ("37", 47.593, 0.911),  # Château-Renault
+    ("37", 47.412, 0.982),  # Amboise
+    ("37", 47.283, 0.169),  # Bourgueil
+    ("37", 47.167, 0.242),  # Chinon
+    ("37", 47.128, 0.995),  # Loches
+    ("37", 47.111, 0.621),  # Sainte-Maure-de-Touraine
+    ("38", 45.725, 5.251),  # Crémieu
+    ("38", 45.586, 5.274),  # Bourgoin-Jallieu
+    ("38", 45.566, 5.445),  # La Tour-du-Pin
+    ("38", 45.525, 4.874),  # Vienne
+    ("38", 45.373, 4.813),  # Roussillon
+    ("38", 45.364, 5.589),  # Voiron
+    ("38", 45.151, 5.320),  # Saint-Marcellin
+    ("38", 45.055, 6.030),  # Le Bourg-d'Oisans
+    ("38", 44.816, 5.751),  # Mens
+    ("39", 47.093, 5.490),  # Dole
+    ("39", 46.903, 5.775),  # Arbois
+    ("39", 46.837, 5.706),  # Poligny
+    ("39", 46.747, 5.910),  # Champagnole
+    ("39", 46.525, 6.026),  # Morez
+    ("39", 46.520, 5.611),  # Orgelet
+    ("39", 46.387, 5.864),  # Saint-Claude
+    ("40", 44.394, -1.164),  # Biscarrosse
+    ("40", 44.200, -1.230),  # Mimizan
+    ("40", 43.710, -1.053),  # Dax
+    ("40", 43.701, -0.263),  # Aire-sur-l'Adour
+    ("40", 43.658, -0.591),  # Hagetmau
+    ("40", 43.547, -1.106),  # Peyrehorade
+    ("41", 47.982, 0.897),  # Mondoubleau
+    ("41", 47.793, 1.066),  # Vendôme
+    ("41", 47.705, 1.507),  # Mer
+    ("41", 47.425, 2.052),  # Salbris
+    ("41", 47.359, 1.741),  # Romorantin-Lanthenay
+    ("41", 47.359, 1.741),  # Romorantin
+    ("41", 47.343, 1.181),  # Montrichard
+    ("42", 46.161, 4.172),  # Charlieu
+    ("42", 46.036, 4.068),  # Roanne
+    ("42", 45.744, 4.004),  # Boën
+    ("42", 45.743, 4.225),  # Feurs
+    ("42", 45.608, 4.065),  # Montbrison
+    ("42", 45.530, 4.620),  # Rive-de-Gier
+    ("42", 45.477, 4.514),  # Saint-Chamond
+    ("43", 45.332, 3.849),  # Craponne
+    ("43", 45.294, 3.384),  # Brioude
+    ("43", 45.292, 4.172),  # Monistrol-sur-Loire
+    ("43", 45.143, 4.124),  # Yssingeaux
+    ("43", 45.101, 3.494),  # Langeac
+    ("43", 44.960, 3.547),  # Saugues
+    ("44", 47.717, -1.376),  # Châteaubriant
+    ("44", 47.438, -1.498),  # Nort-sur-Erdre
+    ("44", 47.365, -1.177),  # Ancenis
+    ("44", 47.328, -2.429),  # Guérande
+    ("44", 47.273, -2.214),  # Saint-Nazaire
+    ("44", 47.115, -2.102),  # Pornic
+    ("44", 47.087, -1.282),  # Clisson
+    ("45", 48.296, 2.409),  # Malesherbes
+    ("45", 48.172, 2.252),  # Pithiviers
+    ("45", 47.998, 2.733),  # Montargis
+    ("45", 47.779, 1.632),  # Beaugency
+    ("45", 47.766, 2.375),  # Sully-sur-Loire
+    ("45", 47.686, 2.630),  # Gien
+    ("45", 47.637, 2.742),  # Briare
+    ("46", 44.897, 1.478),  # Souillac
+    ("46", 44.858, 1.893),  # Saint-Céré
+    ("46", 44.781, 1.724),  # Gramat
+    ("46", 44.737, 1.383),  # Gourdon
+    ("46", 44.609, 2.032),  # Figeac
+    ("46", 44.268, 1.362),  # Castelnau-Montratier
+    ("47", 44.532, 0.767),  # Monflanquin
+    ("47", 44.500, 0.165),  # Marmande
+    ("47", 44.498, 0.958),  # Fumel
+    ("47", 44.408, 0.705),  # Villeneuve-sur-Lot
+    ("47", 44.391, 0.309),  # Tonneins
+    ("47", 44.313, 0.087),  # Casteljaloux
+    ("47", 44.136, 0.339),  # Nérac
+    ("48", 44.801, 3.274),  # Saint-Chély-d'Apcher
+    ("48", 44.727, 3.856),  # Langogne
+    ("48", 44.554, 3.291),  # Marvejols
+    ("48", 44.324, 3.593),  # Florac
+    ("48", 44.178, 3.431),  # Meyrueis
+    ("49", 47.686, -0.872),  # Segré
+    ("49", 47.541, -0.104),  # Baugé-en-Anjou
+    ("49", 47.350, -0.762),  # Chalonnes
+    ("49", 47.260, -0.077),  # Saumur
+    ("49", 47.193, -0.275),  # Doué-la-Fontaine
+    ("49", 47.131, -0.153),  # Montreuil-Bellay
+    ("49", 47.060, -0.879),  # Cholet
+    ("50", 49.640, -1.616),  # Cherbourg
+    ("50", 49.509, -1.470),  # Valognes
+    ("50", 49.384, -1.747),  # Barneville-Carteret
+    ("50", 49.048, -1.445),  # Coutances
+    ("50", 48.838, -1.597),  # Granville
+    ("50", 48.685, -1.357),  # Avranches
+    ("50", 48.648, -0.941),  # Mortain
+    ("50", 48.577, -1.092),  # Saint-Hilaire-du-Harcouët
+    ("51", 49.308, 3.685),  # Fismes
+    ("51", 49.258, 4.032),  # Reims
+    ("51", 49.130, 4.532),  # Suippes
+    ("51", 49.090, 4.897),  # Sainte-Menehould
+    ("51", 49.040, 3.960),  # Épernay
+    ("51", 48.872, 3.541),  # Montmirail
+    ("51", 48.725, 4.585),  # Vitry-le-François
+    ("51", 48.721, 3.723),  # Sézanne
+    ("52", 48.638, 4.950),  # Saint-Dizier
+    ("52", 48.478, 4.770),  # Montier-en-Der
+    ("52", 48.443, 5.141),  # Joinville
+    ("52", 48.030, 5.350),  # Nogent (Haute-Marne)
+    ("52", 47.954, 5.748),  # Bourbonne-les-Bains
+    ("52", 47.862, 5.333),  # Langres
+    ("53", 48.304, -0.614),  # Mayenne
+    ("53", 48.298, -0.932),  # Ernée
+    ("53", 48.156, -0.400),  # Évron
+    ("53", 47.952, -0.553),  # Meslay-du-Maine
+    ("53", 47.848, -0.949),  # Craon
+    ("53", 47.829, -0.703),  # Château-Gontier
+    ("54", 49.519, 5.766),  # Longwy
+    ("54", 49.249, 5.939),  # Briey
+    ("54", 48.905, 6.054),  # Pont-à-Mousson
+    ("54", 48.890, 6.227),  # Nomeny
+    ("54", 48.675, 5.891),  # Toul
+    ("54", 48.591, 6.496),  # Lunéville
+    ("54", 48.527, 5.898),  # Colombey-les-Belles
+    ("54", 48.450, 6.739),  # Baccarat
+    ("55", 49.494, 5.187),  # Stenay
+    ("55", 49.212, 5.640),  # Étain
+    ("55", 49.160, 5.384),  # Verdun
+    ("55", 48.888, 5.543),  # Saint-Mihiel
+    ("55", 48.763, 5.592),  # Commercy
+    ("55", 48.689, 5.325),  # Ligny-en-Barrois
+    ("56", 48.139, -3.604),  # Gourin
+    ("56", 48.068, -2.963),  # Pontivy
+    ("56", 47.932, -2.397),  # Ploërmel
+    ("56", 47.809, -2.383),  # Malestroit
+    ("56", 47.748, -3.370),  # Lorient
+    ("56", 47.668, -2.982),  # Auray
+    ("56", 47.661, -2.452),  # Questembert
+    ("57", 49.358, 6.168),  # Thionville
+    ("57", 49.188, 6.896),  # Forbach
+    ("57", 49.183, 6.495),  # Boulay-Moselle
+    ("57", 49.110, 7.069),  # Sarreguemines
+    ("57", 49.104, 6.707),  # Saint-Avold
+    ("57", 49.052, 7.430),  # Bitche
+    ("57", 48.819, 6.513),  # Château-Salins
+    ("57", 48.812, 6.718),  # Dieuze
+    ("57", 48.734, 7.054),  # Sarrebourg
+    ("58", 47.460, 3.520),  # Clamecy
+    ("58", 47.411, 2.925),  # Cosne-Cours-sur-Loire
+    ("58", 47.170, 3.330),  # Prémery
+    ("58", 47.064, 3.934),  # Château-Chinon
+    ("58", 46.828, 3.461),  # Decize
+    ("58", 46.793, 3.117),  # Saint-Pierre-le-Moûtier
+    ("58", 46.790, 3.970),  # Luzy
+    ("59", 51.034, 2.377),  # Dunkerque
+    ("59", 50.738, 2.735),  # Bailleul
+    ("59", 50.724, 2.539),  # Hazebrouck
+    ("59", 50.688, 2.881),  # Armentières
+    ("59", 50.370, 3.080),  # Douai
+    ("59", 50.358, 3.523),  # Valenciennes
+    ("59", 50.278, 3.973),  # Maubeuge
+    ("59", 50.248, 3.636),  # Le Quesnoy
+    ("59", 50.176, 3.235),  # Cambrai
+    ("59", 50.123, 3.927),  # Avesnes-sur-Helpe
+    ("59", 50.123, 3.927),  # Avesnes
+    ("59", 50.104, 3.543),  # Le Cateau-Cambrésis
+    ("60", 49.649, 1.731),  # Formerie
+    ("60", 49.582, 3.000),  # Noyon
+    ("60", 49.418, 2.826),  # Compiègne
+    ("60", 49.379, 2.413),  # Clermont
+    ("60", 49.236, 2.134),  # Méru
+    ("60", 49.235, 2.890),  # Crépy-en-Valois
+    ("60", 49.207, 2.586),  # Senlis
+    ("60", 49.194, 2.471),  # Chantilly
+    ("61", 48.765, 0.628),  # L'Aigle
+    ("61", 48.750, -0.570),  # Flers
+    ("61", 48.744, -0.020),  # Argentan
+    ("61", 48.593, -0.646),  # Domfront
+    ("61", 48.591, -0.359),  # La Ferté-Macé
+    ("61", 48.520, 0.547),  # Mortagne-au-Perche
+    ("61", 48.520, 0.547),  # Mortagne
+    ("61", 48.375, 0.560),  # Bellême
+    ("62", 50.951, 1.858),  # Calais
+    ("62", 50.813, 1.707),  # Marquise
+    ("62", 50.750, 2.252),  # Saint-Omer
+    ("62", 50.726, 1.614),  # Boulogne-sur-Mer
+    ("62", 50.530, 2.640),  # Béthune
+    ("62", 50.516, 2.133),  # Fruges
+    ("62", 50.464, 1.764),  # Montreuil (Seine-Saint-Denis)
+    ("62", 50.432, 2.832),  # Lens
+    ("62", 50.374, 2.038),  # Hesdin
+    ("62", 50.103, 2.850),  # Bapaume
+    ("63", 46.157, 2.829),  # Saint-Éloy-les-Mines
+    ("63", 45.894, 3.113),  # Riom
+    ("63", 45.856, 3.547),  # Thiers
+    ("63", 45.755, 3.538),  # Courpière
+    ("63", 45.576, 2.809),  # Le Mont-Dore
+    ("63", 45.550, 3.742),  # Ambert
+    ("63", 45.544, 3.249),  # Issoire
+    ("63", 45.508, 2.933),  # Besse-et-Saint-Anastaise
+    ("64", 43.562, -0.272),  # Garlin
+    ("64", 43.493, -1.475),  # Bayonne
+    ("64", 43.488, -0.772),  # Orthez
+    ("64", 43.483, -1.559),  # Biarritz
+    ("64", 43.359, -1.775),  # Hendaye
+    ("64", 43.321, -0.758),  # Navarrenx
+    ("64", 43.226, -0.887),  # Mauléon (Deux-Sèvres)
+    ("64", 43.194, -0.607),  # Oloron-Sainte-Marie
+    ("64", 43.163, -1.238),  # Saint-Jean-Pied-de-Port
+    ("65", 43.386, 0.054),  # Vic-en-Bigorre
+    ("65", 43.297, 0.500),  # Castelnau-Magnoac
+    ("65", 43.125, 0.384),  # Lannemezan
+    ("65", 43.095, -0.046),  # Lourdes
+    ("65", 43.065, 0.149),  # Bagnères-de-Bigorre
+    ("65", 43.003, -0.099),  # Argelès-Gazost
+    ("66", 42.810, 2.503),  # Saint-Paul-de-Fenouillet
+    ("66", 42.769, 2.873),  # Rivesaltes
+    ("66", 42.617, 2.422),  # Prades
+    ("66", 42.546, 3.023),  # Argelès-sur-Mer
+    ("66", 42.505, 2.040),  # Font-Romeu
+    ("66", 42.486, 2.748),  # Céret
+    ("67", 49.037, 7.945),  # Wissembourg
+    ("67", 48.868, 7.190),  # Drulingen
+    ("67", 48.816, 7.790),  # Haguenau
+    ("67", 48.766, 7.857),  # Bischwiller
+    ("67", 48.741, 7.362),  # Saverne
+    ("67", 48.542, 7.492),  # Molsheim
+    ("67", 48.462, 7.482),  # Obernai
+    ("67", 48.423, 7.663),  # Erstein
+    ("67", 48.259, 7.454),  # Sélestat
+    ("68", 48.195, 7.319),  # Ribeauvillé
+    ("68", 48.041, 7.135),  # Munster
+    ("68", 47.909, 7.210),  # Guebwiller
+    ("68", 47.808, 7.103),  # Thann
+    ("68", 47.750, 7.336),  # Mulhouse
+    ("68", 47.624, 7.239),  # Altkirch
+    ("68", 47.590, 7.559),  # Saint-Louis (Haut-Rhin)
+    ("68", 47.494, 7.314),  # Ferrette
+    ("69", 46.154, 4.586),  # Beaujeu
+    ("69", 46.109, 4.749),  # Belleville
+    ("69", 45.990, 4.718),  # Villefranche-sur-Saône
+    ("69", 45.896, 4.433),  # Tarare
+    ("69", 45.632, 4.456),  # Saint-Symphorien-sur-Coise
+    ("69", 45.590, 4.770),  # Givors
+    ("70", 47.886, 6.276),  # Saint-Loup-sur-Semouse
+    ("70", 47.825, 5.903),  # Jussey
+    ("70", 47.817, 6.381),  # Luxeuil-les-Bains
+    ("70", 47.684, 6.497),  # Lure
+    ("70", 47.577, 6.762),  # Héricourt
+    ("70", 47.445, 5.592),  # Gray
+    ("70", 47.290, 5.774),  # Marnay
+    ("71", 46.951, 4.299),  # Autun
+    ("71", 46.807, 4.417),  # Le Creusot
+    ("71", 46.781, 4.854),  # Chalon-sur-Saône
+    ("71", 46.627, 5.225),  # Louhans
+    ("71", 46.622, 3.770),  # Bourbon-Lancy
+    ("71", 46.563, 4.908),  # Tournus
+    ("71", 46.481, 3.980),  # Digoin
+    ("71", 46.435, 4.276),  # Charolles
+    ("71", 46.434, 4.659),  # Cluny
+    ("72", 48.350, 0.369),  # Mamers
+    ("72", 48.183, -0.128),  # Sillé-le-Guillaume
+    ("72", 47.921, 0.745),  # Saint-Calais
+    ("72", 47.840, -0.333),  # Sablé-sur-Sarthe
+    ("72", 47.699, -0.076),  # La Flèche
+    ("72", 47.695, 0.418),  # Château-du-Loir
+    ("73", 45.688, 5.915),  # Aix-les-Bains
+    ("73", 45.676, 6.392),  # Albertville
+    ("73", 45.618, 6.769),  # Bourg-Saint-Maurice
+    ("73", 45.536, 5.671),  # Le Pont-de-Beauvoisin
+    ("73", 45.485, 6.532),  # Moûtiers
+    ("73", 45.277, 6.345),  # Saint-Jean-de-Maurienne
+    ("73", 45.200, 6.670),  # Modane
+    ("74", 46.401, 6.590),  # Évian-les-Bains
+    ("74", 46.371, 6.479),  # Thonon-les-Bains
+    ("74", 46.281, 6.721),  # Abondance
+    ("74", 46.190, 6.240),  # Annemasse
+    ("74", 46.144, 6.081),  # Saint-Julien-en-Genevois
+    ("74", 46.078, 6.401),  # Bonneville
+    ("74", 46.061, 6.580),  # Cluses
+    ("74", 45.936, 6.633),  # Sallanches
+    ("74", 45.924, 6.870),  # Chamonix
+    ("74", 45.867, 5.944),  # Rumilly
+    ("74", 45.748, 6.294),  # Faverges
+    ("75", 48.892, 2.348),  # Paris 18e
+    ("75", 48.887, 2.305),  # Paris 17e
+    ("75", 48.885, 2.318),  # Paris (Batignolles)
+    ("75", 48.880, 2.355),  # Paris (Gare du Nord)
+    ("75", 48.878, 2.283),  # Paris (Porte Maillot)
+    ("75", 48.871, 2.332),  # Paris (Opéra)
+    ("75", 48.865, 2.400),  # Paris 20e
+    ("75", 48.862, 2.288),  # Paris (Trocadéro)
+    ("75", 48.861, 2.393),  # Paris (Père-Lachaise)
+    ("75", 48.855, 2.270),  # Paris 16e
+    ("75", 48.853, 2.369),  # Paris (Bastille)
+    ("75", 48.848, 2.396),  # Paris (Nation)
+    ("75", 48.842, 2.321),  # Paris (Montparnasse)
+    ("75", 48.840, 2.290),  # Paris 15e
+    ("75", 48.838, 2.257),  # Paris (Porte de Saint-Cloud)
+    ("75", 48.835, 2.410),  # Paris 12e
+    ("75", 48.831, 2.356),  # Paris (Place d'Italie)
+    ("75", 48.826, 2.360),  # Paris 13e
+    ("76", 50.047, 1.420),  # Eu
+    ("76", 49.923, 1.078),  # Dieppe
+    ("76", 49.757, 0.375),  # Fécamp
+    ("76", 49.734, 1.440),  # Neufchâtel-en-Bray
+    ("76", 49.617, 0.754),  # Yvetot
+    ("76", 49.614, 1.544),  # Forges-les-Eaux
+    ("76", 49.573, 0.473),  # Bolbec
+    ("76", 49.494, 0.108),  # Le Havre
+    ("76", 49.287, 1.008),  # Elbeuf
+    ("77", 48.960, 2.879),  # Meaux
+    ("77", 48.950, 3.130),  # La Ferté-sous-Jouarre
+    ("77", 48.880, 2.590),  # Chelles
+    ("77", 48.873, 2.708),  # Lagny-sur-Marne
+    ("77", 48.850, 2.651),  # Torcy
+    ("77", 48.815, 3.084),  # Coulommiers
+    ("77", 48.560, 3.299),  # Provins
+    ("77", 48.405, 2.701),  # Fontainebleau
+    ("77", 48.385, 2.953),  # Montereau-Fault-Yonne
+    ("77", 48.267, 2.697),  # Nemours
+    ("78", 49.035, 1.578),  # Bonnières-sur-Seine
+    ("78", 48.991, 1.717),  # Mantes-la-Jolie
+    ("78", 48.930, 2.050),  # Poissy
+    ("78", 48.899, 2.094),  # Saint-Germain-en-Laye
+    ("78", 48.823, 1.949),  # Plaisir
+    ("78", 48.790, 1.600),  # Houdan
+    ("78", 48.777, 2.001),  # Trappes
+    ("78", 48.706, 2.039),  # Chevreuse
+    ("78", 48.644, 1.830),  # Rambouillet
+    ("79", 46.976, -0.215),  # Thouars
+    ("79", 46.922, -0.749),  # Mauléon (Deux-Sèvres)
+    ("79", 46.841, -0.488),  # Bressuire
+    ("79", 46.649, -0.247),  # Parthenay
+    ("79", 46.413, -0.207),  # Saint-Maixent-l'École
+    ("79", 46.222, -0.142),  # Melle
+    ("80", 50.157, 2.341),  # Doullens
+    ("80", 50.106, 1.834),  # Abbeville
+    ("80", 50.003, 2.652),  # Albert
+    ("80", 49.932, 2.936),  # Péronne
+    ("80", 49.780, 1.977),  # Poix-de-Picardie
+    ("80", 49.747, 3.073),  # Ham
+    ("80", 49.648, 2.570),  # Montdidier
+    ("81", 44.064, 1.953),  # Cordes
+    ("81", 44.051, 2.158),  # Carmaux
+    ("81", 43.901, 1.897),  # Gaillac
+    ("81", 43.761, 1.989),  # Graulhet
+    ("81", 43.699, 1.819),  # Lavaur
+    ("81", 43.606, 2.241),  # Castres
+    ("82", 44.235, 1.771),  # Caylus
+    ("82", 44.161, 1.537),  # Caussade
+    ("82", 44.108, 0.891),  # Valence-d'Agen
+    ("82", 44.105, 1.085),  # Moissac
+    ("82", 44.040, 1.107),  # Castelsarrasin
+    ("82", 43.883, 0.988),  # Beaumont-de-Lomagne
+    ("83", 43.537, 6.464),  # Draguignan
+    ("83", 43.452, 5.862),  # Saint-Maximin
+    ("83", 43.433, 6.737),  # Fréjus
+    ("83", 43.406, 6.061),  # Brignoles
+    ("83", 43.394, 6.313),  # Le Luc
+    ("83", 43.272, 6.640),  # Saint-Tropez
+    ("83", 43.137, 5.753),  # Bandol
+    ("83", 43.120, 6.130),  # Hyères
+    ("84", 44.384, 4.991),  # Valréas
+    ("84", 44.281, 4.749),  # Bollène
+    ("84", 44.138, 4.807),  # Orange
+    ("84", 44.055, 5.048),  # Carpentras
+    ("84", 43.876, 5.396),  # Apt
+    ("84", 43.837, 5.038),  # Cavaillon
+    ("84", 43.735, 5.374),  # Cadenet
+    ("84", 43.690, 5.500),  # Pertuis
+    ("85", 46.974, -1.309),  # Montaigu
+    ("85", 46.847, -1.878),  # Challans
+    ("85", 46.686, -1.050),  # Chantonnay
+    ("85", 46.497, -1.783),  # Les Sables-d'Olonne
+    ("85", 46.466, -0.806),  # Fontenay-le-Comte
+    ("85", 46.455, -1.166),  # Luçon
+    ("86", 47.010, 0.083),  # Loudun
+    ("86", 46.817, 0.546),  # Châtellerault
+    ("86", 46.568, 0.646),  # Chauvigny
+    ("86", 46.436, 0.122),  # Lusignan
+    ("86", 46.426, 0.871),  # Montmorillon
+    ("86", 46.148, 0.296),  # Civray
+    ("87", 46.215, 1.082),  # Le Dorat
+    ("87", 46.122, 1.049),  # Bellac
+    ("87", 45.888, 0.901),  # Saint-Junien
+    ("87", 45.822, 0.821),  # Rochechouart
+    ("87", 45.740, 1.742),  # Eymoutiers
+    ("87", 45.516, 1.206),  # Saint-Yrieix-la-Perche
+    ("88", 48.356, 5.696),  # Neufchâteau
+    ("88", 48.299, 6.134),  # Mirecourt
+    ("88", 48.285, 6.949),  # Saint-Dié-des-Vosges
+    ("88", 48.207, 6.720),  # Bruyères
+    ("88", 48.087, 6.048),  # Darney
+    ("88", 48.073, 6.878),  # Gérardmer
+    ("88", 48.017, 6.591),  # Remiremont
+    ("89", 48.197, 3.283),  # Sens
+    ("89", 48.082, 3.297),  # Villeneuve-sur-Yonne
+    ("89", 47.982, 3.397),  # Joigny
+    ("89", 47.856, 3.974),  # Tonnerre
+    ("89", 47.815, 3.798),  # Chablis
+    ("89", 47.640, 3.071),  # Saint-Fargeau
+    ("89", 47.490, 3.908),  # Avallon
+    ("90", 47.742, 6.828),  # Giromagny
+    ("90", 47.508, 6.999),  # Delle
+    ("90", 47.488, 6.923),  # Beaucourt
+    ("91", 48.730, 2.270),  # Massy
+    ("91", 48.714, 2.246),  # Palaiseau
+    ("91", 48.705, 2.459),  # Montgeron
+    ("91", 48.698, 2.504),  # Brunoy
+    ("91", 48.590, 2.247),  # Arpajon
+    ("91", 48.529, 2.011),  # Dourdan
+    ("91", 48.435, 2.162),  # Étampes
+    ("91", 48.404, 2.471),  # Milly-la-Forêt
+    ("92", 48.922, 2.252),  # Colombes
+    ("92", 48.902, 2.214),  # Nanterre
+    ("92", 48.900, 2.310),  # Clichy
+    ("92", 48.877, 2.190),  # Rueil-Malmaison
+    ("92", 48.835, 2.241),  # Boulogne-Billancourt
+    ("92", 48.824, 2.270),  # Issy-les-Moulineaux
+    ("92", 48.816, 2.319),  # Montrouge
+    ("92", 48.754, 2.297),  # Antony
+    ("93", 48.938, 2.497),  # Aulnay-sous-Bois
+    ("93", 48.936, 2.357),  # Saint-Denis
+    ("93", 48.923, 2.445),  # Drancy
+    ("93", 48.909, 2.439),  # Bobigny
+    ("93", 48.898, 2.516),  # Le Raincy
+    ("93", 48.894, 2.409),  # Pantin
+    ("93", 48.864, 2.443),  # Montreuil (Seine-Saint-Denis)
+    ("93", 48.850, 2.550),  # Noisy-le-Grand
+    ("94", 48.850, 2.440),  # Vincennes
+    ("94", 48.837, 2.483),  # Nogent-sur-Marne
+    ("94", 48.817, 2.515),  # Champigny
+    ("94", 48.813, 2.385),  # Ivry-sur-Seine
+    ("94", 48.792, 2.363),  # Villejuif
+    ("94", 48.787, 2.393),  # Vitry-sur-Seine
+    ("94", 48.780, 2.338),  # L'Haÿ-les-Roses
+    ("94", 48.780, 2.460),  # Créteil
+    ("94", 48.754, 2.510),  # Boissy-Saint-Léger
+    ("95", 49.155, 1.787),  # Magny-en-Vexin
+    ("95", 49.114, 2.423),  # Luzarches
+    ("95", 49.051, 2.101),  # Pontoise
+    ("95", 49.036, 2.076),  # Cergy
+    ("95", 49.033, 2.467),  # Goussainville
+    ("95", 48.997, 2.378),  # Sarcelles
+    ("95", 48.989, 2.322),  # Montmorency
+    ("95", 48.948, 2.248),  # Argenteuil
+    ("971", 15.998, -61.726),  # Basse-Terre
+    ("972", 14.469, -60.866),  # Le Marin
+    ("973", 5.160, -52.650),  # Kourou
+    ("974", -21.009, 55.270),  # Saint-Paul
+    # Guyane: the coast from Saint-Laurent-du-Maroni to Cayenne, and the south
+    ("973", 5.40, -53.90),
+    ("973", 4.90, -52.40),
+    ("973", 2.60, -53.20),
+]
+
+# Coarse outlines (longitude, latitude) of mainland France and Corsica, drawn
+# a few kilometres outside the borders: a location outside of them is not in
+# a department of metropolitan France, however close to one of its points
+METROPOLITAN_OUTLINES: list[list[tuple[float, float]]] = [
+    [
+        (1.40, 50.70),
+        (1.75, 51.00),
+        (2.55, 51.12),
+        (2.95, 50.83),
+        (3.30, 50.80),
+        (3.35, 50.50),
+        (3.75, 50.40),
+        (4.25, 50.25),
+        (4.90, 50.20),
+        (4.95, 49.85),
+        (5.45, 49.62),
+        (5.85, 49.55),
+        (6.40, 49.50),
+        (7.05, 49.17),
+        (7.60, 49.15),
+        (8.25, 49.02),
+        (7.90, 48.55),
+        (7.65, 47.95),
+        (7.60, 47.60),
+        (7.55, 47.55),
+        (7.50, 47.42),
+        (7.20, 47.42),
+        (7.10, 47.50),
+        (7.00, 47.50),
+        (7.00, 47.32),
+        (6.78, 47.10),
+        (6.50, 46.92),
+        (6.40, 46.72),
+        (6.10, 46.55),
+        (6.20, 46.42),
+        (6.13, 46.27),
+        (6.05, 46.20),
+        (6.15, 46.14),
+        (6.30, 46.28),
+        (6.50, 46.43),
+        (6.85, 46.43),
+        (7.05, 45.95),
+        (7.20, 45.50),
+        (7.05, 45.15),
+        (7.10, 44.70),
+        (7.75, 44.15),
+        (7.60, 43.75),
+        (7.60, 43.50),
+        (6.50, 42.90),
+        (3.35, 42.45),
+        (2.65, 42.35),
+        (1.70, 42.40),
+        (0.70, 42.65),
+        (0.00, 42.65),
+        (-0.80, 42.75),
+        (-1.45, 43.05),
+        (-1.80, 43.30),
+        (-1.95, 43.50),
+        (-2.00, 44.50),
+        (-2.60, 46.60),
+        (-3.50, 47.20),
+        (-5.30, 48.30),
+        (-5.30, 48.60),
+        (-3.50, 48.95),
+        (-2.20, 48.70),
+        (-1.70, 48.80),
+        (-1.95, 49.40),
+        (-2.05, 49.75),
+        (-1.20, 49.75),
+        (0.00, 49.65),
+        (1.00, 50.05),
+    ],
+    [(8.40, 43.10), (9.70, 43.10), (9.70, 41.30), (8.50, 41.30)],
+]
+
+
+def _in_outline(longitude: float, latitude: float, outline: list[tuple[float, float]]) -> bool:
+    """Return True when a point is inside a polygon (ray casting)."""
+    inside = False
+    for (x1, y1), (x2, y2) in zip(outline, outline[1:] + outline[:1]):
+        if (y1 > latitude) != (y2 > latitude) and longitude < x1 + (latitude - y1) * (
+            x2 - x1
+        ) / (y2 - y1):
+            inside = not inside
+    return inside
+
+
+# (code, latitude, longitude in radians, cosine of the latitude), computed once
+_INDEX = [
+    (code, radians(latitude), radians(longitude), cos(radians(latitude)))
+    for code, latitude, longitude in (
+        *((code, *center) for code, center in DEPARTMENT_CENTERS.items()),
+        *((code, *prefecture) for code, prefecture in PREFECTURES.items()),
+        *EXTRA_POINTS,
+    )
+]
+
+
+def find_department(latitude: float, longitude: float) -> tuple[str, float] | None:
+    """Return the code of the department closest to a location and its distance (km).
+
+    The distance to the points of each department is approximated with an
+    equirectangular projection (exact enough at this scale, no network nor
+    trigonometry per department). None when the location is outside of
+    METROPOLITAN_OUTLINES, or farther than MAX_DISTANCE_KM from an overseas
+    department.
+    """
+    lat = radians(latitude)
+    lon = radians(longitude)
+    lat_cos = cos(lat)
+    best = None
+    best_distance = float("inf")
+    for code, center_lat, center_lon, center_cos in _INDEX:
+        x = (lon - center_lon) * (center_cos + lat_cos) / 2
+        y = lat - center_lat
+        distance = x * x + y * y
+        if distance < best_distance:
+            best, best_distance = code, distance
+    distance_km = sqrt(best_distance) * EARTH_RADIUS_KM
+    if len(best) == 2:
+        if not any(
+            _in_outline(longitude, latitude, outline) for outline in METROPOLITAN_OUTLINES
+        ):
+            return None
+    elif distance_km > MAX_DISTANCE_KM:
+        return None
+    return best, round(distance_km, 1)
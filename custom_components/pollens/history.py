@@ -0,0 +1,151 @@
+"""Recent daily levels of the counties, persisted with HA storage."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from datetime import date, timedelta
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    ATTR_DAYS_AT_LEVEL,
+    ATTR_MAX_7_DAYS,
+    ATTR_TREND,
+    HISTORY_DAYS,
+    POLLEN_INDEX,
+    RISK_LEVEL,
+    STORAGE_KEY_HISTORY,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
+)
+from .pollensasync import NO_LEVEL, PollensSnapshot
+from .taxonomy import BUILTIN_POLLENS
+
+TREND_RISING = "rising"
+TREND_FALLING = "falling"
+TREND_STABLE = "stable"
+
+# (day, levels of the pollens as in PollensSnapshot.levels, risk level)
+Day = tuple[date, bytes, int]
+
+
+def _series(days: deque[Day], key: int | str) -> list[int | None]:
+    """Return the daily levels of a pollen index or of RISK_LEVEL."""
+    if key == RISK_LEVEL:
+        return [risk_level for _, _, risk_level in days]
+    return [
+        levels[key] if key < len(levels) and levels[key] != NO_LEVEL else None
+        for _, levels, _ in days
+    ]
+
+
+def _summarize(days: deque[Day]) -> dict[int | str, dict[str, Any]]:
+    """Return the trend, max and days at level of every pollen and RISK_LEVEL."""
+    summaries = {}
+    for key in (*range(len(POLLEN_INDEX)), RISK_LEVEL):
+        series = _series(days, key)
+        current = series[-1]
+        if current is None:
+            continue
+        days_at_level = 0
+        for level in reversed(series):
+            if level != current:
+                break
+            days_at_level += 1
+        before = [level for level in series[:-1] if level is not None]
+        trend = TREND_STABLE
+        if before and current > sum(before) / len(before):
+            trend = TREND_RISING
+        elif before and current < sum(before) / len(before):
+            trend = TREND_FALLING
+        summaries[key] = {
+            ATTR_TREND: trend,
+            ATTR_MAX_7_DAYS: max(level for level in series if level is not None),
+            ATTR_DAYS_AT_LEVEL: days_at_level,
+        }
+    return summaries
+
+
+class PollensHistory:
+    """Ring buffer of the last HISTORY_DAYS daily levels of each county.
+
+    The last bulletin of each day is kept (days without bulletin keep the
+    one in force), and the summary attributes of the pollens are computed
+    once per refresh from the buffer.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize"""
+        self._store: Store[dict[str, list[list]]] = Store(
+            hass, STORAGE_VERSION, STORAGE_KEY_HISTORY
+        )
+        self._load_lock = asyncio.Lock()
+        self._loaded = False
+        self._days: dict[str, deque[Day]] = {}
+        # county -> pollen index or RISK_LEVEL -> summary attributes
+        self._summaries: dict[str, dict[int | str, dict[str, Any]]] = {}
+
+    async def async_load(self) -> None:
+        """Load the history stored on disk, once."""
+        async with self._load_lock:
+            if self._loaded:
+                return
+            for county, days in (await self._store.async_load() or {}).items():
+                self._days[county] = deque(
+                    (
+                        (date.fromisoformat(day), bytes.fromhex(levels), risk_level)
+                        for day, levels, risk_level in days
+                    ),
+                    maxlen=HISTORY_DAYS,
+                )
+                self._summaries[county] = _summarize(self._days[county])
+            self._loaded = True
+
+    @callback
+    def _data_to_save(self) -> dict[str, list[list]]:
+        return {
+            county: [
+                [day.isoformat(), levels.hex(), risk_level]
+                for day, levels, risk_level in days
+            ]
+            for county, days in self._days.items()
+        }
+
+    @callback
+    def record(self, snapshot: PollensSnapshot, today: date) -> set[int | str]:
+        """Record the snapshot of a county as the levels of today.
+
+        Return the pollen indexes (and RISK_LEVEL) whose summary changed.
+        """
+        days = self._days.setdefault(snapshot.county, deque(maxlen=HISTORY_DAYS))
+        if days and days[-1][0] > today:
+            # Clock moved backwards, keep the buffer ordered
+            return set()
+        if days:
+            # Days without a refresh keep the levels of the last bulletin
+            _, levels, risk_level = days[-1]
+            day = max(days[-1][0], today - timedelta(days=HISTORY_DAYS)) + timedelta(
+                days=1
+            )
+            while day < today:
+                days.append((day, levels, risk_level))
+                day += timedelta(days=1)
+            if days[-1][0] == today:
+                days.pop()
+        # The index of the pollens registered at runtime may change with a
+        # restart, only the builtin ones have a history
+        days.append((today, snapshot.levels[:BUILTIN_POLLENS], snapshot.risk_level))
+        previous = self._summaries.get(snapshot.county, {})
+        summaries = self._summaries[snapshot.county] = _summarize(days)
+        self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+        return {
+            key
+            for key in previous.keys() | summaries.keys()
+            if previous.get(key) != summaries.get(key)
+        }
+
+    def summary(self, county: str, key: int | str) -> dict[str, Any]:
+        """Return the summary attributes of a pollen index or RISK_LEVEL."""
+        return self._summaries.get(county, {}).get(key, {})
@@ -1,66 +1,771 @@
 """asyncio-friendly python API for RNSA (https://pollens.fr)."""
+from abc import ABC, abstractmethod
 import asyncio
 import aiohttp
-from aiohttp.client import ClientError, ClientTimeout
+from aiohttp.client import ClientError, ClientResponseError, ClientTimeout
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 import json
+import random
+import time
 
 import async_timeout
+from yarl import URL
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+try:
+    from .const import LIST_RISK, POLLEN_INDEX
+    from .taxonomy import pollen_index
+except ImportError:  # used as a standalone module
+    from const import LIST_RISK, POLLEN_INDEX
+    from taxonomy import pollen_index
 
 DEFAULT_TIMEOUT = 240
+DEFAULT_CONNECT_TIMEOUT = 10
+DEFAULT_READ_TIMEOUT = 30
+
+# Each attempt is bounded by connect and read timeouts, total is a last resort
+CLIENT_TIMEOUT = ClientTimeout(
+    total=DEFAULT_TIMEOUT,
+    sock_connect=DEFAULT_CONNECT_TIMEOUT,
+    sock_read=DEFAULT_READ_TIMEOUT,
+)
+
+DEFAULT_RETRIES = 2
+# Exponential backoff between retries (seconds), with full jitter
+BACKOFF_BASE = 2
+BACKOFF_MAX = 30
+RETRY_EXCEPTIONS = (ClientError, asyncio.TimeoutError, ConnectionRefusedError)
+
+# Results younger than this (in seconds) are returned without a new request
+DEFAULT_FRESHNESS = 60
 
-CLIENT_TIMEOUT = ClientTimeout(total=DEFAULT_TIMEOUT)
+# Requests of all the clients of the process: tokens per second, bucket size
+# and requests in progress
+DEFAULT_RATE = 2.0
+DEFAULT_BURST = 10
+DEFAULT_CONCURRENCY = 4
+# Longest Retry-After honored (seconds), longer ones are shortened
+RETRY_AFTER_MAX = 120
+
+# Connection pool of the sessions created by the client (create_session):
+# idle connections are kept KEEPALIVE_TIMEOUT seconds, DNS answers
+# DNS_CACHE_TTL seconds
+CONNECTION_LIMIT = 10
+CONNECTION_LIMIT_PER_HOST = DEFAULT_CONCURRENCY
+KEEPALIVE_TIMEOUT = 60
+DNS_CACHE_TTL = 600
 
 BASE_URL = "https://pollens.fr/risks/thea/counties/{}"
 
+# Level of a pollen missing from a bulletin
+NO_LEVEL = 0xFF
 
-class PollensClient:
-    """Pollens client implementation."""
+# Expected keys and types of a response, and of each of its risks
+BULLETIN_SCHEMA = (("countyName", str), ("riskLevel", int), ("risks", list))
+RISK_SCHEMA = (("pollenName", str), ("level", int))
+
+# Payloads larger than this are parsed in an executor, so that a single
+# parse does not block the loop for milliseconds. A pollens.fr payload is
+# ~1 KB: parsing it on the loop costs less loop time than an executor job,
+# even when many counties are refreshed together (see benchmarks/run.py).
+PARSE_EXECUTOR_MIN_BYTES = 256 * 1024
+
+
+class InvalidPayload(ValueError):
+    """Response of pollens.fr which does not match the expected schema."""
+
+
+def _check(item, schema, where):
+    if not isinstance(item, dict):
+        raise InvalidPayload(f"{where}: object expected, got {type(item).__name__}")
+    for key, expected in schema:
+        if not isinstance(item.get(key), expected):
+            raise InvalidPayload(f"{where}: {key} must be a {expected.__name__}")
+
+
+@dataclass(frozen=True, slots=True)
+class PollensSnapshot:
+    """Immutable bulletin of a county.
+
+    levels holds one byte per pollen, at the position given by POLLEN_INDEX
+    (NO_LEVEL when the pollen is not reported). pollens keeps the names as
+    reported by pollens.fr.
+    """
+
+    county: str
+    county_name: str
+    risk_level: int
+    levels: bytes
+    pollens: tuple[str, ...]
+    updated: datetime
+    stale: bool = False
+
+    @classmethod
+    def from_json(cls, county, request_json, updated=None, stale=False):
+        """Build a snapshot from a pollens.fr response.
+
+        The response is validated against BULLETIN_SCHEMA / RISK_SCHEMA while
+        it is read, InvalidPayload is raised when it does not match or when
+        a level is not one of LIST_RISK. Pollen
+        names are normalized by taxonomy.pollen_index (unknown pollens are
+        registered), a pollen reported twice keeps its first level.
+        """
+        _check(request_json, BULLETIN_SCHEMA, f"county {county}")
+        if not 0 <= request_json["riskLevel"] < len(LIST_RISK):
+            raise InvalidPayload(
+                f"county {county}: invalid risk level {request_json['riskLevel']}"
+            )
+        levels = bytearray([NO_LEVEL]) * len(POLLEN_INDEX)
+        pollens = []
+        for risk in request_json["risks"]:
+            _check(risk, RISK_SCHEMA, f"county {county} risk")
+            if not 0 <= risk["level"] < len(LIST_RISK):
+                raise InvalidPayload(f"county {county}: invalid level {risk['level']}")
+            index = pollen_index(risk["pollenName"])
+            if index is None:
+                continue
+            if index >= len(levels):
+                levels.extend([NO_LEVEL] * (index + 1 - len(levels)))
+            elif levels[index] != NO_LEVEL:
+                continue
+            levels[index] = risk["level"]
+            pollens.append(risk["pollenName"])
+        return cls(
+            county=county,
+            county_name=request_json["countyName"],
+            risk_level=request_json["riskLevel"],
+            levels=bytes(levels),
+            pollens=tuple(pollens),
+            updated=updated or datetime.now(timezone.utc),
+            stale=stale,
+        )
+
+    def age(self, now=None):
+        """Return the seconds elapsed since the bulletin was fetched."""
+        return ((now or datetime.now(timezone.utc)) - self.updated).total_seconds()
+
+    def level(self, index):
+        """Return the level of the pollen at index, None when not reported."""
+        if index >= len(self.levels) or self.levels[index] == NO_LEVEL:
+            return None
+        return self.levels[index]
+
+    def level_of(self, pollen):
+        """Return the level of a pollen by name, None when not reported."""
+        index = pollen_index(pollen, register=False)
+        return None if index is None else self.level(index)
+
+
+def parse_bulletin(county, body):
+    """Decode and validate a pollens.fr response body (bytes).
+
+    Return (PollensSnapshot, decoded response), raise InvalidPayload.
+    """
+    try:
+        request_json = json_loads(body)
+    except ValueError as err:
+        raise InvalidPayload(f"county {county}: {err}") from err
+    return PollensSnapshot.from_json(county, request_json), request_json
+
+
+class ResponseCache:
+    """Last response of each county with its HTTP validators, kept in memory.
+
+    An entry is a dict with the keys ``etag``, ``last_modified``, ``data``
+    (the parsed payload) and ``fetched_at`` (timestamp of the last successful
+    request). Subclass it to persist the entries.
+    """
+
+    def __init__(self):
+        self._entries = {}
+
+    async def async_get(self, number):
+        """Return the cached entry of a county or None."""
+        return self._entries.get(number)
+
+    async def async_set(self, number, entry):
+        """Store the entry of a county."""
+        self._entries[number] = entry
+
+
+class CircuitBreaker:
+    """Circuit breaker of one host.
+
+    After failure_threshold consecutive failures the circuit opens and calls
+    are rejected for reset_timeout seconds, then a single trial request is
+    allowed (half open): it closes the circuit on success and opens it again
+    on failure.
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=300):
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = None
+        self._trial = False
+
+    @property
+    def is_open(self):
+        return self._opened_at is not None
+
+    def allow(self):
+        """Return True when a request may be sent."""
+        if self._opened_at is None:
+            return True
+        if time.monotonic() - self._opened_at < self._reset_timeout:
+            return False
+        # Half open: one trial, the next one waits for another reset_timeout
+        self._opened_at = time.monotonic()
+        self._trial = True
+        return True
+
+    def record_success(self):
+        self._failures = 0
+        self._opened_at = None
+        self._trial = False
+
+    def record_failure(self):
+        """Record a failure, return True when it opens the circuit."""
+        self._failures += 1
+        if self._trial or (
+            self._opened_at is None and self._failures >= self._failure_threshold
+        ):
+            self._opened_at = time.monotonic()
+            self._trial = False
+            return True
+        return False
+
+
+def _current_task_cancelling():
+    """Return True when the running task itself is being cancelled."""
+    task = asyncio.current_task()
+    return task is not None and task.cancelling() > 0
+
+
+def _elapsed_ms(start):
+    return round((time.perf_counter() - start) * 1000, 3)
+
+
+async def _on_connection_create_start(session, context, params):
+    if context.trace_request_ctx is not None:
+        context.trace_request_ctx["connect_start"] = time.perf_counter()
+
+
+async def _on_connection_create_end(session, context, params):
+    metrics = context.trace_request_ctx
+    if metrics is not None and "connect_start" in metrics:
+        metrics["connect_ms"] = _elapsed_ms(metrics.pop("connect_start"))
+
+
+async def _on_connection_reuseconn(session, context, params):
+    if context.trace_request_ctx is not None:
+        context.trace_request_ctx["connect_ms"] = 0
+
+
+def trace_config():
+    """Return a TraceConfig measuring the connection time of the requests.
+
+    Give it to the session of the client: ClientSession(trace_configs=[...]).
+    """
+    config = aiohttp.TraceConfig()
+    config.on_connection_create_start.append(_on_connection_create_start)
+    config.on_connection_create_end.append(_on_connection_create_end)
+    config.on_connection_reuseconn.append(_on_connection_reuseconn)
+    return config
+
+
+def create_session(**kwargs):
+    """Return a ClientSession on a connector dedicated to pollens.fr.
+
+    Connections are kept alive and reused, DNS answers are cached. It must
+    be called from a coroutine, and the session closed after use.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=CONNECTION_LIMIT,
+        limit_per_host=CONNECTION_LIMIT_PER_HOST,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+        ttl_dns_cache=DNS_CACHE_TTL,
+        enable_cleanup_closed=True,
+    )
+    return aiohttp.ClientSession(
+        connector=connector, trace_configs=[trace_config()], **kwargs
+    )
+
+
+def _backoff(attempt):
+    """Return the delay before a retry: exponential backoff with full jitter."""
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2**attempt))
+
+
+def _retry_after(err):
+    """Return the Retry-After (seconds) of an error response, None without one."""
+    value = (err.headers or {}).get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+    try:
+        return max((parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds(), 0)
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """Token bucket and concurrency limit of the requests to pollens.fr.
+
+    A request takes a token, tokens are added at ``rate`` per second up to
+    ``burst`` (None: no rate limit), and at most ``concurrency`` requests
+    are in progress. Requests wait in order. ``defer`` stops every request
+    for a while (Retry-After). Use it as ``async with limiter as waited``,
+    waited is the queue time in seconds.
+    """
+
+    def __init__(
+        self, rate=DEFAULT_RATE, burst=DEFAULT_BURST, concurrency=DEFAULT_CONCURRENCY
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.concurrency = concurrency
+        self._tokens = burst
+        self._refilled = time.monotonic()
+        self._blocked_until = 0.0
+        # asyncio primitives of the running loop, created on first use
+        self._loop = None
+        self._semaphore = None
+        self._lock = None
+        self.stats = {
+            "acquired": 0,
+            "queued": 0,
+            "wait_ms_total": 0.0,
+            "wait_ms_max": 0.0,
+            "deferred": 0,
+        }
+
+    def _primitives(self):
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+            self._lock = asyncio.Lock()
+        return self._semaphore, self._lock
+
+    def _delay(self, now):
+        """Refill the bucket, return the wait before the next token."""
+        blocked = self._blocked_until - now
+        if blocked > 0:
+            return blocked
+        if self.rate is None:
+            return 0
+        self._tokens = min(self.burst, self._tokens + (now - self._refilled) * self.rate)
+        self._refilled = now
+        if self._tokens >= 1:
+            return 0
+        return (1 - self._tokens) / self.rate
+
+    async def __aenter__(self):
+        start = time.monotonic()
+        semaphore, lock = self._primitives()
+        await semaphore.acquire()
+        try:
+            async with lock:
+                while (delay := self._delay(time.monotonic())) > 0:
+                    await asyncio.sleep(delay)
+                if self.rate is not None:
+                    self._tokens -= 1
+        except BaseException:
+            semaphore.release()
+            raise
+        waited = time.monotonic() - start
+        wait_ms = round(waited * 1000, 3)
+        self.stats["acquired"] += 1
+        if wait_ms >= 1:
+            self.stats["queued"] += 1
+        self.stats["wait_ms_total"] = round(self.stats["wait_ms_total"] + wait_ms, 3)
+        self.stats["wait_ms_max"] = max(self.stats["wait_ms_max"], wait_ms)
+        return waited
+
+    async def __aexit__(self, *exc_info):
+        self._semaphore.release()
+
+    def defer(self, seconds):
+        """Send no request during the next seconds (at most RETRY_AFTER_MAX)."""
+        self.stats["deferred"] += 1
+        self._blocked_until = max(
+            self._blocked_until, time.monotonic() + min(seconds, RETRY_AFTER_MAX)
+        )
+
+
+_rate_limiter = None
+
+
+def rate_limiter():
+    """Return the RateLimiter shared by the clients of the process."""
+    global _rate_limiter  # pylint: disable=global-statement
+    if _rate_limiter is None:
+        _rate_limiter = RateLimiter()
+    return _rate_limiter
+
+
+def configure_rate_limiter(rate=DEFAULT_RATE, burst=DEFAULT_BURST, concurrency=DEFAULT_CONCURRENCY):
+    """Replace the shared RateLimiter, before the clients send requests."""
+    global _rate_limiter  # pylint: disable=global-statement
+    _rate_limiter = RateLimiter(rate, burst, concurrency)
+    return _rate_limiter
+
+
+class ProviderResponse:
+    """Response of a PollensProvider: HTTP status, headers and body."""
+
+    def __init__(self, status, headers, body=b""):
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+
+class PollensProvider(ABC):
+    """Source of the pollens.fr responses of a PollensClient.
+
+    async_fetch sends the request of a county with the conditional headers
+    given by the client and returns a ProviderResponse (status below 400),
+    or raises like an HTTP request: ClientResponseError for an error status
+    (with its headers), another of RETRY_EXCEPTIONS when there is no
+    response. The client handles caching, retries and parsing the same way
+    whatever the provider.
+    """
+
+    def url(self, number):
+        """Return the URL of a county, its host keys the circuit breaker."""
+        return BASE_URL.format(number)
+
+    @abstractmethod
+    async def async_fetch(self, number, headers, metrics):
+        """Return the ProviderResponse of a county, write timings in metrics."""
+
+    def pool_stats(self):
+        """Return the state of the connections of the provider."""
+        return {}
+
+    async def close(self):
+        """Release the resources of the provider."""
+
+
+class HttpProvider(PollensProvider):
+    """Responses of pollens.fr, requested with aiohttp.
+
+    Without a session, the provider creates one with create_session on its
+    first request and closes it in close(). A given session is left open.
+    """
 
     def __init__(self, session: aiohttp.ClientSession = None, timeout=CLIENT_TIMEOUT):
+        self._session = session
+        self._owns_session = session is None
+        self._timeout = timeout
+        self.counters = {"connections_created": 0, "connections_reused": 0}
+
+    @property
+    def session(self):
+        """Session of the requests, created on first use when not given."""
+        if self._session is None:
+            self._session = create_session()
+        return self._session
+
+    async def close(self):
+        """Close the session created by the provider, if any."""
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def pool_stats(self):
+        """Return the state of the connection pool of the session.
+
+        connections_created / connections_reused are only counted when the
+        session uses trace_config() (create_session does).
+        """
+        stats = dict(self.counters)
+        connector = self._session.connector if self._session is not None else None
+        if isinstance(connector, aiohttp.TCPConnector):
+            stats.update(
+                limit=connector.limit,
+                limit_per_host=connector.limit_per_host,
+                # private in aiohttp: no public view of the pool
+                in_use=len(getattr(connector, "_acquired", ())),
+                idle=sum(len(conns) for conns in getattr(connector, "_conns", {}).values()),
+            )
+        return stats
+
+    async def async_fetch(self, number, headers, metrics):
+        """Send the request of a county; connect_ms needs trace_config()."""
+        metrics.pop("connect_ms", None)
+        start = time.perf_counter()
+        # The response is released to the pool when leaving the block, read or not
+        async with self.session.get(
+            self.url(number),
+            timeout=self._timeout,
+            headers=headers,
+            trace_request_ctx=metrics,
+        ) as response:
+            metrics["ttfb_ms"] = _elapsed_ms(start)
+            if "connect_ms" in metrics:
+                if metrics["connect_ms"]:
+                    self.counters["connections_created"] += 1
+                else:
+                    self.counters["connections_reused"] += 1
+            response.raise_for_status()
+            if response.status == 304:
+                return ProviderResponse(response.status, response.headers.copy())
+            start = time.perf_counter()
+            body = await response.read()
+            metrics["body_ms"] = _elapsed_ms(start)
+            return ProviderResponse(response.status, response.headers.copy(), body)
+
+
+class PollensClient:
+    """Pollens client implementation.
+
+    The responses come from a PollensProvider, HttpProvider by default.
+    close(), or the end of ``async with PollensClient() as client``, closes
+    the provider (an HttpProvider only closes the session it created).
+    """
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession = None,
+        timeout=CLIENT_TIMEOUT,
+        freshness=DEFAULT_FRESHNESS,
+        cache: ResponseCache = None,
+        retries=DEFAULT_RETRIES,
+        limiter: RateLimiter = None,
+        provider: PollensProvider = None,
+    ):
         """Constructor.
-        session: aiohttp.ClientSession or None to create a new session.
+        session: aiohttp.ClientSession of the default provider, None for its own.
+        timeout: ClientTimeout of the default provider.
+        freshness: seconds during which a result is reused for the same county.
+        cache: ResponseCache used for conditional requests, None for a memory one.
+        retries: number of retries of a failed request.
+        limiter: RateLimiter of the requests, None for the one shared by all clients.
+        provider: PollensProvider of the responses, None for HttpProvider(session).
         """
-        self._county_name = None
         self._params = {}
-        self._risk_level = None
-        self._risks = {}
-        self._timeout = timeout
-        if session is not None:
-            self._session = session
-        else:
-            self._session = aiohttp.ClientSession()
+        self._freshness = freshness
+        self._retries = retries
+        # county -> task of the request in progress
+        self._inflight = {}
+        # county -> (monotonic time, snapshot) of the last success
+        self._results = {}
+        self._cache = cache if cache is not None else ResponseCache()
+        # host -> CircuitBreaker
+        self._breakers = {}
+        self._limiter = limiter
+        self.counters = {
+            "requests": 0,
+            "retries": 0,
+            "breaker_trips": 0,
+            "rejected": 0,
+            "cache_hits": 0,
+            "not_modified": 0,
+            "invalid": 0,
+        }
+        # county -> metrics of its last fetch (see _fetch)
+        self.metrics = {}
+        if provider is None:
+            provider = HttpProvider(session, timeout)
+        self.provider = provider
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """Close the provider."""
+        await self.provider.close()
+
+    def pool_stats(self):
+        """Return the state of the connections of the provider."""
+        return self.provider.pool_stats()
+
+    @property
+    def limiter(self):
+        """RateLimiter of the requests of this client."""
+        return self._limiter if self._limiter is not None else rate_limiter()
+
+    async def Get(self, number, max_age=None):
+        """Get the PollensSnapshot of a county number, None on error.
+
+        Concurrent calls for the same county share a single request, and a
+        result younger than max_age seconds (default: the freshness window)
+        is returned without requesting pollens.fr again.
+        """
+        if max_age is None:
+            max_age = self._freshness
+        cached = self._results.get(number)
+        if cached is not None and time.monotonic() - cached[0] < max_age:
+            self.counters["cache_hits"] += 1
+            self.metrics[number] = {"source": "memory", "retries": 0}
+            return cached[1]
+
+        task = self._inflight.get(number)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(number))
+            self._inflight[number] = task
+            task.add_done_callback(lambda _: self._inflight.pop(number, None))
+        # Shielded: a cancelled caller must not cancel the request of the others
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if task.cancelled() and not _current_task_cancelling():
+                # Request cancelled by Cancel(), not the caller
+                return None
+            raise
+
+    async def GetCached(self, number):
+        """Get the last cached snapshot of a county, without any request.
 
-    async def Get(self, number):
-        """Get data by station number."""
+        The snapshot is flagged stale, None when the county is not cached.
+        """
+        cached = await self._cache.async_get(number)
+        if cached is None:
+            return None
         try:
-            request = await self._session.get(
-                BASE_URL.format(number), timeout=CLIENT_TIMEOUT
+            return PollensSnapshot.from_json(
+                number,
+                cached["data"],
+                datetime.fromtimestamp(cached["fetched_at"], timezone.utc),
+                stale=True,
             )
-            if "application/json" in request.headers["content-type"]:
-                request_json = await request.json()
-            else:
-                request_json = await request.text()
-                request_json = json.loads(request_json)
-
-            self._county_name = request_json["countyName"]
-            for risk in request_json["risks"]:
-                self._risks[risk["pollenName"]] = risk["level"]
-            self._risk_level = request_json["riskLevel"]
-            return request_json
-        except (ClientError, asyncio.TimeoutError, ConnectionRefusedError) as err:
+        except InvalidPayload:
             return None
 
-    @property
-    def county_name(self):
-        return self._county_name
+    def Cancel(self, number=None):
+        """Cancel the request in progress for a county, or all of them."""
+        numbers = list(self._inflight) if number is None else [number]
+        for task in [self._inflight.get(n) for n in numbers]:
+            if task is not None:
+                task.cancel()
 
-    @property
-    def risks(self):
-        return self._risks
+    async def _fetch(self, number):
+        """Request one county from pollens.fr, with retries.
+
+        Failed attempts are retried with an exponential backoff and full
+        jitter. Failures are counted by a per host circuit breaker, no request
+        is sent while it is open.
+        """
+        url = self.provider.url(number)
+        breaker = self._breakers.setdefault(URL(url).host, CircuitBreaker())
+        metrics = self.metrics[number] = {"source": None, "retries": 0}
+        for attempt in range(self._retries + 1):
+            if not breaker.allow():
+                self.counters["rejected"] += 1
+                metrics["source"] = "rejected"
+                return None
+            if attempt:
+                self.counters["retries"] += 1
+                metrics["retries"] = attempt
+            self.counters["requests"] += 1
+            try:
+                async with self.limiter as waited:
+                    metrics["queue_ms"] = round(
+                        metrics.get("queue_ms", 0) + waited * 1000, 3
+                    )
+                    snapshot = await self._request(number, metrics)
+            except InvalidPayload as err:
+                # The same payload would be received again, no retry
+                self.counters["invalid"] += 1
+                metrics["source"] = "invalid"
+                metrics["error"] = str(err)
+                breaker.record_success()
+                return None
+            except RETRY_EXCEPTIONS as err:
+                if isinstance(err, ClientResponseError) and (
+                    err.status < 500 and err.status != 429
+                ):
+                    # Unknown county or bad request, a retry would not help
+                    breaker.record_success()
+                    return None
+                if breaker.record_failure():
+                    self.counters["breaker_trips"] += 1
+                delay = _backoff(attempt)
+                if isinstance(err, ClientResponseError) and (
+                    retry_after := _retry_after(err)
+                ) is not None:
+                    # Throttled: no client sends anything before Retry-After
+                    metrics["retry_after"] = retry_after
+                    self.limiter.defer(retry_after)
+                    delay = max(delay, min(retry_after, RETRY_AFTER_MAX))
+                if attempt == self._retries:
+                    return None
+                await asyncio.sleep(delay)
+            else:
+                breaker.record_success()
+                return snapshot
+
+    async def _request(self, number, metrics):
+        """Send one request for a county.
+
+        The validators of the cached response are sent, so an unchanged
+        bulletin is answered with a 304 and neither downloaded nor parsed.
+        Timings (ms) are written in metrics by the provider, with the
+        payload size and parse time.
+        """
+        cached = await self._cache.async_get(number)
+        headers = {}
+        if cached is not None:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+        response = await self.provider.async_fetch(number, headers, metrics)
+        if response.status == 304 and cached is not None:
+            return await self._not_modified(number, cached, metrics)
+        body = response.body
+        metrics["bytes"] = len(body)
+
+        # The content-type is not always application/json, parse the bytes
+        start = time.perf_counter()
+        if len(body) >= PARSE_EXECUTOR_MIN_BYTES:
+            snapshot, request_json = await asyncio.get_running_loop().run_in_executor(
+                None, parse_bulletin, number, body
+            )
+            metrics["parse_executor"] = True
+        else:
+            snapshot, request_json = parse_bulletin(number, body)
+        metrics["parse_ms"] = _elapsed_ms(start)
+        metrics["source"] = "network"
+        self._results[number] = (time.monotonic(), snapshot)
+        await self._cache.async_set(
+            number,
+            {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "data": request_json,
+                "fetched_at": snapshot.updated.timestamp(),
+            },
+        )
+        return snapshot
+
+    async def _not_modified(self, number, cached, metrics):
+        """Return the cached bulletin of a county, answered with a 304."""
+        self.counters["not_modified"] += 1
+        metrics["source"] = "not_modified"
+        now = datetime.now(timezone.utc)
+        if number in self._results:
+            snapshot = replace(self._results[number][1], updated=now)
+        else:
+            snapshot = PollensSnapshot.from_json(number, cached["data"], now)
+        self._results[number] = (time.monotonic(), snapshot)
+        await self._cache.async_set(number, {**cached, "fetched_at": now.timestamp()})
+        return snapshot
 
-    @property
-    def risk_level(self):
-        return self._risk_level
 
     # async def _get(self, path, **kwargs):
     #     with async_timeout.timeout(self._timeout):
@@ -0,0 +1,175 @@
+"""Record the responses of a provider to a file, and replay them.
+
+RecordingProvider wraps the provider of a PollensClient (HttpProvider for
+pollens.fr) and appends every response, or failure, with its latency to
+a file. ReplayProvider serves a recording back, in real time or faster,
+to reproduce the load or an incident without requesting pollens.fr.
+"""
+from __future__ import annotations
+
+import asyncio
+import base64
+from bisect import bisect_right
+import json
+from pathlib import Path
+import time
+
+import aiohttp
+from aiohttp.client import ClientResponseError
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+try:
+    from .pollensasync import RETRY_EXCEPTIONS, PollensProvider, ProviderResponse
+except ImportError:  # used as a standalone module
+    from pollensasync import RETRY_EXCEPTIONS, PollensProvider, ProviderResponse
+
+
+def _error(url, status, headers, message=""):
+    """Return the ClientResponseError of an error status."""
+    headers = CIMultiDict(headers)
+    request_info = aiohttp.RequestInfo(
+        URL(url), "GET", CIMultiDictProxy(CIMultiDict()), URL(url)
+    )
+    return ClientResponseError(
+        request_info, (), status=status, message=message, headers=headers
+    )
+
+
+class RecordingProvider(PollensProvider):
+    """Provider appending the responses of another one to a file.
+
+    One JSON object per request and line: t (seconds since the first
+    request of the recording), county, elapsed_ms, then status, headers and
+    body (body_b64 when it is not UTF-8), or error ("timeout" or
+    "connection") when there was no response.
+    """
+
+    def __init__(self, provider: PollensProvider, path):
+        self._provider = provider
+        self.path = Path(path)
+        self._file = None
+        self._start = None
+
+    def url(self, number):
+        return self._provider.url(number)
+
+    def pool_stats(self):
+        return self._provider.pool_stats()
+
+    async def async_fetch(self, number, headers, metrics):
+        start = time.monotonic()
+        if self._start is None:
+            self._start = start
+        record = {"t": round(start - self._start, 3), "county": number}
+        try:
+            response = await self._provider.async_fetch(number, headers, metrics)
+        except ClientResponseError as err:
+            record.update(status=err.status, headers=dict(err.headers or {}))
+            self._write(record, start)
+            raise
+        except RETRY_EXCEPTIONS as err:
+            if isinstance(err, asyncio.TimeoutError):
+                record["error"] = "timeout"
+            else:
+                record.update(error="connection", message=str(err))
+            self._write(record, start)
+            raise
+        record.update(status=response.status, headers=dict(response.headers))
+        try:
+            record["body"] = response.body.decode("utf-8")
+        except UnicodeDecodeError:
+            record["body_b64"] = base64.b64encode(response.body).decode("ascii")
+        self._write(record, start)
+        return response
+
+    def _write(self, record, start):
+        # Small appends of a capture session, flushed so a crash loses nothing
+        record["elapsed_ms"] = round((time.monotonic() - start) * 1000, 3)
+        if self._file is None:
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    async def close(self):
+        """Close the recording and the wrapped provider."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        await self._provider.close()
+
+
+class ReplayProvider(PollensProvider):
+    """Provider serving the responses saved by RecordingProvider.
+
+    speed: with 1, a request gets the response recorded for its county at
+    the same time of the recording (the first one before it), after the
+    recorded latency; with 10, the recording is replayed ten times faster.
+    With 0, the responses of each county are served in order (the last one
+    again and again) without any delay.
+    A recorded 304 is replaced by the last 200 of the county before it when
+    the client has nothing cached. Counties not recorded get a 404.
+    """
+
+    def __init__(self, path, speed=1.0):
+        self._speed = speed
+        # county -> records in the order of the recording
+        self._records: dict[str, list[dict]] = {}
+        with open(path, encoding="utf-8") as recording:
+            for line in recording:
+                if line.strip():
+                    record = json.loads(line)
+                    self._records.setdefault(record["county"], []).append(record)
+        self._start = None
+        # county -> next record (speed 0)
+        self._next = {}
+        self.counters = {"served": 0, "not_recorded": 0}
+
+    @property
+    def counties(self):
+        """Counties of the recording."""
+        return list(self._records)
+
+    def pool_stats(self):
+        return dict(self.counters)
+
+    def _record(self, number, headers):
+        records = self._records[number]
+        if self._speed:
+            now = (time.monotonic() - self._start) * self._speed
+            index = max(bisect_right(records, now, key=lambda r: r["t"]) - 1, 0)
+        else:
+            index = min(self._next.get(number, 0), len(records) - 1)
+            self._next[number] = index + 1
+        record = records[index]
+        if record.get("status") == 304 and not headers:
+            record = next(
+                (r for r in reversed(records[:index]) if r.get("status") == 200),
+                record,
+            )
+        return record
+
+    async def async_fetch(self, number, headers, metrics):
+        if number not in self._records:
+            self.counters["not_recorded"] += 1
+            raise _error(self.url(number), 404, {}, "Not recorded")
+        if self._start is None:
+            self._start = time.monotonic()
+        record = self._record(number, headers)
+        start = time.perf_counter()
+        if self._speed:
+            await asyncio.sleep(record["elapsed_ms"] / 1000 / self._speed)
+        metrics["ttfb_ms"] = round((time.perf_counter() - start) * 1000, 3)
+        metrics["replay_t"] = record["t"]
+        self.counters["served"] += 1
+        if record.get("error") == "timeout":
+            raise asyncio.TimeoutError
+        if "error" in record:
+            raise aiohttp.ClientConnectionError(record.get("message", ""))
+        if record["status"] >= 400:
+            raise _error(self.url(number), record["status"], record["headers"])
+        if "body_b64" in record:
+            body = base64.b64decode(record["body_b64"])
+        else:
+            body = record.get("body", "").encode("utf-8")
+        return ProviderResponse(record["status"], CIMultiDict(record["headers"]), body)
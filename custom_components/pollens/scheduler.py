@@ -0,0 +1,125 @@
+"""Publication aware polling schedule of the Pollens integration."""
+from __future__ import annotations
+
+from collections import Counter, deque
+from datetime import datetime, timedelta
+import random
+
+# RNSA bulletins are usually published on Friday, during the day
+DEFAULT_PUBLICATION_WEEKDAY = 4
+DEFAULT_PUBLICATION_START = 10
+DEFAULT_PUBLICATION_END = 20
+
+# Poll interval inside the publication window, until the bulletin changed
+DENSE_INTERVAL = timedelta(minutes=30)
+# Poll interval of a county whose last fetch failed, its last bulletin is
+# served stale until it is revalidated
+REVALIDATE_INTERVAL = timedelta(minutes=10)
+# Scan interval multiplier when every pollen is at level 0 (off-season)
+QUIET_FACTOR = 4
+MAX_INTERVAL = timedelta(hours=24)
+# Random delay added to each county, so they do not all poll at once
+JITTER = timedelta(minutes=5)
+
+# Number of detected publications used to learn the publication window
+LEARNED_PUBLICATIONS = 8
+MIN_LEARNED_PUBLICATIONS = 3
+
+
+class PollingScheduler:
+    """Compute when each county has to be polled next.
+
+    Counties are polled every ``interval`` outside of the publication window,
+    less often when they are quiet (off-season), and every DENSE_INTERVAL
+    inside the window until a new bulletin has been received. The window is
+    configured, then learned from the times new bulletins were detected.
+    """
+
+    def __init__(
+        self,
+        interval: timedelta,
+        weekday: int = DEFAULT_PUBLICATION_WEEKDAY,
+        start_hour: int = DEFAULT_PUBLICATION_START,
+        end_hour: int = DEFAULT_PUBLICATION_END,
+    ) -> None:
+        """Initialize"""
+        self.interval = interval
+        self._window = (weekday, start_hour, end_hour)
+        self._publications: deque[datetime] = deque(maxlen=LEARNED_PUBLICATIONS)
+        # county -> local time a new bulletin was last detected
+        self._last_change: dict[str, datetime] = {}
+
+    @property
+    def window(self) -> tuple[int, int, int]:
+        """Return the publication window: (weekday, start hour, end hour)."""
+        if len(self._publications) < MIN_LEARNED_PUBLICATIONS:
+            return self._window
+        weekday = Counter(p.weekday() for p in self._publications).most_common(1)[0][0]
+        hours = [p.hour for p in self._publications if p.weekday() == weekday]
+        return weekday, max(min(hours) - 1, 0), min(max(hours) + 2, 24)
+
+    @property
+    def publications(self) -> list[datetime]:
+        """Return the times of the publications used to learn the window."""
+        return list(self._publications)
+
+    def load_publications(self, publications: list[datetime]) -> None:
+        """Restore the publications learned before a restart."""
+        self._publications.clear()
+        self._publications.extend(sorted(publications))
+
+    def record(
+        self, county: str, now: datetime, changed: bool, learn: bool = True
+    ) -> bool:
+        """Record the result of a poll, changed when a new bulletin was received.
+
+        A bulletin is published for every county at once: only the first
+        change detected in a week is learned as a publication. learn is
+        False when the change may have been published long before the poll
+        (first poll after a restore or a failure). Return True when a
+        publication was learned.
+        """
+        if not changed:
+            return False
+        self._last_change[county] = now
+        if not learn:
+            return False
+        week = now.isocalendar()[:2]
+        if self._publications and self._publications[-1].isocalendar()[:2] == week:
+            return False
+        self._publications.append(now)
+        return True
+
+    def forget(self, county: str) -> None:
+        """Forget a county which is no longer polled."""
+        self._last_change.pop(county, None)
+
+    def next_poll(self, county: str, now: datetime, quiet: bool) -> datetime:
+        """Return when a county has to be polled next (now is local time)."""
+        start, end = self._window_bounds(now)
+        if start <= now < end:
+            published = self._last_change.get(county)
+            if quiet or (published is not None and published >= start):
+                delay = self.interval
+            else:
+                delay = DENSE_INTERVAL
+        else:
+            delay = min(self.interval * (QUIET_FACTOR if quiet else 1), MAX_INTERVAL)
+        next_poll = now + delay
+        if now < start < next_poll:
+            # Never skip the opening of the publication window
+            next_poll = start
+        return next_poll + random.uniform(0, 1) * JITTER
+
+    def _window_bounds(self, now: datetime) -> tuple[datetime, datetime]:
+        """Return the current publication window, or the next one."""
+        weekday, start_hour, end_hour = self.window
+        day = now.replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(
+            days=(now.weekday() - weekday) % 7
+        )
+        start = day + timedelta(hours=start_hour)
+        end = day + timedelta(hours=end_hour)
+        if now >= end:
+            start += timedelta(days=7)
+            end += timedelta(days=7)
+        return start, end
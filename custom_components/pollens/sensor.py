@@ -1,13 +1,19 @@
 ﻿"""Support for the RNSA pollens service."""
 
+from collections.abc import Mapping
 import logging
+from types import MappingProxyType
+from typing import Any
 from warnings import catch_warnings
 
 from yaml import KeyToken
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass, SensorStateClass
 
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import (
@@ -16,13 +22,26 @@ from .const import (
     ATTR_URL,
     ATTR_COUNTY_NAME,
     ATTR_POLLEN_NAME,
+    ATTR_STALE,
+    ATTR_DATA_AGE,
     ATTR_LITERAL_STATE,
     KEY_TO_ATTR,
+    POLLEN_INDEX,
     COORDINATOR,
-    CONF_POLLENSLIST,
     CONF_LITERAL,
+    CONF_COUNTRYCODE,
+    DIAGNOSTICS,
+    RISK_LEVEL,
+    AGGREGATES,
+    CATEGORIES,
+    CONF_THRESHOLD,
+    CONF_SELECTED_ONLY,
+    DEFAULT_THRESHOLD,
+    SIGNAL_POLLENS_CHANGED,
 )
-from . import PollensEntity, PollensUpdateCoordinator
+from .pollensasync import PollensSnapshot
+from .taxonomy import pollen_index, pollen_key
+from . import PollensEntity, PollensUpdateCoordinator, selected_pollens
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -33,32 +52,159 @@ ICONS = {
     3: "mdi:alert-decagram",
 }
 
+# Aggregates of PollensAggregates, besides the max of each category
+MAX = "max"
+ABOVE_THRESHOLD = "above_threshold"
+ATTR_POLLENS = "pollens"
+ATTR_THRESHOLD = "threshold"
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Setup Sensor Plateform"""
     coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
+    county = entry.data[CONF_COUNTRYCODE]
     sensors = []
-    try:
-        enabled_pollens = entry.data[CONF_POLLENSLIST]
-    except KeyError:
-        enabled_pollens = [pollen for pollen in KEY_TO_ATTR]
-    for risk in coordinator.api.risks:
-        name = risk
-        icon = KEY_TO_ATTR[risk.lower()][1]
-        sensors.append(PollenSensor(coordinator, name=name, icon=icon, entry=entry, enabled=name.lower() in enabled_pollens))
-
-    name = f"pollens_{coordinator.county}"
+    enabled_pollens = selected_pollens(entry)
+    # Only the selected pollens have an entity (no disabled entities)
+    selected_only = entry.options.get(CONF_SELECTED_ONLY, False)
+    # pollen key (KEY_TO_ATTR) -> its sensor
+    pollen_sensors: dict[str, PollenSensor] = {}
+    attributes = PollensAttributes(coordinator, county)
+
+    @callback
+    def _async_new_pollen_sensors() -> list[PollenSensor]:
+        """Create the sensors of the pollens of the county which have none yet."""
+        new_sensors = []
+        for risk in coordinator.data[county].pollens:
+            key = pollen_key(risk)
+            enabled = key in enabled_pollens
+            if key in pollen_sensors or (selected_only and not enabled):
+                continue
+            icon = KEY_TO_ATTR[key][1]
+            pollen_sensors[key] = PollenSensor(
+                coordinator, name=risk, icon=icon, entry=entry, enabled=enabled, attributes=attributes
+            )
+            new_sensors.append(pollen_sensors[key])
+        return new_sensors
+
+    sensors.extend(_async_new_pollen_sensors())
+
+    name = f"pollens_{county}"
     icon = ICONS[0]
     sensors.append(
-        RiskSensor(coordinator=coordinator, name=name, icon=icon, entry=entry, numeric=False)
+        RiskSensor(
+            coordinator=coordinator, name=name, icon=icon, entry=entry, numeric=False, attributes=attributes
+        )
     )
     sensors.append(
-        RiskSensor(coordinator=coordinator, name=name + "_risklevel", icon=icon, entry=entry, numeric=True)
+        RiskSensor(
+            coordinator=coordinator,
+            name=name + "_risklevel",
+            icon=icon,
+            entry=entry,
+            numeric=True,
+            attributes=attributes,
+        )
+    )
+    aggregates = PollensAggregates(
+        enabled_pollens, entry.options.get(CONF_THRESHOLD, DEFAULT_THRESHOLD)
+    )
+    sensors.append(AggregateSensor(coordinator, name + "_max", entry, aggregates, MAX))
+    for category in CATEGORIES.values():
+        sensors.append(
+            AggregateSensor(coordinator, f"{name}_{category}_max", entry, aggregates, category)
+        )
+    sensors.append(
+        AggregateSensor(coordinator, name + "_above_threshold", entry, aggregates, ABOVE_THRESHOLD)
+    )
+    sensors.append(FetchSensor(coordinator=coordinator, name=name + "_fetch", entry=entry))
+
+    async_add_entities(sensors)
+
+    @callback
+    def _async_add_new_pollens() -> None:
+        """Add the sensors of the pollens which appeared in the bulletin."""
+        if county in coordinator.data and (new_sensors := _async_new_pollen_sensors()):
+            _LOGGER.debug("New pollens for county %s: %s", county, new_sensors)
+            async_add_entities(new_sensors)
+
+    # Notified when the levels of the county changed
+    entry.async_on_unload(
+        coordinator.async_add_listener(_async_add_new_pollens, (county, AGGREGATES))
     )
 
-    async_add_entities(sensors, True)
+    @callback
+    def _async_pollens_changed(pollens: list[str]) -> None:
+        """Add / remove pollen sensors when the selected pollens changed."""
+        nonlocal enabled_pollens
+        enabled_pollens = pollens
+        aggregates.set_pollens(pollens)
+        registry = er.async_get(hass)
+        for key, sensor in list(pollen_sensors.items()):
+            if key not in pollens:
+                del pollen_sensors[key]
+                if sensor.registry_entry is not None:
+                    # Removed from hass with its registry entry
+                    registry.async_remove(sensor.entity_id)
+                elif sensor.hass is not None:
+                    hass.async_create_task(sensor.async_remove())
+        _async_add_new_pollens()
+        for sensor in sensors:
+            if isinstance(sensor, AggregateSensor) and sensor.hass is not None:
+                sensor.async_write_ha_state()
+
+    if selected_only:
+        entry.async_on_unload(
+            async_dispatcher_connect(
+                hass, SIGNAL_POLLENS_CHANGED.format(entry.entry_id), _async_pollens_changed
+            )
+        )
+
+
+class PollensAttributes:
+    """State attributes of the pollen and risk sensors of an entry.
+
+    Each dict is built once per snapshot (the coordinator replaces it, and
+    records the history summaries, on each update) and shared read-only: a
+    state write only reads it, the two risk sensors share the same one.
+    data_age is the age of the snapshot when the dict was built: a stale
+    snapshot is replaced after each failed fetch.
+    """
+
+    def __init__(self, coordinator: PollensUpdateCoordinator, county: str) -> None:
+        self._coordinator = coordinator
+        self._county = county
+        self._snapshot: PollensSnapshot | None = None
+        # (key, pollen name, literal) -> attributes
+        self._attributes: dict[tuple, Mapping[str, Any]] = {}
+
+    def get(
+        self, key: int | str, pollen_name: str | None = None, literal: bool = True
+    ) -> Mapping[str, Any]:
+        """Return the attributes of a pollen index (with its name) or RISK_LEVEL."""
+        snapshot = self._coordinator.data[self._county]
+        if snapshot is not self._snapshot:
+            self._attributes = {}
+            self._snapshot = snapshot
+        elif (attrs := self._attributes.get((key, pollen_name, literal))) is not None:
+            return attrs
+        attrs = {}
+        if key == RISK_LEVEL:
+            attrs[ATTR_URL] = "https://pollens.fr"
+            attrs[ATTR_COUNTY_NAME] = snapshot.county_name
+        else:
+            attrs[ATTR_POLLEN_NAME] = pollen_name
+        attrs[ATTR_STALE] = snapshot.stale
+        attrs[ATTR_DATA_AGE] = round(snapshot.age())
+        attrs.update(self._coordinator.history.summary(self._county, key))
+        if key != RISK_LEVEL and not literal:
+            value = snapshot.level(key)
+            if value is not None:
+                attrs[ATTR_LITERAL_STATE] = LIST_RISK[value]
+        attrs = self._attributes[(key, pollen_name, literal)] = MappingProxyType(attrs)
+        return attrs
 
 
 class PollenSensor(PollensEntity, SensorEntity):
@@ -70,11 +216,15 @@ class PollenSensor(PollensEntity, SensorEntity):
         name: str,
         icon: str,
         entry: ConfigEntry,
-        enabled: bool
+        enabled: bool,
+        attributes: PollensAttributes,
     ) -> None:
-        super().__init__(coordinator, name, icon, entry)
-        self._name = f"pollens_{coordinator.county}_{KEY_TO_ATTR[name.lower()][0]}"
-        self._state = coordinator.api.risks[name]
+        self._index = pollen_index(name)
+        self._attributes = attributes
+        super().__init__(coordinator, name, icon, entry, key=self._index)
+        # From the folded name: the entity id does not depend on the spelling
+        self._name = f"pollens_{self.county}_{KEY_TO_ATTR[pollen_key(name)][0]}"
+        self._state = self.snapshot.level(self._index)
         self._unique_id = f"{entry.entry_id}_{self._name}"
         self._attr_name = name
         self._attr_unique_id = self._unique_id
@@ -85,7 +235,10 @@ class PollenSensor(PollensEntity, SensorEntity):
             # Setup DeviceClass in AQI and stateClass in numeric (Issue #15)
             if not self._literal_state:
                 self._attr_device_class = SensorDeviceClass.AQI
-                self._attr_state_class = SensorStateClass.MEASUREMENT
+                # Long-term statistics are imported by the coordinator when
+                # the recorder runs (pollens:<county>_<pollen>)
+                if coordinator.statistics is None:
+                    self._attr_state_class = SensorStateClass.MEASUREMENT
 
         except KeyError:
             self._literal_state = True
@@ -98,7 +251,9 @@ class PollenSensor(PollensEntity, SensorEntity):
 
     @property
     def native_value(self):
-        value = self.coordinator.api.risks[self._attr_name]
+        value = self.snapshot.level(self._index)
+        if value is None:
+            return None
         if self._literal_state:
             return LIST_RISK[value]
         else:
@@ -112,13 +267,7 @@ class PollenSensor(PollensEntity, SensorEntity):
     @property
     def extra_state_attributes(self):
         """Return the state attributes of the last update."""
-        attrs = {}
-        attrs[ATTR_POLLEN_NAME] = self._friendly_name
-        if self.coordinator.api.risks is not None:
-            if not self._literal_state:
-                value = self.coordinator.api.risks[self._attr_name]
-                attrs[ATTR_LITERAL_STATE] = LIST_RISK[value]
-        return attrs
+        return self._attributes.get(self._index, self._friendly_name, self._literal_state)
 
 
 class RiskSensor(PollensEntity, SensorEntity):
@@ -130,11 +279,12 @@ class RiskSensor(PollensEntity, SensorEntity):
         name: str,
         icon: str,
         entry: ConfigEntry,
-        numeric: bool
+        numeric: bool,
+        attributes: PollensAttributes,
     ) -> None:
         super().__init__(coordinator, name, icon, entry)
-        self._risk_level = coordinator.api.risk_level
-        self._attr_unique_id = f"{entry.entry_id}_{coordinator.county}"
+        self._attributes = attributes
+        self._attr_unique_id = f"{entry.entry_id}_{self.county}"
         self._attr_icon = icon
         self._name = name
         self._numeric = numeric
@@ -145,7 +295,7 @@ class RiskSensor(PollensEntity, SensorEntity):
 
     @property
     def native_value(self):
-        value = self.coordinator.api.risk_level
+        value = self.snapshot.risk_level
         if self._numeric:
             return value
         else:
@@ -153,7 +303,7 @@ class RiskSensor(PollensEntity, SensorEntity):
 
     @property
     def icon(self):
-        return ICONS[self._risk_level]
+        return ICONS[self.snapshot.risk_level]
 
     @property
     def name(self):
@@ -161,7 +311,163 @@ class RiskSensor(PollensEntity, SensorEntity):
 
     @property
     def extra_state_attributes(self):
-        attrs = {}
-        attrs[ATTR_URL] = "https://pollens.fr"
-        attrs[ATTR_COUNTY_NAME] = self.coordinator.api.county_name
+        return self._attributes.get(RISK_LEVEL)
+
+
+class PollensAggregates:
+    """Aggregates of the selected pollens of an entry.
+
+    They are computed once per snapshot (the coordinator replaces it on each
+    update) and shared by the aggregate sensors of the entry: for MAX and
+    each category the highest level and the pollens at that level, for
+    ABOVE_THRESHOLD the pollens at or above the threshold.
+    """
+
+    def __init__(self, pollens: list[str], threshold: int) -> None:
+        self.threshold = threshold
+        self.set_pollens(pollens)
+
+    def set_pollens(self, pollens: list[str]) -> None:
+        """Change the selected pollens."""
+        # (pollen index, category) of the selected pollens
+        self._pollens = [
+            (POLLEN_INDEX[pollen], CATEGORIES.get(KEY_TO_ATTR[pollen][1]))
+            for pollen in pollens
+            if pollen in POLLEN_INDEX
+        ]
+        self._snapshot: PollensSnapshot | None = None
+        self._values: dict[str, tuple[int | None, list[str]]] = {}
+        self._attributes: dict[str, Mapping[str, Any]] = {}
+
+    def get(self, snapshot: PollensSnapshot, kind: str) -> tuple[int | None, list[str]]:
+        """Return the value of an aggregate and the pollens it is made of."""
+        if snapshot is not self._snapshot:
+            self._values = self._compute(snapshot)
+            self._attributes = {}
+            self._snapshot = snapshot
+        return self._values.get(kind, (None, []))
+
+    def attributes(self, snapshot: PollensSnapshot, kind: str) -> Mapping[str, Any]:
+        """Return the state attributes of an aggregate, built once per snapshot."""
+        value, pollens = self.get(snapshot, kind)
+        if (attrs := self._attributes.get(kind)) is None:
+            attrs = {}
+            attrs[ATTR_POLLENS] = pollens
+            attrs[ATTR_STALE] = snapshot.stale
+            attrs[ATTR_DATA_AGE] = round(snapshot.age())
+            if kind == ABOVE_THRESHOLD:
+                attrs[ATTR_THRESHOLD] = self.threshold
+            elif value is not None:
+                attrs[ATTR_LITERAL_STATE] = LIST_RISK[value]
+            attrs = self._attributes[kind] = MappingProxyType(attrs)
+        return attrs
+
+    def _compute(self, snapshot: PollensSnapshot) -> dict[str, tuple[int | None, list[str]]]:
+        names = {pollen_index(name): name for name in snapshot.pollens}
+        levels: dict[str, list[tuple[int, str]]] = {}
+        for index, category in self._pollens:
+            level = snapshot.level(index)
+            if level is None:
+                continue
+            levels.setdefault(MAX, []).append((level, names[index]))
+            if category is not None:
+                levels.setdefault(category, []).append((level, names[index]))
+        values = {}
+        for kind, reported in levels.items():
+            highest = max(level for level, _ in reported)
+            values[kind] = (highest, [name for level, name in reported if level == highest])
+        above = [name for level, name in levels.get(MAX, []) if level >= self.threshold]
+        values[ABOVE_THRESHOLD] = (len(above), above)
+        return values
+
+
+class AggregateSensor(PollensEntity, SensorEntity):
+    """Aggregate of the selected pollens: max, max of a category or count above threshold."""
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(
+        self,
+        coordinator: PollensUpdateCoordinator,
+        name: str,
+        entry: ConfigEntry,
+        aggregates: PollensAggregates,
+        kind: str,
+    ) -> None:
+        super().__init__(coordinator, name, None, entry, key=AGGREGATES)
+        self._attr_unique_id = f"{entry.entry_id}_{self.county}_{kind}"
+        self._name = name
+        self._aggregates = aggregates
+        self._kind = kind
+        if kind == ABOVE_THRESHOLD:
+            self._attr_icon = "mdi:counter"
+        else:
+            self._attr_device_class = SensorDeviceClass.AQI
+            self._attr_icon = ICONS[0]
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def native_value(self):
+        return self._aggregates.get(self.snapshot, self._kind)[0]
+
+    @property
+    def icon(self):
+        value = self.native_value
+        if self._kind == ABOVE_THRESHOLD or value is None:
+            return self._attr_icon
+        return ICONS[min(value, len(ICONS) - 1)]
+
+    @property
+    def extra_state_attributes(self):
+        return self._aggregates.attributes(self.snapshot, self._kind)
+
+
+class FetchSensor(PollensEntity, SensorEntity):
+    """Diagnostic sensor: duration of the last fetch of the county.
+
+    Attributes hold the metrics of that fetch (connection, time to first
+    byte, body, parse, payload size, source, retries, state writes), and
+    the fetches of the county answered from memory in its fetch history.
+    """
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_icon = "mdi:timer-outline"
+
+    def __init__(
+        self,
+        coordinator: PollensUpdateCoordinator,
+        name: str,
+        entry: ConfigEntry,
+    ) -> None:
+        super().__init__(coordinator, name, None, entry, key=DIAGNOSTICS)
+        self._attr_unique_id = f"{entry.entry_id}_{self.county}_fetch"
+        self._name = name
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def available(self) -> bool:
+        return self.county in self.coordinator.fetch_history
+
+    @property
+    def native_value(self):
+        return self.coordinator.fetch_history[self.county][-1]["duration_ms"]
+
+    @property
+    def extra_state_attributes(self):
+        history = self.coordinator.fetch_history[self.county]
+        attrs = dict(history[-1])
+        attrs["last_success"] = self.coordinator.last_success.get(self.county)
+        attrs["last_failure"] = self.coordinator.last_failure.get(self.county)
+        # Of the county (the client counters are shared by all counties)
+        attrs["cache_hits"] = sum(1 for fetch in history if fetch.get("source") == "memory")
         return attrs
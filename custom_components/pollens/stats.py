@@ -0,0 +1,118 @@
+"""Long-term statistics of the pollen levels, imported from the bulletins."""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    get_last_statistics,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, KEY_TO_ATTR
+from .pollensasync import PollensSnapshot
+from .taxonomy import pollen_index, pollen_key
+
+HOUR = timedelta(hours=1)
+# Longest period backfilled after a downtime
+BACKFILL_MAX = timedelta(days=7)
+
+
+def statistic_id(county: str, pollen: str) -> str:
+    """Return the id of the external statistic of a pollen in a county."""
+    return f"{DOMAIN}:{county.lower()}_{KEY_TO_ATTR[pollen_key(pollen)][0]}"
+
+
+def _floor_hour(value: datetime) -> datetime:
+    return value.replace(minute=0, second=0, microsecond=0)
+
+
+class PollensStatistics:
+    """Import the hourly level of every pollen as external statistics.
+
+    Each hour gets the level of the bulletin in force during that hour; the
+    hours elapsed since the last imported one are added in a single batch per
+    pollen, so the hours missed during a downtime are backfilled (up to
+    BACKFILL_MAX) from the bulletin restored from the response cache.
+    Daily and monthly statistics are compiled by the recorder.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize"""
+        self.hass = hass
+        # statistic id -> start of its last imported hour, None if never imported
+        self._last: dict[str, datetime | None] = {}
+        # statistic id -> first hour to import when it was never imported
+        self._first: dict[str, datetime] = {}
+        self._lock = asyncio.Lock()
+
+    async def _async_last_start(self, stat_id: str) -> datetime | None:
+        """Return the start of the last hour imported for a statistic."""
+        if stat_id not in self._last:
+            last = await get_instance(self.hass).async_add_executor_job(
+                get_last_statistics, self.hass, 1, stat_id, False, set()
+            )
+            rows = last.get(stat_id)
+            self._last[stat_id] = (
+                dt_util.utc_from_timestamp(rows[0]["start"]) if rows else None
+            )
+        return self._last[stat_id]
+
+    async def async_import(
+        self, snapshot: PollensSnapshot, previous: PollensSnapshot | None = None
+    ) -> None:
+        """Import the hours elapsed since the last import of the county.
+
+        previous: snapshot replaced by this one, in force before it was fetched.
+        """
+        async with self._lock:
+            until = _floor_hour(dt_util.utcnow())
+            fetched = _floor_hour(snapshot.updated)
+            for pollen in snapshot.pollens:
+                stat_id = statistic_id(snapshot.county, pollen)
+                index = pollen_index(pollen)
+                last = await self._async_last_start(stat_id)
+                if last is None:
+                    # The hour of each fetch is only complete at the next one:
+                    # start from the first bulletin seen for the pollen
+                    start = self._first.setdefault(
+                        stat_id,
+                        fetched if previous is None else _floor_hour(previous.updated),
+                    )
+                else:
+                    start = last + HOUR
+                hour = max(start, until - BACKFILL_MAX)
+                statistics = []
+                while hour < until:
+                    source = snapshot
+                    if previous is not None and hour < fetched:
+                        source = previous
+                    if (level := source.level(index)) is not None:
+                        statistics.append(
+                            StatisticData(start=hour, mean=level, min=level, max=level)
+                        )
+                    hour += HOUR
+                if not statistics:
+                    continue
+                metadata = StatisticMetaData(
+                    has_mean=True,
+                    has_sum=False,
+                    name=f"Pollens {snapshot.county_name} {pollen}",
+                    source=DOMAIN,
+                    statistic_id=stat_id,
+                    unit_of_measurement=None,
+                )
+                async_add_external_statistics(self.hass, metadata, statistics)
+                self._last[stat_id] = statistics[-1]["start"]
+
+    def forget(self, county: str) -> None:
+        """Drop the import state of a removed county."""
+        prefix = f"{DOMAIN}:{county.lower()}_"
+        for stat_id in [s for s in self._last if s.startswith(prefix)]:
+            del self._last[stat_id]
+        for stat_id in [s for s in self._first if s.startswith(prefix)]:
+            del self._first[stat_id]
@@ -0,0 +1,66 @@
+"""Pollen names of the bulletins, normalized to the pollens of KEY_TO_ATTR."""
+from __future__ import annotations
+
+import logging
+import re
+import threading
+import unicodedata
+
+try:
+    from .const import ICON_FLOWER, KEY_TO_ATTR, POLLEN_INDEX
+except ImportError:  # used as a standalone module
+    from const import ICON_FLOWER, KEY_TO_ATTR, POLLEN_INDEX
+
+_LOGGER = logging.getLogger(__name__)
+
+# Pollens known before any bulletin, the others get their index in the order
+# they are first reported (it may change between restarts)
+BUILTIN_POLLENS = len(POLLEN_INDEX)
+
+
+def fold(name: str) -> str:
+    """Return a pollen name without accents, case nor separators ("cupressacees")."""
+    decomposed = unicodedata.normalize("NFKD", name)
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return re.sub(r"[^a-z0-9]+", "_", stripped.casefold()).strip("_")
+
+
+# Folded name -> key of KEY_TO_ATTR
+POLLEN_IDS = {fold(key): key for key in KEY_TO_ATTR}
+# Name as reported -> key of KEY_TO_ATTR, the names already seen
+_KEYS: dict[str, str] = {key: key for key in KEY_TO_ATTR}
+_lock = threading.Lock()
+
+
+def pollen_key(name: str, register: bool = True) -> str | None:
+    """Return the key of KEY_TO_ATTR of a pollen name as reported by pollens.fr.
+
+    Accent, case and separator variants of a pollen give the same key. An
+    unknown pollen is registered in KEY_TO_ATTR and POLLEN_INDEX (unless
+    register is False: None), with its folded name as attribute, so its
+    entity id does not depend on the spelling, ICON_FLOWER and no category.
+    """
+    if (key := _KEYS.get(name)) is not None:
+        return key
+    folded = fold(name)
+    if not folded:
+        return None
+    if (key := POLLEN_IDS.get(folded)) is None:
+        if not register:
+            return None
+        # Bulletins may be parsed in the executor
+        with _lock:
+            if (key := POLLEN_IDS.get(folded)) is None:
+                key = name.strip().lower()
+                KEY_TO_ATTR[key] = [folded, ICON_FLOWER]
+                POLLEN_INDEX[key] = len(POLLEN_INDEX)
+                POLLEN_IDS[folded] = key
+                _LOGGER.info("New pollen %s registered as %s", name, folded)
+    _KEYS[name] = key
+    return key
+
+
+def pollen_index(name: str, register: bool = True) -> int | None:
+    """Return the position of a pollen name in the levels of a snapshot."""
+    key = pollen_key(name, register)
+    return None if key is None else POLLEN_INDEX[key]
@@ -0,0 +1,51 @@
+"""Conditional requests of PollensClient against the local stand-in of pollens.fr."""
+from __future__ import annotations
+
+import asyncio
+
+from benchmarks.server import StandInServer, load_payloads
+from custom_components.pollens import pollensasync
+from custom_components.pollens.pollensasync import PollensClient, RateLimiter
+
+COUNTY = "60"
+
+
+async def _fetch_twice(monkeypatch, drop_etag: bool = False):
+    """Fetch COUNTY twice, return (server, client counters, metrics, snapshots)."""
+    server = StandInServer(load_payloads())
+    monkeypatch.setattr(pollensasync, "BASE_URL", await server.start())
+    try:
+        async with PollensClient(
+            freshness=0, retries=0, limiter=RateLimiter(None)
+        ) as client:
+            first = await client.Get(COUNTY)
+            if drop_etag:
+                # Only Last-Modified left: If-Modified-Since is sent alone
+                entry = await client._cache.async_get(COUNTY)  # pylint: disable=protected-access
+                entry["etag"] = None
+            second = await client.Get(COUNTY)
+            return server, dict(client.counters), dict(client.metrics[COUNTY]), (first, second)
+    finally:
+        await server.stop()
+
+
+def test_if_none_match_reuses_cached_snapshot(monkeypatch):
+    server, counters, metrics, (first, second) = asyncio.run(_fetch_twice(monkeypatch))
+    assert server.counters == {"requests": 2, "not_modified": 1, "failures": 0}
+    assert counters["not_modified"] == 1
+    assert metrics["source"] == "not_modified"
+    # Neither the body nor the JSON are read again
+    assert "body_ms" not in metrics and "parse_ms" not in metrics
+    assert second.levels == first.levels
+    assert second.county_name == first.county_name
+    assert second.updated >= first.updated
+
+
+def test_if_modified_since_reuses_cached_snapshot(monkeypatch):
+    server, counters, metrics, (first, second) = asyncio.run(
+        _fetch_twice(monkeypatch, drop_etag=True)
+    )
+    assert server.counters["not_modified"] == 1
+    assert counters["not_modified"] == 1
+    assert metrics["source"] == "not_modified"
+    assert second.levels == first.levels
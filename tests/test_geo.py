@@ -0,0 +1,156 @@
+"""Department of a location, from the bundled points and outlines."""
+from __future__ import annotations
+
+import pytest
+
+from custom_components.pollens.dept import DEPARTMENTS
+from custom_components.pollens.geo import find_department
+
+# Town hall (latitude, longitude) of the prefecture of each department
+PREFECTURES = {
+    "01": (46.2052, 5.2255),  # Bourg-en-Bresse
+    "02": (49.5641, 3.6199),  # Laon
+    "03": (46.5660, 3.3326),  # Moulins
+    "04": (44.0925, 6.2356),  # Digne-les-Bains
+    "05": (44.5594, 6.0786),  # Gap
+    "06": (43.6961, 7.2719),  # Nice
+    "07": (44.7353, 4.5992),  # Privas
+    "08": (49.7621, 4.7263),  # Charleville-Mézières
+    "09": (42.9653, 1.6069),  # Foix
+    "10": (48.2973, 4.0744),  # Troyes
+    "11": (43.2130, 2.3491),  # Carcassonne
+    "12": (44.3506, 2.5750),  # Rodez
+    "13": (43.2965, 5.3698),  # Marseille
+    "14": (49.1829, -0.3707),  # Caen
+    "15": (44.9264, 2.4444),  # Aurillac
+    "16": (45.6484, 0.1562),  # Angoulême
+    "17": (46.1591, -1.1520),  # La Rochelle
+    "18": (47.0810, 2.3988),  # Bourges
+    "19": (45.2675, 1.7707),  # Tulle
+    "20": (41.9192, 8.7386),  # Ajaccio
+    "21": (47.3220, 5.0415),  # Dijon
+    "22": (48.5141, -2.7603),  # Saint-Brieuc
+    "23": (46.1711, 1.8717),  # Guéret
+    "24": (45.1846, 0.7214),  # Périgueux
+    "25": (47.2378, 6.0241),  # Besançon
+    "26": (44.9334, 4.8924),  # Valence
+    "27": (49.0241, 1.1508),  # Évreux
+    "28": (48.4469, 1.4892),  # Chartres
+    "29": (47.9960, -4.1024),  # Quimper
+    "30": (43.8367, 4.3601),  # Nîmes
+    "31": (43.6045, 1.4440),  # Toulouse
+    "32": (43.6465, 0.5855),  # Auch
+    "33": (44.8378, -0.5792),  # Bordeaux
+    "34": (43.6119, 3.8772),  # Montpellier
+    "35": (48.1173, -1.6778),  # Rennes
+    "36": (46.8103, 1.6913),  # Châteauroux
+    "37": (47.3941, 0.6848),  # Tours
+    "38": (45.1885, 5.7245),  # Grenoble
+    "39": (46.6745, 5.5547),  # Lons-le-Saunier
+    "40": (43.8902, -0.4999),  # Mont-de-Marsan
+    "41": (47.5861, 1.3359),  # Blois
+    "42": (45.4397, 4.3872),  # Saint-Étienne
+    "43": (45.0434, 3.8858),  # Le Puy-en-Velay
+    "44": (47.2184, -1.5536),  # Nantes
+    "45": (47.9030, 1.9093),  # Orléans
+    "46": (44.4475, 1.4419),  # Cahors
+    "47": (44.2033, 0.6163),  # Agen
+    "48": (44.5181, 3.5007),  # Mende
+    "49": (47.4784, -0.5632),  # Angers
+    "50": (49.1157, -1.0908),  # Saint-Lô
+    "51": (48.9566, 4.3631),  # Châlons-en-Champagne
+    "52": (48.1113, 5.1392),  # Chaumont
+    "53": (48.0707, -0.7734),  # Laval
+    "54": (48.6921, 6.1844),  # Nancy
+    "55": (48.7727, 5.1600),  # Bar-le-Duc
+    "56": (47.6582, -2.7608),  # Vannes
+    "57": (49.1193, 6.1757),  # Metz
+    "58": (46.9908, 3.1590),  # Nevers
+    "59": (50.6292, 3.0573),  # Lille
+    "60": (49.4295, 2.0807),  # Beauvais
+    "61": (48.4329, 0.0913),  # Alençon
+    "62": (50.2910, 2.7775),  # Arras
+    "63": (45.7772, 3.0870),  # Clermont-Ferrand
+    "64": (43.2951, -0.3708),  # Pau
+    "65": (43.2328, 0.0781),  # Tarbes
+    "66": (42.6887, 2.8948),  # Perpignan
+    "67": (48.5734, 7.7521),  # Strasbourg
+    "68": (48.0794, 7.3585),  # Colmar
+    "69": (45.7640, 4.8357),  # Lyon
+    "70": (47.6226, 6.1557),  # Vesoul
+    "71": (46.3069, 4.8287),  # Mâcon
+    "72": (48.0061, 0.1996),  # Le Mans
+    "73": (45.5646, 5.9178),  # Chambéry
+    "74": (45.8992, 6.1294),  # Annecy
+    "75": (48.8566, 2.3522),  # Paris
+    "76": (49.4431, 1.0993),  # Rouen
+    "77": (48.5393, 2.6610),  # Melun
+    "78": (48.8049, 2.1204),  # Versailles
+    "79": (46.3237, -0.4588),  # Niort
+    "80": (49.8941, 2.2958),  # Amiens
+    "81": (43.9289, 2.1464),  # Albi
+    "82": (44.0176, 1.3550),  # Montauban
+    "83": (43.1242, 5.9280),  # Toulon
+    "84": (43.9493, 4.8055),  # Avignon
+    "85": (46.6705, -1.4260),  # La Roche-sur-Yon
+    "86": (46.5802, 0.3404),  # Poitiers
+    "87": (45.8336, 1.2611),  # Limoges
+    "88": (48.1724, 6.4496),  # Épinal
+    "89": (47.7982, 3.5673),  # Auxerre
+    "90": (47.6397, 6.8638),  # Belfort
+    "91": (48.6293, 2.4410),  # Évry
+    "92": (48.8924, 2.2070),  # Nanterre
+    "93": (48.9106, 2.4397),  # Bobigny
+    "94": (48.7904, 2.4556),  # Créteil
+    "95": (49.0364, 2.0761),  # Cergy
+    "971": (16.2650, -61.5510),  # Basse-Terre
+    "972": (14.6161, -61.0588),  # Fort-de-France
+    "973": (4.9224, -52.3135),  # Cayenne
+    "974": (-20.8823, 55.4504),  # Saint-Denis
+    "976": (-12.7806, 45.2279),  # Mamoudzou
+}
+
+
+@pytest.mark.parametrize("code", sorted(DEPARTMENTS))
+def test_prefecture(code):
+    assert find_department(*PREFECTURES[code])[0] == code
+
+
+@pytest.mark.parametrize(
+    ("latitude", "longitude", "code"),
+    [
+        (49.4944, 0.1079, "76"),  # Le Havre, closer to the centre of Calvados
+        (48.6331, 2.4412, "91"),  # Évry-Courcouronnes
+        (48.9362, 2.3574, "93"),  # Saint-Denis, next to Paris
+        (45.5253, 4.8743, "38"),  # Vienne, across the Rhône from Rhône
+        (46.3333, 6.0583, "01"),  # Gex, closer to Annecy than to Bourg-en-Bresse
+        (42.6976, 9.4509, "20"),  # Bastia
+        (50.9513, 1.8587, "62"),  # Calais
+        (5.4985, -54.0325, "973"),  # Saint-Laurent-du-Maroni
+    ],
+)
+def test_town(latitude, longitude, code):
+    assert find_department(latitude, longitude)[0] == code
+
+
+@pytest.mark.parametrize(
+    ("latitude", "longitude"),
+    [
+        (50.8503, 4.3517),  # Brussels
+        (50.6071, 3.3893),  # Tournai
+        (49.6116, 6.1319),  # Luxembourg
+        (49.2402, 6.9969),  # Saarbrücken
+        (48.0000, 7.8421),  # Freiburg
+        (47.5596, 7.5886),  # Basel
+        (46.2044, 6.1432),  # Geneva
+        (45.0703, 7.6869),  # Turin
+        (41.3874, 2.1686),  # Barcelona
+        (42.2673, 2.9616),  # Figueres
+        (49.2144, -2.1312),  # Jersey
+        (51.5072, -0.1276),  # London
+        (40.1209, 9.0129),  # Sardinia
+        (45.0, -20.0),  # Atlantic
+    ],
+)
+def test_abroad(latitude, longitude):
+    assert find_department(latitude, longitude) is None
@@ -0,0 +1,58 @@
+"""Import of the pollen levels as long-term statistics, the recorder stubbed out."""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from custom_components.pollens import stats
+from custom_components.pollens.pollensasync import PollensSnapshot
+from custom_components.pollens.stats import PollensStatistics
+
+START = datetime(2026, 4, 6, 8, 20, tzinfo=timezone.utc)
+
+
+class _Recorder:
+    """Recorder without any statistic imported yet."""
+
+    async def async_add_executor_job(self, target, *args):
+        return {}
+
+
+def _snapshot(level: int, updated: datetime) -> PollensSnapshot:
+    return PollensSnapshot.from_json(
+        "60",
+        {
+            "countyName": "Oise",
+            "riskLevel": level,
+            "risks": [{"pollenName": "Tilleul", "level": level}],
+        },
+        updated,
+    )
+
+
+def test_import_over_several_polls(monkeypatch):
+    imported = []
+    now = [START]
+    monkeypatch.setattr(stats, "get_instance", lambda hass: _Recorder())
+    monkeypatch.setattr(
+        stats,
+        "async_add_external_statistics",
+        lambda hass, metadata, statistics: imported.extend(statistics),
+    )
+    monkeypatch.setattr(stats.dt_util, "utcnow", lambda: now[0])
+
+    async def _poll():
+        statistics = PollensStatistics(None)
+        previous = None
+        # Every poll sets updated to now (new bulletin or 304), 3 hours apart
+        for poll, level in enumerate([1, 1, 2, 2]):
+            now[0] = START + timedelta(hours=3 * poll)
+            snapshot = _snapshot(level, now[0])
+            await statistics.async_import(snapshot, previous)
+            previous = snapshot
+
+    asyncio.run(_poll())
+    first = START.replace(minute=0)
+    assert [s["start"] for s in imported] == [first + timedelta(hours=h) for h in range(9)]
+    # Each hour has the level of the bulletin in force during that hour
+    assert [s["mean"] for s in imported] == [1, 1, 1, 1, 1, 1, 2, 2, 2]